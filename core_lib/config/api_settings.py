@@ -23,7 +23,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Any
 
-from .base_settings import BaseSettings, SettingsError, EnvParser, NullConfig
+from .base_settings import BaseSettings, SettingsError, EnvParser, NullConfig, _NULL_CONFIG, _memoize_as_dict
 from .cache_settings import CacheSettings
 from .tracing_settings import TracingSettings
 from .logger_settings import LoggerSettings
@@ -32,7 +32,11 @@ from .fastapi_settings import FastAPIServerSettings
 from .app_settings import AppSettings
 
 
-@dataclass(frozen=True)
+# Environment flags that auto-enable the advanced logger when ENABLE_LOGGER is unset
+_LOGGER_TRIGGERS = ("OVH_LDP_ENABLED", "LOG_FILE_ENABLED")
+
+
+@dataclass(frozen=True, slots=True)
 class ApiSettings(BaseSettings):
     """API-focused settings for running API servers.
     
@@ -186,14 +190,17 @@ class ApiSettings(BaseSettings):
         if "enable_logger" in overrides:
             return overrides["enable_logger"]
         
-        if EnvParser.get_env("ENABLE_LOGGER", env_type=bool) is not None:
-            return EnvParser.get_env("ENABLE_LOGGER", env_type=bool)
+        env = os.environ
+        explicit = env.get("ENABLE_LOGGER")
+        if explicit is not None:
+            return EnvParser._convert_type(explicit, bool, "ENABLE_LOGGER")
         
-        # Auto-detect based on OVH LDP or file logging settings
-        return (
-            EnvParser.get_env("OVH_LDP_ENABLED", env_type=bool) or
-            EnvParser.get_env("LOG_FILE_ENABLED", env_type=bool)
-        ) or False
+        # Auto-detect based on OVH LDP or file logging settings; unset triggers cost one dict lookup
+        return any(
+            EnvParser._convert_type(env[name], bool, name)
+            for name in _LOGGER_TRIGGERS
+            if name in env
+        )
     
     @staticmethod
     def _should_enable_mcp_server(overrides: dict) -> bool:
@@ -238,17 +245,25 @@ class ApiSettings(BaseSettings):
     def validate(self) -> None:
         """Validate the API settings configuration."""
         # Validate individual service configurations
-        if self.cache:
-            self.cache.validate()
-        if self.tracing:
-            self.tracing.validate()
-        if self.logger:
-            self.logger.validate()
+        self._check_section(self.cache)
+        self._check_section(self.tracing)
+        self._check_section(self.logger)
         if self.mcp_server:
             if not self.mcp_server.is_valid:
                 raise SettingsError(f"MCP server configuration invalid: {', '.join(self.mcp_server.validate())}")
-        if self.fastapi_server:
-            self.fastapi_server.validate()
+        self._check_section(self.fastapi_server)
+    
+    @staticmethod
+    def _check_section(section: Optional[BaseSettings]) -> None:
+        """Raise the error a nested settings object recorded when it was built.
+        
+        Settings are frozen and validate themselves on construction, so valid
+        sections are not validated again. An invalid section re-runs validate()
+        so its original SettingsError (including its code) propagates.
+        """
+        if section is not None and not section.is_valid:
+            section.validate()
+            raise SettingsError(section.validation_errors[0])
     
     def _get_attr(self, obj, attr, default=None):
         """Get attribute from object or dictionary."""
@@ -259,7 +274,7 @@ class ApiSettings(BaseSettings):
     def get_redis_config(self):
         """Get Redis configuration compatible with existing RedisConfig."""
         if not self.cache:
-            raise SettingsError("Cache not configured")
+            raise SettingsError("Cache not configured", code="cache_not_configured")
         
         from ..cache.redis_config import RedisConfig
         return RedisConfig(
@@ -275,13 +290,13 @@ class ApiSettings(BaseSettings):
     def get_mcp_server_config(self) -> MCPServerSettings:
         """Get MCP server configuration.""" 
         if not self.mcp_server:
-            raise SettingsError("MCP server not configured")
+            raise SettingsError("MCP server not configured", code="mcp_server_not_configured")
         return self.mcp_server
 
     def get_fastapi_server_config(self) -> FastAPIServerSettings:
         """Get FastAPI server configuration."""
         if not self.fastapi_server:
-            raise SettingsError("FastAPI server not configured")
+            raise SettingsError("FastAPI server not configured", code="fastapi_server_not_configured")
         return self.fastapi_server
 
     # Backward-compatible properties for core app fields
@@ -310,31 +325,40 @@ class ApiSettings(BaseSettings):
         """Get project root from app component."""
         return self.app.project_root
 
+    # Cheap availability checks: hot paths should branch on these rather than
+    # catching the SettingsError raised by the get_*_config() lookups
+    @property
+    def cache_configured(self) -> bool:
+        """True when the cache is enabled and configured."""
+        return self.enable_cache and self.cache is not None
+
     # Null-safe convenience properties for sub-configs
     @property
     def mcp_server_safe(self) -> MCPServerSettings | NullConfig:
-        return self.mcp_server if self.mcp_server is not None else NullConfig()
+        return self.mcp_server if self.mcp_server is not None else _NULL_CONFIG
 
     @property
     def fastapi_server_safe(self) -> FastAPIServerSettings | NullConfig:
-        return self.fastapi_server if self.fastapi_server is not None else NullConfig()
+        return self.fastapi_server if self.fastapi_server is not None else _NULL_CONFIG
 
     @property
     def cache_safe(self) -> CacheSettings | NullConfig:
-        return self.cache if self.cache is not None else NullConfig()
+        return self.cache if self.cache is not None else _NULL_CONFIG
 
     @property
     def tracing_safe(self) -> TracingSettings | NullConfig:
-        return self.tracing if self.tracing is not None else NullConfig()
+        return self.tracing if self.tracing is not None else _NULL_CONFIG
     
     @property
     def logger_safe(self) -> LoggerSettings | NullConfig:
-        return self.logger if self.logger is not None else NullConfig()
+        return self.logger if self.logger is not None else _NULL_CONFIG
     
+    @_memoize_as_dict
     def as_dict(self) -> dict:
         """Convert to dictionary representation.
         
-        Flattens app fields to root level for backward compatibility.
+        Flattens app fields to root level for backward compatibility. Built
+        once per instance; each call returns a fresh copy.
         """
         result = {
             # Flatten app fields to root level
@@ -8,8 +8,9 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import ClassVar, List, Optional, Tuple, Union
 
 try:  # Python 3.11+
     import tomllib  # type: ignore[attr-defined]
@@ -19,7 +20,22 @@ except ImportError:
 from .base_settings import BaseSettings
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=8)
+def _parse_pyproject(pyproject_path: Path, mtime_ns: int, size: int) -> Optional[dict]:
+    """Parse name/version from pyproject.toml; the stat fields only key the cache."""
+    try:
+        with pyproject_path.open("rb") as f:
+            data = tomllib.load(f)
+        project = data.get("project") or {}
+        return {
+            "name": project.get("name", "").strip() if isinstance(project.get("name"), str) else "",
+            "version": project.get("version", "").strip() if isinstance(project.get("version"), str) else "",
+        }
+    except Exception:
+        return None
+
+
+@dataclass(frozen=True, slots=True)
 class AppSettings(BaseSettings):
     """Core application settings with BaseSettings compatibility.
     
@@ -33,6 +49,8 @@ class AppSettings(BaseSettings):
     log_level: str = "DEBUG"
     project_root: Optional[Path] = None
     
+    _INTERN_FIELDS: ClassVar[Tuple[str, ...]] = ("environment", "log_level")
+    
     @classmethod
     def from_env(
         cls,
@@ -105,19 +123,18 @@ class AppSettings(BaseSettings):
 
     @staticmethod
     def _read_pyproject_data(pyproject_path: Path) -> Optional[dict]:
-        """Read project metadata from a pyproject.toml file."""
+        """Read project metadata from a pyproject.toml file.
+        
+        Parsed results are cached per file and reused until its mtime or size
+        changes; treat the returned dict as read-only.
+        """
         if tomllib is None:
             return None
         try:
-            with pyproject_path.open("rb") as f:
-                data = tomllib.load(f)
-            project = data.get("project") or {}
-            return {
-                "name": project.get("name", "").strip() if isinstance(project.get("name"), str) else "",
-                "version": project.get("version", "").strip() if isinstance(project.get("version"), str) else "",
-            }
-        except Exception:
+            st = pyproject_path.stat()
+        except OSError:
             return None
+        return _parse_pyproject(pyproject_path, st.st_mtime_ns, st.st_size)
 
     @classmethod
     def _resolve_version(cls, project_root: Optional[Path]) -> str:
@@ -19,14 +19,18 @@ Key Features:
 from __future__ import annotations
 
 import os
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, fields, replace
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union, get_type_hints
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Tuple, Type, TypeVar, Union, get_type_hints
 import warnings
 
 try:
-    from dotenv import load_dotenv
+    from dotenv import dotenv_values
     HAS_DOTENV = True
 except ImportError:
     HAS_DOTENV = False
@@ -38,10 +42,23 @@ except ImportError:  # pragma: no cover
 
 T = TypeVar('T')
 
+# Accepted spellings for a true boolean env value (anything else is False)
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
+
+# Set while settings are built with validation deferred (see ``deferred_validation``)
+_DEFER_VALIDATION: ContextVar[bool] = ContextVar("_DEFER_VALIDATION", default=False)
+
 
 class SettingsError(Exception):
-    """Base exception for settings-related errors."""
-    pass
+    """Base exception for settings-related errors.
+    
+    ``code`` is an optional stable identifier (e.g. ``"llm_not_configured"``)
+    for callers that branch on the kind of error instead of its message.
+    """
+    
+    def __init__(self, message: str = "", code: Optional[str] = None):
+        super().__init__(message)
+        self.code = code
 
 
 class EnvironmentVariableError(SettingsError):
@@ -52,6 +69,10 @@ class EnvironmentVariableError(SettingsError):
 class DotEnvLoader:
     """Handles .env file discovery and loading."""
     
+    # Parsed values of each .env file, keyed by path and tagged with the file's
+    # (st_mtime_ns, st_size): unchanged files are applied without re-parsing
+    _parsed: ClassVar[Dict[Path, Tuple[Tuple[int, int], Dict[str, Optional[str]]]]] = {}
+    
     @staticmethod
     def load_dotenv_files(
         search_paths: Optional[List[Union[str, Path]]] = None,
@@ -78,22 +99,42 @@ class DotEnvLoader:
         loaded = False
         for path in search_paths:
             env_file = Path(path) / filename
-            if env_file.exists():
-                load_dotenv(env_file, override=False)  # Don't override existing env vars
-                loaded = True
+            try:
+                st = env_file.stat()
+            except OSError:
+                continue
+            signature = (st.st_mtime_ns, st.st_size)
+            cached = DotEnvLoader._parsed.get(env_file)
+            if cached is None or cached[0] != signature:
+                cached = (signature, dotenv_values(env_file))
+                DotEnvLoader._parsed[env_file] = cached
+            for key, value in cached[1].items():
+                if value is not None:
+                    os.environ.setdefault(key, value)  # Don't override existing env vars
+            loaded = True
                 
         return loaded
     
     @staticmethod
     def _get_default_search_paths() -> List[Path]:
-        """Get default search paths for .env files."""
+        """Get default search paths for .env files.
+        
+        The list is cached per working directory (every nested settings class
+        asks for it); treat it as read-only. Call
+        ``DotEnvLoader._search_paths_for.cache_clear()`` to force a new lookup.
+        """
+        return DotEnvLoader._search_paths_for(Path.cwd())
+    
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _search_paths_for(cwd: Path) -> List[Path]:
+        """Build the default search paths for a given working directory."""
         paths = []
         
         # Current working directory
-        paths.append(Path.cwd())
+        paths.append(cwd)
         
         # Project root (walk up looking for pyproject.toml)
-        cwd = Path.cwd()
         for parent in [cwd, *cwd.parents]:
             if (parent / "pyproject.toml").exists():
                 paths.append(parent)
@@ -164,7 +205,7 @@ class EnvParser:
                     f"Invalid float value for {var_name}: {value}"
                 )
         elif target_type == bool:
-            return value.lower() in ('true', '1', 'yes', 'on')  # type: ignore
+            return value.lower() in _TRUE_VALUES  # type: ignore
         elif target_type == list:
             # Split by comma, strip whitespace
             return [item.strip() for item in value.split(',') if item.strip()]  # type: ignore
@@ -178,6 +219,43 @@ class EnvParser:
                 )
 
 
+def _copy_containers(value: Any) -> Any:
+    """Copy the dicts and lists of an ``as_dict()`` result; other values are shared."""
+    if type(value) is dict:
+        return {key: _copy_containers(item) for key, item in value.items()}
+    if type(value) is list:
+        return [_copy_containers(item) for item in value]
+    return value
+
+
+def _memoize_as_dict(method):
+    """Cache an ``as_dict()`` result on the (frozen) settings instance.
+    
+    Results are stored per defining class, so an override calling its base
+    ``as_dict()`` explicitly gets the base's own entry. Callers get a copy of
+    the cached dict (nested dicts and lists included), so changing it never
+    affects later calls; copying is still much cheaper than rebuilding.
+    """
+    key = method.__qualname__
+    
+    @wraps(method)
+    def wrapper(self):
+        # BaseSettings keeps a __dict__, so slots subclasses can hold the cache too
+        cache = self.__dict__.setdefault('_as_dict_cache', {})
+        result = cache.get(key)
+        if result is None:
+            result = cache[key] = method(self)
+        return _copy_containers(result)
+    
+    return wrapper
+
+
+@lru_cache(maxsize=None)
+def _public_field_names(cls: type) -> Tuple[str, ...]:
+    """Names of a settings class's dataclass fields, minus ``_``-prefixed metadata."""
+    return tuple(f.name for f in fields(cls) if not f.name.startswith('_'))
+
+
 @dataclass(frozen=True)
 class BaseSettings(ABC):
     """Abstract base class for application settings.
@@ -193,14 +271,35 @@ class BaseSettings(ABC):
     2. Implement `from_env()` to populate from environment variables
     3. Optionally override `validate()` for custom validation
     4. Use `get_env()` helper for environment variable parsing
+    
+    The built-in settings classes use ``slots=True``; inside them call base
+    methods explicitly (``Base.method(self)``), since zero-argument ``super()``
+    does not work in slots dataclasses. This base class keeps a ``__dict__`` so
+    plain subclasses need no changes.
     """
     
+    # Enum-like string fields interned on construction, so the many instances
+    # built per process share one object per distinct value
+    _INTERN_FIELDS: ClassVar[Tuple[str, ...]] = ()
+    
     # Metadata fields (not part of configuration)
     _env_loaded: bool = field(default=False, init=False, repr=False)
-    _validation_errors: List[str] = field(default_factory=list, init=False, repr=False)
+    _validation_errors: List[str] = field(default_factory=list, init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        """Post-initialization validation."""
+        """Post-initialization interning and validation."""
+        for name in self._INTERN_FIELDS:
+            value = getattr(self, name)
+            if type(value) is str:
+                object.__setattr__(self, name, sys.intern(value))
+        if _DEFER_VALIDATION.get():
+            # Validated on first is_valid / validation_errors access instead
+            object.__setattr__(self, '_validation_errors', None)
+            return
+        self._run_validation()
+    
+    def _run_validation(self) -> None:
+        """Run ``validate()`` and record its error, if any."""
         object.__setattr__(self, '_validation_errors', [])
         try:
             self.validate()
@@ -238,40 +337,61 @@ class BaseSettings(ABC):
     @property
     def is_valid(self) -> bool:
         """Check if configuration is valid."""
+        if self._validation_errors is None:
+            self._run_validation()
         return len(self._validation_errors) == 0
     
     @property
     def validation_errors(self) -> List[str]:
         """Get validation errors."""
+        if self._validation_errors is None:
+            self._run_validation()
         return self._validation_errors.copy()
     
     def get_env(self, *names: str, **kwargs) -> Any:
         """Convenience method for environment variable parsing."""
         return EnvParser.get_env(*names, **kwargs)
     
+    @_memoize_as_dict
     def as_dict(self) -> Dict[str, Any]:
-        """Return configuration as dictionary, excluding metadata fields."""
-        result = {}
-        for key, value in self.__dict__.items():
+        """Return configuration as dictionary, excluding metadata fields.
+        
+        Built once per instance; each call returns a fresh copy.
+        """
+        # Dataclass fields may live in slots; plain subclasses also keep attributes in __dict__
+        items = {name: getattr(self, name) for name in _public_field_names(type(self))}
+        for key, value in getattr(self, '__dict__', {}).items():
             if not key.startswith('_'):  # Exclude metadata fields
-                if hasattr(value, 'as_dict'):
-                    result[key] = value.as_dict()
-                else:
-                    result[key] = value
-        return result
+                items[key] = value
+        return {
+            key: value.as_dict() if hasattr(value, 'as_dict') else value
+            for key, value in items.items()
+        }
     
     def merge(self, **overrides) -> "BaseSettings":
         """Create a new instance with specified overrides.
         
+        Unchanged fields, including nested settings sections, are shared with
+        this instance rather than copied; that is safe because settings are
+        frozen. A dict given for a nested section is merged into that section.
+        
         Args:
             **overrides: Field values to override
             
         Returns:
             New settings instance with overrides applied
         """
-        current_dict = self.as_dict()
-        current_dict.update(overrides)
-        return type(self)(**current_dict)
+        if not _public_field_names(type(self)):
+            # Not a dataclass-style subclass (custom __init__): rebuild from as_dict()
+            current_dict = self.as_dict()
+            current_dict.update(overrides)
+            return type(self)(**current_dict)
+        
+        for name, value in overrides.items():
+            current = getattr(self, name, None)
+            if isinstance(value, dict) and isinstance(current, BaseSettings):
+                overrides[name] = current.merge(**value)
+        return replace(self, **overrides)
     
     @classmethod
     def _load_dotenv_if_requested(
@@ -285,11 +405,28 @@ class BaseSettings(ABC):
         return False
 
 
+@contextmanager
+def deferred_validation() -> Iterator[None]:
+    """Build settings without validating them in ``__post_init__``.
+    
+    Instances created inside the block validate lazily, on the first access
+    to ``is_valid`` or ``validation_errors``. Meant for environments that are
+    already vetted (e.g. by CI) and rebuilt often, such as restart loops.
+    """
+    token = _DEFER_VALIDATION.set(True)
+    try:
+        yield
+    finally:
+        _DEFER_VALIDATION.reset(token)
+
+
 class SettingsManager:
     """Manages multiple settings instances and provides unified access."""
     
     def __init__(self):
         self._settings: Dict[str, BaseSettings] = {}
+        # Settings are frozen and validated on creation, so validity is known at registration
+        self._invalid: set = set()
     
     def register(self, name: str, settings: BaseSettings) -> None:
         """Register a settings instance."""
@@ -297,6 +434,9 @@ class SettingsManager:
             warnings.warn(
                 f"Registering invalid settings '{name}': {settings.validation_errors}"
             )
+            self._invalid.add(name)
+        else:
+            self._invalid.discard(name)
         self._settings[name] = settings
     
     def get(self, name: str) -> Optional[BaseSettings]:
@@ -311,16 +451,16 @@ class SettingsManager:
         return settings
     
     def list_names(self) -> List[str]:
-        """List all registered settings names."""
-        return list(self._settings.keys())
+        """List all registered settings names, in registration order."""
+        return list(self._settings)
     
     def validate_all(self) -> Dict[str, List[str]]:
         """Validate all registered settings and return errors."""
-        errors = {}
-        for name, settings in self._settings.items():
-            if not settings.is_valid:
-                errors[name] = settings.validation_errors
-        return errors
+        return {
+            name: settings.validation_errors
+            for name, settings in self._settings.items()
+            if name in self._invalid
+        }
     
     def as_dict(self) -> Dict[str, Dict[str, Any]]:
         """Return all settings as nested dictionary."""
@@ -337,8 +477,13 @@ class NullConfig:
     - Any attribute access returns None
     - Falsy in boolean context
     - `as_dict()` returns None
+
+    It holds no state, so the ``*_safe`` accessors share the ``_NULL_CONFIG``
+    instance instead of allocating one per call.
     """
 
+    __slots__ = ()
+
     def __getattr__(self, name: str):  # noqa: D401
         return None
 
@@ -346,4 +491,7 @@ class NullConfig:
         return False
 
     def as_dict(self):
-        return None
\ No newline at end of file
+        return None
+
+
+_NULL_CONFIG = NullConfig()
\ No newline at end of file
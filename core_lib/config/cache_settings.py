@@ -8,15 +8,17 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import ClassVar, List, Optional, Tuple, Union
 
 from .base_settings import BaseSettings, SettingsError, EnvParser
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CacheSettings(BaseSettings):
     """Cache configuration settings."""
     
+    _INTERN_FIELDS: ClassVar[Tuple[str, ...]] = ("provider", "host")
+    
     provider: str = "redis"
     host: str = "localhost"
     port: int = 6379
@@ -13,7 +13,7 @@ from typing import List, Optional, Union
 from .base_settings import BaseSettings, SettingsError, EnvParser
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DatabaseSettings(BaseSettings):
     """PostgreSQL database configuration settings."""
     
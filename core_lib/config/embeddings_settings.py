@@ -8,15 +8,17 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import ClassVar, List, Optional, Tuple, Union
 
 from .base_settings import BaseSettings, EnvParser
 
 
-@dataclass(frozen=True) 
+@dataclass(frozen=True, slots=True)
 class EmbeddingsSettings(BaseSettings):
     """Embeddings provider configuration settings."""
     
+    _INTERN_FIELDS: ClassVar[Tuple[str, ...]] = ("provider",)
+    
     provider: str = "openai"
     model: str = "text-embedding-3-small"
     embedding_dimension: Optional[int] = None
@@ -7,14 +7,14 @@ consistency across server configs.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional, Union
 from pathlib import Path
 
 from .base_settings import BaseSettings, EnvParser, SettingsError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FastAPIServerSettings(BaseSettings):
     """FastAPI HTTP server configuration settings.
 
@@ -28,7 +28,7 @@ class FastAPIServerSettings(BaseSettings):
 
     api_auth_enabled: bool = False
     api_key_header_name: str = "x-api-key"
-    api_keys: List[str] = None  # parsed from comma-separated env var
+    api_keys: List[str] = field(default=None, hash=False)  # parsed from comma-separated env var
 
     @classmethod
     def from_env(
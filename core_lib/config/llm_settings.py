@@ -7,17 +7,19 @@ including OpenAI, Azure OpenAI, Google Gemini, and Ollama.
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 
 from .base_settings import BaseSettings, SettingsError, EnvParser
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LLMSettings(BaseSettings):
     """LLM provider configuration settings."""
     
+    _INTERN_FIELDS: ClassVar[Tuple[str, ...]] = ("provider",)
+    
     provider: str = "openai"
     model: str = "gpt-4o-mini"
     temperature: float = 0.7
@@ -38,7 +40,7 @@ class LLMSettings(BaseSettings):
     
     # Gemini specific
     google_api_key: Optional[str] = None
-    safety_settings: Optional[Dict[str, Any]] = None
+    safety_settings: Optional[Dict[str, Any]] = field(default=None, hash=False)
     
     @classmethod
     def from_env(
@@ -38,11 +38,14 @@ Environment Variables:
 
 from __future__ import annotations
 
-import json
 import os
+import sys
 from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Any, ClassVar, Dict, List, Mapping, Optional, Tuple, Union
+
+from pydantic import TypeAdapter, ValidationError
 
 from .base_settings import BaseSettings, SettingsError, EnvParser
 
@@ -56,7 +59,47 @@ except ModuleNotFoundError:
         tomllib = None  # type: ignore[assignment]
 
 
-@dataclass(frozen=True)
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_VALID_LOG_LEVELS = frozenset(_LOG_LEVELS)
+_PROTOCOLS = ("gelf_tcp", "gelf_udp", "syslog_tcp", "syslog_udp")
+_VALID_PROTOCOLS = frozenset(_PROTOCOLS)
+
+# Fields reported by LoggerSettings.as_dict(), and the ones masked there
+_AS_DICT_FIELDS = (
+    "log_level",
+    "file_logging",
+    "file_path",
+    "file_max_bytes",
+    "file_backup_count",
+    "ovh_ldp_enabled",
+    "ovh_ldp_token",
+    "ovh_ldp_endpoint",
+    "ovh_ldp_port",
+    "ovh_ldp_protocol",
+    "ovh_ldp_use_tls",
+    "ovh_ldp_facility",
+    "ovh_ldp_additional_fields",
+    "ovh_ldp_timeout",
+    "ovh_ldp_compress",
+)
+_MASKED_FIELDS = frozenset({"ovh_ldp_token"})
+_get_as_dict_values = attrgetter(*_AS_DICT_FIELDS)
+
+# Parses and type-checks a JSON object in one pass (pydantic-core's jiter parser)
+_JSON_OBJECT_ADAPTER = TypeAdapter(Dict[str, Any])
+
+
+def _parse_json_object(raw: Optional[str]) -> Dict[str, Any]:
+    """Parse a JSON object from an env var value, returning {} if missing or invalid."""
+    if not raw:
+        return {}
+    try:
+        return _JSON_OBJECT_ADAPTER.validate_json(raw)
+    except ValidationError:
+        return {}  # Silently ignore invalid JSON or non-object values
+
+
+@dataclass(frozen=True, slots=True)
 class LoggerSettings(BaseSettings):
     """Logger configuration settings with OVH Logs Data Platform support.
     
@@ -79,20 +122,62 @@ class LoggerSettings(BaseSettings):
     ovh_ldp_protocol: str = "gelf_tcp"  # gelf_tcp, gelf_udp, syslog_tcp, syslog_udp
     ovh_ldp_use_tls: bool = True
     ovh_ldp_facility: str = "user"  # Syslog facility
-    ovh_ldp_additional_fields: Dict[str, str] = field(default_factory=dict)
+    ovh_ldp_additional_fields: Dict[str, str] = field(default_factory=dict, hash=False)
     ovh_ldp_timeout: int = 10  # Connection timeout in seconds
     ovh_ldp_compress: bool = True  # Compress GELF messages
     
     # OpenTelemetry Protocol (OTLP) settings
     otlp_enabled: bool = False
     otlp_endpoint: str = "http://localhost:4318/v1/logs"
-    otlp_headers: Dict[str, str] = field(default_factory=dict)
+    otlp_headers: Dict[str, str] = field(default_factory=dict, hash=False)
     otlp_timeout: int = 10
     otlp_insecure: bool = False  # Skip SSL verification
     otlp_service_name: str = "core-lib"
     otlp_service_version: Optional[str] = None
     otlp_log_level: Optional[str] = None  # Independent log level for OTLP handler (if None, inherits from log_level)
     
+    # (field, env var names in priority order, type) read by from_env()
+    _ENV_FIELDS: ClassVar[Tuple[Tuple[str, Tuple[str, ...], type], ...]] = (
+        # Standard logging
+        ("log_level", ("LOG_LEVEL",), str),
+        ("file_logging", ("LOG_FILE_ENABLED",), bool),
+        ("file_path", ("LOG_FILE_PATH",), str),
+        ("file_max_bytes", ("LOG_FILE_MAX_BYTES",), int),
+        ("file_backup_count", ("LOG_FILE_BACKUP_COUNT",), int),
+        
+        # OVH LDP
+        ("ovh_ldp_enabled", ("OVH_LDP_ENABLED",), bool),
+        ("ovh_ldp_token", ("OVH_LDP_TOKEN", "OVH_LOGS_TOKEN"), str),
+        ("ovh_ldp_endpoint", ("OVH_LDP_ENDPOINT", "OVH_LOGS_ENDPOINT"), str),
+        ("ovh_ldp_port", ("OVH_LDP_PORT",), int),
+        ("ovh_ldp_protocol", ("OVH_LDP_PROTOCOL",), str),
+        ("ovh_ldp_use_tls", ("OVH_LDP_USE_TLS",), bool),
+        ("ovh_ldp_facility", ("OVH_LDP_FACILITY",), str),
+        ("ovh_ldp_timeout", ("OVH_LDP_TIMEOUT",), int),
+        ("ovh_ldp_compress", ("OVH_LDP_COMPRESS",), bool),
+        
+        # OTLP
+        ("otlp_endpoint", ("OTLP_ENDPOINT",), str),
+        ("otlp_timeout", ("OTLP_TIMEOUT",), int),
+        ("otlp_insecure", ("OTLP_INSECURE",), bool),
+        ("otlp_service_name", ("OTLP_SERVICE_NAME",), str),
+        ("otlp_service_version", ("OTLP_SERVICE_VERSION",), str),
+        ("otlp_log_level", ("OTLP_LOG_LEVEL",), str),  # Optional: independent OTLP log level
+    )
+    
+    def __post_init__(self):
+        """Normalise and intern the log levels and protocol, then validate once."""
+        # Interned, case-normalised values make the repeated comparisons in
+        # validation and handler setup an identity check in the common case.
+        if isinstance(self.log_level, str):
+            object.__setattr__(self, 'log_level', sys.intern(self.log_level.upper()))
+        if isinstance(self.otlp_log_level, str):
+            object.__setattr__(self, 'otlp_log_level', sys.intern(self.otlp_log_level.upper()))
+        if isinstance(self.ovh_ldp_protocol, str):
+            object.__setattr__(self, 'ovh_ldp_protocol', sys.intern(self.ovh_ldp_protocol.lower()))
+        # Explicit base call: zero-argument super() does not work in slots dataclasses
+        BaseSettings.__post_init__(self)
+    
     @staticmethod
     def _read_pyproject_version() -> Optional[str]:
         """Read version from pyproject.toml in project root.
@@ -140,84 +225,49 @@ class LoggerSettings(BaseSettings):
         - otlp_service_version defaults to version from pyproject.toml
         """
         cls._load_dotenv_if_requested(load_dotenv, dotenv_paths)
+        return cls._from_environ(os.environ, **overrides)
+    
+    @classmethod
+    def _from_environ(cls, env: Mapping[str, str], **overrides) -> "LoggerSettings":
+        """Build logger settings from an already-populated environment mapping.
         
-        # Parse additional fields from JSON if provided
-        additional_fields_raw = EnvParser.get_env("OVH_LDP_ADDITIONAL_FIELDS")
-        additional_fields = {}
-        if additional_fields_raw:
-            try:
-                additional_fields = json.loads(additional_fields_raw)
-                if not isinstance(additional_fields, dict):
-                    additional_fields = {}
-            except json.JSONDecodeError:
-                pass  # Silently ignore invalid JSON
+        This is the pure parsing half of from_env(): it never touches .env files.
+        """
+        # Plain fields: first env name that is set wins, missing ones keep the dataclass default
+        settings_dict: Dict[str, Any] = {}
+        for field_name, env_names, env_type in cls._ENV_FIELDS:
+            for env_name in env_names:
+                value = env.get(env_name)
+                if value is not None:
+                    settings_dict[field_name] = EnvParser._convert_type(value, env_type, env_names[0])
+                    break
         
-        # Parse OTLP headers from JSON if provided
-        otlp_headers_raw = EnvParser.get_env("OTLP_HEADERS")
-        otlp_headers = {}
-        if otlp_headers_raw:
-            try:
-                otlp_headers = json.loads(otlp_headers_raw)
-                if not isinstance(otlp_headers, dict):
-                    otlp_headers = {}
-            except json.JSONDecodeError:
-                pass  # Silently ignore invalid JSON
+        # Parse additional fields and OTLP headers from JSON if provided
+        settings_dict["ovh_ldp_additional_fields"] = _parse_json_object(env.get("OVH_LDP_ADDITIONAL_FIELDS"))
+        settings_dict["otlp_headers"] = _parse_json_object(env.get("OTLP_HEADERS"))
         
         # Auto-detect OTLP enablement
         # Enable OTLP if:
         # 1. ENABLE_LOGGER or LOG_FILE_ENABLED is true AND
         # 2. OTLP_ENDPOINT is defined AND
         # 3. OTLP_ENABLED is not explicitly false
-        logger_enabled = (
-            EnvParser.get_env("ENABLE_LOGGER", default=False, env_type=bool) or
-            EnvParser.get_env("LOG_FILE_ENABLED", default=False, env_type=bool)
-        )
-        otlp_endpoint_defined = EnvParser.get_env("OTLP_ENDPOINT") is not None
-        otlp_explicitly_disabled = EnvParser.get_env("OTLP_ENABLED") == "false"
-        
-        # Auto-enable if conditions met, unless explicitly disabled
-        auto_enable_otlp = logger_enabled and otlp_endpoint_defined and not otlp_explicitly_disabled
-        
-        # Get explicit OTLP_ENABLED setting (None if not set)
-        otlp_enabled_explicit = EnvParser.get_env("OTLP_ENABLED", env_type=bool) if EnvParser.get_env("OTLP_ENABLED") is not None else None
-        
-        # Use explicit setting if provided, otherwise use auto-detection
-        otlp_enabled = otlp_enabled_explicit if otlp_enabled_explicit is not None else auto_enable_otlp
+        # An explicit OTLP_ENABLED setting always wins over auto-detection.
+        otlp_enabled_raw = env.get("OTLP_ENABLED")
+        if otlp_enabled_raw is not None:
+            otlp_enabled = EnvParser._convert_type(otlp_enabled_raw, bool, "OTLP_ENABLED")
+        else:
+            logger_enabled = (
+                EnvParser._convert_type(env.get("ENABLE_LOGGER", ""), bool, "ENABLE_LOGGER") or
+                settings_dict.get("file_logging", False)
+            )
+            otlp_enabled = logger_enabled and "OTLP_ENDPOINT" in env
+        settings_dict["otlp_enabled"] = otlp_enabled
         
-        # Get service name and version defaults
-        default_service_name = EnvParser.get_env("APP_NAME", default="core-lib")
-        default_service_version = cls._read_pyproject_version()
-        
-        settings_dict = {
-            # Standard logging
-            "log_level": EnvParser.get_env("LOG_LEVEL", default="INFO"),
-            "file_logging": EnvParser.get_env("LOG_FILE_ENABLED", default=False, env_type=bool),
-            "file_path": EnvParser.get_env("LOG_FILE_PATH"),
-            "file_max_bytes": EnvParser.get_env("LOG_FILE_MAX_BYTES", default=1_048_576, env_type=int),
-            "file_backup_count": EnvParser.get_env("LOG_FILE_BACKUP_COUNT", default=3, env_type=int),
-            
-            # OVH LDP
-            "ovh_ldp_enabled": EnvParser.get_env("OVH_LDP_ENABLED", default=False, env_type=bool),
-            "ovh_ldp_token": EnvParser.get_env("OVH_LDP_TOKEN", "OVH_LOGS_TOKEN"),
-            "ovh_ldp_endpoint": EnvParser.get_env("OVH_LDP_ENDPOINT", "OVH_LOGS_ENDPOINT"),
-            "ovh_ldp_port": EnvParser.get_env("OVH_LDP_PORT", default=12202, env_type=int),
-            "ovh_ldp_protocol": EnvParser.get_env("OVH_LDP_PROTOCOL", default="gelf_tcp"),
-            "ovh_ldp_use_tls": EnvParser.get_env("OVH_LDP_USE_TLS", default=True, env_type=bool),
-            "ovh_ldp_facility": EnvParser.get_env("OVH_LDP_FACILITY", default="user"),
-            "ovh_ldp_additional_fields": additional_fields,
-            "ovh_ldp_timeout": EnvParser.get_env("OVH_LDP_TIMEOUT", default=10, env_type=int),
-            "ovh_ldp_compress": EnvParser.get_env("OVH_LDP_COMPRESS", default=True, env_type=bool),
-            
-            # OTLP
-            "otlp_enabled": otlp_enabled,
-            "otlp_endpoint": EnvParser.get_env("OTLP_ENDPOINT", default="http://localhost:4318/v1/logs"),
-            "otlp_headers": otlp_headers,
-            "otlp_timeout": EnvParser.get_env("OTLP_TIMEOUT", default=10, env_type=int),
-            "otlp_insecure": EnvParser.get_env("OTLP_INSECURE", default=False, env_type=bool),
-            "otlp_service_name": EnvParser.get_env("OTLP_SERVICE_NAME", default=default_service_name),
-            "otlp_service_version": EnvParser.get_env("OTLP_SERVICE_VERSION", default=default_service_version),
-            "otlp_log_level": EnvParser.get_env("OTLP_LOG_LEVEL"),  # Optional: independent OTLP log level
-        }
+        # Service name and version defaults (pyproject.toml is only read when needed)
+        if "otlp_service_name" not in settings_dict:
+            settings_dict["otlp_service_name"] = env.get("APP_NAME", "core-lib")
+        if "otlp_service_version" not in settings_dict:
+            settings_dict["otlp_service_version"] = cls._read_pyproject_version()
         
         settings_dict.update(overrides)
         return cls(**settings_dict)
@@ -225,10 +275,9 @@ class LoggerSettings(BaseSettings):
     def validate(self) -> None:
         """Validate logger configuration."""
         # Validate log level
-        valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if self.log_level.upper() not in valid_log_levels:
+        if self.log_level not in _VALID_LOG_LEVELS:
             raise SettingsError(
-                f"Invalid log level '{self.log_level}'. Must be one of: {', '.join(valid_log_levels)}"
+                f"Invalid log level '{self.log_level}'. Must be one of: {', '.join(_LOG_LEVELS)}"
             )
         
         # Validate OVH LDP settings
@@ -238,11 +287,10 @@ class LoggerSettings(BaseSettings):
             if not self.ovh_ldp_endpoint:
                 raise SettingsError("OVH LDP enabled but ovh_ldp_endpoint not provided")
             
-            valid_protocols = ["gelf_tcp", "gelf_udp", "syslog_tcp", "syslog_udp"]
-            if self.ovh_ldp_protocol.lower() not in valid_protocols:
+            if self.ovh_ldp_protocol not in _VALID_PROTOCOLS:
                 raise SettingsError(
                     f"Invalid OVH LDP protocol '{self.ovh_ldp_protocol}'. "
-                    f"Must be one of: {', '.join(valid_protocols)}"
+                    f"Must be one of: {', '.join(_PROTOCOLS)}"
                 )
             
             if self.ovh_ldp_port < 1 or self.ovh_ldp_port > 65535:
@@ -252,29 +300,15 @@ class LoggerSettings(BaseSettings):
                 raise SettingsError("OVH LDP timeout must be at least 1 second")
         
         # Validate OTLP log level if specified
-        if self.otlp_log_level is not None:
-            valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-            if self.otlp_log_level.upper() not in valid_log_levels:
-                raise SettingsError(
-                    f"Invalid OTLP log level '{self.otlp_log_level}'. Must be one of: {', '.join(valid_log_levels)}"
-                )
+        if self.otlp_log_level is not None and self.otlp_log_level not in _VALID_LOG_LEVELS:
+            raise SettingsError(
+                f"Invalid OTLP log level '{self.otlp_log_level}'. Must be one of: {', '.join(_LOG_LEVELS)}"
+            )
     
     def as_dict(self) -> dict:
         """Convert to dictionary representation."""
+        values = _get_as_dict_values(self)
         return {
-            "log_level": self.log_level,
-            "file_logging": self.file_logging,
-            "file_path": self.file_path,
-            "file_max_bytes": self.file_max_bytes,
-            "file_backup_count": self.file_backup_count,
-            "ovh_ldp_enabled": self.ovh_ldp_enabled,
-            "ovh_ldp_token": "***" if self.ovh_ldp_token else None,  # Mask token
-            "ovh_ldp_endpoint": self.ovh_ldp_endpoint,
-            "ovh_ldp_port": self.ovh_ldp_port,
-            "ovh_ldp_protocol": self.ovh_ldp_protocol,
-            "ovh_ldp_use_tls": self.ovh_ldp_use_tls,
-            "ovh_ldp_facility": self.ovh_ldp_facility,
-            "ovh_ldp_additional_fields": self.ovh_ldp_additional_fields,
-            "ovh_ldp_timeout": self.ovh_ldp_timeout,
-            "ovh_ldp_compress": self.ovh_ldp_compress,
+            name: (("***" if value else None) if name in _MASKED_FIELDS else value)  # Mask secrets
+            for name, value in zip(_AS_DICT_FIELDS, values)
         }
@@ -3,10 +3,23 @@
 This module contains configuration classes for Model Context Protocol (MCP) servers.
 """
 
-from typing import Optional, List, Union
+import os
+from functools import lru_cache
+from typing import Optional, List, Tuple, Union
 from pathlib import Path
 from .base_settings import BaseSettings, EnvParser
 
+_VALID_TRANSPORTS = ("streamable-http", "stdio", "websocket")
+
+
+@lru_cache(maxsize=None)
+def _env_fields(cls: type) -> Tuple[Tuple[str, Tuple[str, ...], object, type], ...]:
+    """(field, env var names, default, type) rows from ``cls.get_config_spec()``, built once per class."""
+    return tuple(
+        (name, tuple(spec["env_vars"]), spec["default"], spec["env_type"])
+        for name, spec in cls.get_config_spec().items()
+    )
+
 
 class MCPServerSettings(BaseSettings):
     """MCP Server configuration settings.
@@ -15,6 +28,16 @@ class MCPServerSettings(BaseSettings):
     server metadata, network settings, and transport configuration.
     """
 
+    # (predicate, error message) pairs checked by validate(), in reporting order
+    _CHECKS = (
+        (lambda s: 1 <= s.port <= 65535, "Port must be between 1 and 65535"),
+        (lambda s: s.timeout > 0, "Timeout must be positive"),
+        (lambda s: s.transport in _VALID_TRANSPORTS,
+         f"Transport must be one of: {', '.join(_VALID_TRANSPORTS)}"),
+        (lambda s: bool(s.server_name and s.server_name.strip()), "Server name cannot be empty"),
+        (lambda s: bool(s.version and s.version.strip()), "Version cannot be empty"),
+    )
+
     def __init__(
         self,
         server_name: str = "app-server",
@@ -105,24 +128,18 @@ class MCPServerSettings(BaseSettings):
         """Create MCP server settings from environment variables."""
         cls._load_dotenv_if_requested(load_dotenv, dotenv_paths)
         
-        config_spec = cls.get_config_spec()
+        env = os.environ
         settings_dict = {}
         
-        for field_name, config in config_spec.items():
-            env_vars = config["env_vars"]
-            default = config["default"]
-            env_type = config["env_type"]
-            
-            value = None
+        # First env name that is set wins, otherwise the spec default
+        for field_name, env_vars, default, env_type in _env_fields(cls):
             for env_var in env_vars:
-                value = EnvParser.get_env(env_var, env_type=env_type)
-                if value is not None:
+                raw = env.get(env_var)
+                if raw is not None:
+                    settings_dict[field_name] = EnvParser._convert_type(raw, env_type, env_var)
                     break
-            
-            if value is None:
-                value = default
-            
-            settings_dict[field_name] = value
+            else:
+                settings_dict[field_name] = default
         
         # Auto-generate URL if not provided
         if not settings_dict.get("url"):
@@ -139,35 +156,12 @@ class MCPServerSettings(BaseSettings):
         Returns:
             List of validation error messages (empty if valid)
         """
-        errors = []
-        
-        # Validate port range
-        if not (1 <= self.port <= 65535):
-            errors.append("Port must be between 1 and 65535")
-        
-        # Validate timeout
-        if self.timeout <= 0:
-            errors.append("Timeout must be positive")
-        
-        # Validate transport type
-        valid_transports = ["streamable-http", "stdio", "websocket"]
-        if self.transport not in valid_transports:
-            errors.append(f"Transport must be one of: {', '.join(valid_transports)}")
-        
-        # Validate server name
-        if not self.server_name or not self.server_name.strip():
-            errors.append("Server name cannot be empty")
-        
-        # Validate version format (basic semver check)
-        if not self.version or not self.version.strip():
-            errors.append("Version cannot be empty")
-        
-        return errors
+        return [message for check, message in self._CHECKS if not check(self)]
 
     @property
     def is_valid(self) -> bool:
-        """Check if configuration is valid."""
-        return len(self.validate()) == 0
+        """Check if configuration is valid (stops at the first failing check)."""
+        return all(check(self) for check, _ in self._CHECKS)
 
     def as_dict(self) -> dict:
         """Convert to dictionary representation."""
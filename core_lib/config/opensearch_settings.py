@@ -13,7 +13,7 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 from .base_settings import BaseSettings, EnvParser, SettingsError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpenSearchSettings(BaseSettings):
     """OpenSearch configuration settings."""
     
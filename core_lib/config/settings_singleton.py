@@ -41,7 +41,7 @@ import threading
 from typing import Optional, Type, TypeVar, Any, List, Union
 from pathlib import Path
 
-from .standard_settings import StandardSettings
+from .standard_settings import StandardSettings, clear_from_env_cache
 from .base_settings import SettingsError
 
 
@@ -62,6 +62,9 @@ class SettingsSingletonManager:
     _instance: Optional[StandardSettings] = None
     _lock = threading.Lock()
     _initialized = False
+    # (app, logger) settings logging was last configured from; a forced
+    # re-initialization with equal settings keeps the installed handlers
+    _logging_key: Optional[tuple] = None
     
     @classmethod
     def get_settings(cls) -> StandardSettings:
@@ -109,6 +112,7 @@ class SettingsSingletonManager:
         load_dotenv: bool = True,
         dotenv_paths: Optional[List[Union[str, Path]]] = None,
         setup_logging: bool = True,
+        validate: Optional[bool] = None,
         **overrides: Any
     ) -> T:
         """Initialize the settings singleton and optionally configure logging.
@@ -119,7 +123,9 @@ class SettingsSingletonManager:
         
         When setup_logging=True (default), automatically configures logging based
         on the settings instance (app and logger settings). This eliminates the
-        need to call setup_logging() separately in application code.
+        need to call setup_logging() separately in application code. Logging is
+        only reconfigured when those settings differ from the last setup, so a
+        forced re-initialization with unchanged settings keeps the handlers.
         
         Args:
             settings_class: The Settings class to instantiate (must extend StandardSettings)
@@ -127,6 +133,8 @@ class SettingsSingletonManager:
             load_dotenv: Whether to load .env files
             dotenv_paths: Custom paths to search for .env files
             setup_logging: Whether to automatically configure logging (default: True)
+            validate: Validate on construction; False defers validation to the
+                first is_valid access (default: True unless CORE_LIB_TRUST_ENV=1)
             **overrides: Direct value overrides passed to from_env()
             
         Returns:
@@ -164,7 +172,10 @@ class SettingsSingletonManager:
                     )
                 return cls._instance  # type: ignore
             
-            # Create new settings instance
+            # Create new settings instance; only forward validate when given, so
+            # subclasses overriding from_env() with the older signature keep working
+            if validate is not None:
+                overrides['validate'] = validate
             try:
                 cls._instance = settings_class.from_env(
                     load_dotenv=load_dotenv,
@@ -180,7 +191,8 @@ class SettingsSingletonManager:
                     app_settings = getattr(cls._instance, 'app', None)
                     logger_settings = getattr(cls._instance, 'logger', None)
                     
-                    if app_settings:
+                    logging_key = (app_settings, logger_settings)
+                    if app_settings and logging_key != cls._logging_key:
                         _setup_logging(
                             app_name=app_settings.app_name,
                             app_version=app_settings.version,
@@ -189,6 +201,7 @@ class SettingsSingletonManager:
                             logger_settings=logger_settings,
                             force=force
                         )
+                        cls._logging_key = logging_key
                 
                 return cls._instance  # type: ignore
             except Exception as e:
@@ -200,7 +213,8 @@ class SettingsSingletonManager:
         
         This removes the current settings instance and marks the singleton as
         uninitialized. The next call to get_settings() will raise an error until
-        initialize_settings() is called again.
+        initialize_settings() is called again. Memoized from_env() results are
+        dropped too, so the next initialization re-reads the environment.
         
         This is primarily useful for testing or when you need to completely
         reconfigure the application settings.
@@ -208,6 +222,8 @@ class SettingsSingletonManager:
         with cls._lock:
             cls._instance = None
             cls._initialized = False
+            cls._logging_key = None
+        clear_from_env_cache()
     
     @classmethod
     def has_settings(cls) -> bool:
@@ -235,6 +251,7 @@ def initialize_settings(
     load_dotenv: bool = True,
     dotenv_paths: Optional[List[Union[str, Path]]] = None,
     setup_logging: bool = True,
+    validate: Optional[bool] = None,
     **overrides: Any
 ) -> T:
     """Initialize the global settings singleton and optionally configure logging.
@@ -249,6 +266,8 @@ def initialize_settings(
         load_dotenv: Whether to load .env files
         dotenv_paths: Custom paths to search for .env files
         setup_logging: Whether to automatically configure logging (default: True)
+        validate: Validate on construction; False defers validation to the
+            first is_valid access (default: True unless CORE_LIB_TRUST_ENV=1)
         **overrides: Direct value overrides passed to from_env()
         
     Returns:
@@ -274,6 +293,7 @@ def initialize_settings(
         load_dotenv=load_dotenv,
         dotenv_paths=dotenv_paths,
         setup_logging=setup_logging,
+        validate=validate,
         **overrides
     )
 
@@ -23,10 +23,13 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Any
 
-from .base_settings import BaseSettings, SettingsError, EnvParser, NullConfig
+from .base_settings import (
+    BaseSettings, SettingsError, EnvParser, NullConfig, _NULL_CONFIG, _memoize_as_dict, deferred_validation
+)
 from .api_settings import ApiSettings
 from .app_settings import AppSettings
 from .llm_settings import LLMSettings
@@ -37,8 +40,30 @@ from .database_settings import DatabaseSettings
 from .mcp_settings import MCPServerSettings
 from .fastapi_settings import FastAPIServerSettings
 
+# Variables that auto-enable a service when set to a non-empty value, one bit each
+_LLM_TRIGGERS = ("OPENAI_API_KEY", "AZURE_OPENAI_API_KEY", "GEMINI_API_KEY",
+                 "GOOGLE_GENAI_API_KEY", "OLLAMA_HOST", "LLM_PROVIDER")
+_EMBEDDINGS_TRIGGERS = ("EMBEDDING_PROVIDER", "EMBEDDING_MODEL")
+_DATABASE_TRIGGERS = ("POSTGRES_HOST", "DATABASE_HOST", "POSTGRES_USER", "DATABASE_USER")
+_TRIGGER_BITS = {
+    name: 1 << i
+    for i, name in enumerate(_LLM_TRIGGERS + _EMBEDDINGS_TRIGGERS + _DATABASE_TRIGGERS)
+}
+_LLM_MASK = sum(_TRIGGER_BITS[name] for name in _LLM_TRIGGERS)
+_EMBEDDINGS_MASK = sum(_TRIGGER_BITS[name] for name in _EMBEDDINGS_TRIGGERS)
+_DATABASE_MASK = sum(_TRIGGER_BITS[name] for name in _DATABASE_TRIGGERS)
 
-@dataclass(frozen=True)
+
+def _present_triggers(env) -> int:
+    """Bitmap of the auto-detection variables set to a non-empty value in ``env``."""
+    bits = 0
+    for name, bit in _TRIGGER_BITS.items():
+        if env.get(name):
+            bits |= bit
+    return bits
+
+
+@dataclass(frozen=True, slots=True)
 class StandardSettings(ApiSettings):
     """Standard settings that combines app settings with optional provider configurations.
     
@@ -68,11 +93,45 @@ class StandardSettings(ApiSettings):
         cls,
         load_dotenv: bool = True,
         dotenv_paths: Optional[List[Union[str, Path]]] = None,
+        validate: Optional[bool] = None,
         **overrides
     ) -> "StandardSettings":
-        """Create standard settings from environment variables and auto-detect services."""
+        """Create standard settings from environment variables and auto-detect services.
+        
+        Instances are immutable, so the result is cached on a snapshot of the
+        environment, the working directory and the overrides: repeated calls
+        with nothing changed return the same instance. Use
+        ``clear_from_env_cache()`` to force a rebuild.
+        
+        With ``validate=False`` (or ``CORE_LIB_TRUST_ENV=1`` when ``validate``
+        is not given) the settings skip validation on construction and validate
+        lazily on the first ``is_valid`` / ``validation_errors`` access.
+        """
         cls._load_dotenv_if_requested(load_dotenv, dotenv_paths)
+        if validate is None:
+            validate = not EnvParser.get_env("CORE_LIB_TRUST_ENV", default=False, env_type=bool)
         
+        # Values are keyed with their type so that e.g. 1, 1.0 and True differ
+        override_key = frozenset((k, type(v), v) for k, v in overrides.items())
+        try:
+            hash(override_key)
+        except TypeError:  # unhashable override values: build without caching
+            return cls._build_validated(overrides, validate)
+        return _cached_from_env(
+            cls, os.getcwd(), frozenset(os.environ.items()), override_key, validate
+        )
+    
+    @classmethod
+    def _build_validated(cls, overrides: Dict[str, Any], validate: bool) -> "StandardSettings":
+        """Build settings, deferring validation unless ``validate`` is set."""
+        if validate:
+            return cls._build_from_env(overrides)
+        with deferred_validation():
+            return cls._build_from_env(overrides)
+    
+    @classmethod
+    def _build_from_env(cls, overrides: Dict[str, Any]) -> "StandardSettings":
+        """Build settings from the current environment (dotenv already loaded)."""
         # Get app and API settings from parent ApiSettings
         api_overrides = {
             k: v for k, v in overrides.items()
@@ -82,9 +141,10 @@ class StandardSettings(ApiSettings):
         api_settings = ApiSettings.from_env(load_dotenv=False, **api_overrides)
         
         # Auto-detect additional services from environment (beyond API settings)
-        enable_llm = cls._should_enable_llm(overrides)
-        enable_embeddings = cls._should_enable_embeddings(overrides)
-        enable_database = cls._should_enable_database(overrides)
+        triggers = _present_triggers(os.environ)
+        enable_llm = cls._should_enable_llm(overrides, triggers)
+        enable_embeddings = cls._should_enable_embeddings(overrides, triggers)
+        enable_database = cls._should_enable_database(overrides, triggers)
         
         # Create service configurations if enabled
         llm_config = None
@@ -139,68 +199,53 @@ class StandardSettings(ApiSettings):
         return cls(**settings_dict)
     
     @staticmethod
-    def _should_enable_llm(overrides: dict) -> bool:
+    def _should_enable_llm(overrides: dict, triggers: int) -> bool:
         """Check if LLM should be enabled based on environment variables."""
         if "enable_llm" in overrides:
             return overrides["enable_llm"]
         
-        if EnvParser.get_env("ENABLE_LLM", env_type=bool) is not None:
-            return EnvParser.get_env("ENABLE_LLM", env_type=bool)
+        explicit = EnvParser.get_env("ENABLE_LLM", env_type=bool)
+        if explicit is not None:
+            return explicit
         
-        # Auto-detect based on API keys
-        return (
-            EnvParser.get_env("OPENAI_API_KEY") or
-            EnvParser.get_env("AZURE_OPENAI_API_KEY") or
-            EnvParser.get_env("GEMINI_API_KEY") or
-            EnvParser.get_env("GOOGLE_GENAI_API_KEY") or
-            EnvParser.get_env("OLLAMA_HOST") or
-            EnvParser.get_env("LLM_PROVIDER")
-        ) is not None
+        # Auto-detect based on API keys or provider settings
+        return bool(triggers & _LLM_MASK)
     
     @staticmethod
-    def _should_enable_embeddings(overrides: dict) -> bool:
+    def _should_enable_embeddings(overrides: dict, triggers: int) -> bool:
         """Check if embeddings should be enabled based on environment variables."""
         if "enable_embeddings" in overrides:
             return overrides["enable_embeddings"]
         
-        if EnvParser.get_env("ENABLE_EMBEDDINGS", env_type=bool) is not None:
-            return EnvParser.get_env("ENABLE_EMBEDDINGS", env_type=bool)
+        explicit = EnvParser.get_env("ENABLE_EMBEDDINGS", env_type=bool)
+        if explicit is not None:
+            return explicit
         
         # Auto-detect based on provider or model settings
-        return (
-            EnvParser.get_env("EMBEDDING_PROVIDER") or
-            EnvParser.get_env("EMBEDDING_MODEL")
-        ) is not None
+        return bool(triggers & _EMBEDDINGS_MASK)
     
     @staticmethod
-    def _should_enable_database(overrides: dict) -> bool:
+    def _should_enable_database(overrides: dict, triggers: int) -> bool:
         """Check if database should be enabled based on environment variables."""
         if "enable_database" in overrides:
             return overrides["enable_database"]
         
-        if EnvParser.get_env("ENABLE_DATABASE", env_type=bool) is not None:
-            return EnvParser.get_env("ENABLE_DATABASE", env_type=bool)
+        explicit = EnvParser.get_env("ENABLE_DATABASE", env_type=bool)
+        if explicit is not None:
+            return explicit
         
         # Auto-detect based on database settings
-        return (
-            EnvParser.get_env("POSTGRES_HOST") or
-            EnvParser.get_env("DATABASE_HOST") or
-            EnvParser.get_env("POSTGRES_USER") or
-            EnvParser.get_env("DATABASE_USER")
-        ) is not None
+        return bool(triggers & _DATABASE_MASK)
     
     def validate(self) -> None:
         """Validate the complete settings configuration."""
         # Validate API settings (cache, tracing, mcp_server, fastapi_server) via parent
-        super().validate()
+        ApiSettings.validate(self)  # explicit: zero-argument super() fails in slots dataclasses
         
         # Validate additional service configurations
-        if self.llm:
-            self.llm.validate()
-        if self.embeddings:
-            self.embeddings.validate()
-        if self.database:
-            self.database.validate()
+        self._check_section(self.llm)
+        self._check_section(self.embeddings)
+        self._check_section(self.database)
     
     @classmethod
     def extend_from_env(
@@ -227,25 +272,22 @@ class StandardSettings(ApiSettings):
             if k in cls.__dataclass_fields__
         })
         
-        # Parse custom fields from environment
-        cls._load_dotenv_if_requested(load_dotenv, dotenv_paths)
+        # Parse custom fields from environment (.env files were loaded by from_env above)
         custom_fields = {}
+        env_get = os.environ.get
         
-        for field_name, config in custom_config.items():
-            env_vars = config.get("env_vars", [])
-            default = config.get("default")
-            env_type = config.get("env_type", str)
-            required = config.get("required", False)
-            
-            value = None
+        for field_name, env_vars, default, env_type, required in _compile_custom_config(custom_config):
             for env_var in env_vars:
-                value = EnvParser.get_env(env_var, env_type=env_type)
-                if value is not None:
+                raw = env_get(env_var)
+                if raw is not None:
+                    value = EnvParser._convert_type(raw, env_type, env_var)
                     break
-            
-            if value is None:
+            else:
                 if required:
-                    raise SettingsError(f"Required custom field '{field_name}' not found in environment variables: {env_vars}")
+                    raise SettingsError(
+                        f"Required custom field '{field_name}' not found in environment variables: {list(env_vars)}",
+                        code="required_field_missing",
+                    )
                 value = default
             
             custom_fields[field_name] = value
@@ -320,7 +362,7 @@ class StandardSettings(ApiSettings):
     def get_llm_config(self):
         """Get LLM configuration in the format expected by existing LLM clients."""
         if not self.llm:
-            raise SettingsError("LLM not configured")
+            raise SettingsError("LLM not configured", code="llm_not_configured")
         
         # Import here to avoid circular imports
         provider = self._get_attr(self.llm, "provider", "").lower()
@@ -360,7 +402,7 @@ class StandardSettings(ApiSettings):
     def get_embeddings_config(self):
         """Get embeddings configuration compatible with existing EmbeddingsConfig."""
         if not self.embeddings:
-            raise SettingsError("Embeddings not configured")
+            raise SettingsError("Embeddings not configured", code="embeddings_not_configured")
         
         from ..embeddings.embeddings_config import EmbeddingsConfig
         return EmbeddingsConfig(
@@ -388,7 +430,7 @@ class StandardSettings(ApiSettings):
     def get_database_config(self) -> DatabaseSettings:
         """Get database configuration."""
         if not self.database:
-            raise SettingsError("Database not configured")
+            raise SettingsError("Database not configured", code="database_not_configured")
         return self.database
     
     def as_app_settings(self) -> AppSettings:
@@ -401,23 +443,40 @@ class StandardSettings(ApiSettings):
             project_root=self.project_root
         )
 
+    # Cheap availability checks for additional sub-configs (cache_configured inherited from parent)
+    @property
+    def llm_configured(self) -> bool:
+        """True when the LLM is enabled and configured."""
+        return self.enable_llm and self.llm is not None
+
+    @property
+    def embeddings_configured(self) -> bool:
+        """True when embeddings are enabled and configured."""
+        return self.enable_embeddings and self.embeddings is not None
+
+    @property
+    def database_configured(self) -> bool:
+        """True when the database is enabled and configured."""
+        return self.enable_database and self.database is not None
+
     # Null-safe convenience properties for additional sub-configs (API configs inherited from parent)
     @property
     def llm_safe(self) -> LLMSettings | NullConfig:
-        return self.llm if self.llm is not None else NullConfig()
+        return self.llm if self.llm is not None else _NULL_CONFIG
 
     @property
     def embeddings_safe(self) -> EmbeddingsSettings | NullConfig:
-        return self.embeddings if self.embeddings is not None else NullConfig()
+        return self.embeddings if self.embeddings is not None else _NULL_CONFIG
 
     @property
     def database_safe(self) -> DatabaseSettings | NullConfig:
-        return self.database if self.database is not None else NullConfig()
+        return self.database if self.database is not None else _NULL_CONFIG
     
+    @_memoize_as_dict
     def as_dict(self) -> dict:
-        """Convert to dictionary representation."""
+        """Convert to dictionary representation (built once per instance; returns a copy)."""
         # Start with app and API settings from parent
-        result = super().as_dict()
+        result = ApiSettings.as_dict(self)
         # Add StandardSettings-specific fields only
         result.update({
             "llm": self.llm.as_dict() if self.llm else None,
@@ -427,4 +486,34 @@ class StandardSettings(ApiSettings):
             "enable_embeddings": self.enable_embeddings,
             "enable_database": self.enable_database,
         })
-        return result
\ No newline at end of file
+        return result
+
+
+def _compile_custom_config(custom_config: Dict[str, Dict[str, Any]]) -> tuple:
+    """Flatten an ``extend_from_env`` config into (field, env_vars, default, env_type, required) rows."""
+    return tuple(
+        (
+            field_name,
+            tuple(config.get("env_vars", ())),
+            config.get("default"),
+            config.get("env_type", str),
+            config.get("required", False),
+        )
+        for field_name, config in custom_config.items()
+    )
+
+
+@lru_cache(maxsize=32)
+def _cached_from_env(
+    cls, cwd: str, environ: frozenset, overrides: frozenset, validate: bool
+) -> StandardSettings:
+    """Build settings once per (class, working directory, environment, overrides, validate).
+    
+    ``overrides`` holds ``(name, type, value)`` triples.
+    """
+    return cls._build_validated({k: v for k, _, v in overrides}, validate)
+
+
+def clear_from_env_cache() -> None:
+    """Drop memoized from_env() results so the next call rebuilds them."""
+    _cached_from_env.cache_clear()
@@ -7,7 +7,13 @@ GenerateContentConfig, and chat via client.chats.create(...).send_message(...).
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Type
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from pydantic import BaseModel
 
@@ -28,11 +34,29 @@ logger = get_module_logger()
 _instrumentation_initialized = False
 
 
+@lru_cache(maxsize=128)
+def _flatten_messages(messages: Tuple[Tuple[str, Any], ...]) -> str:
+    """Join (role, content) pairs into a single role-prefixed prompt string.
+
+    Cached so retries of the same multi-turn request reuse the prompt.
+    """
+    parts: List[str] = []
+    for role, content in messages:
+        if role == "system":
+            parts.append(f"System: {content}")
+        elif role in ("assistant", "ai"):
+            parts.append(f"Assistant: {content}")
+        else:
+            parts.append(f"User: {content}")
+    return "\n".join(parts)
+
+
 @dataclass
 class GeminiConfig(LLMConfig):
     api_key: str
     base_url: str = "https://generativelanguage.googleapis.com"
     safety_settings: Optional[Dict[str, Any]] = None
+    response_cache: bool = False
 
     def __init__(
         self,
@@ -43,10 +67,12 @@ class GeminiConfig(LLMConfig):
         thinking_enabled: bool = False,
         base_url: str = "https://generativelanguage.googleapis.com",
         safety_settings: Optional[Dict[str, Any]] = None,
+        response_cache: bool = False,
     ):
         super().__init__("gemini", model, temperature, max_tokens, thinking_enabled)
         self.api_key = api_key
         self.base_url = base_url
+        self.response_cache = response_cache
         self.safety_settings = safety_settings or {
             "HARM_CATEGORY_HARASSMENT": "BLOCK_ONLY_HIGH",
             "HARM_CATEGORY_HATE_SPEECH": "BLOCK_ONLY_HIGH",
@@ -72,6 +98,7 @@ class GeminiConfig(LLMConfig):
         max_tokens = int(max_tokens_env) if max_tokens_env is not None else None
         thinking_enabled = get_env("GEMINI_THINKING_ENABLED", "GOOGLE_GENAI_THINKING_ENABLED", default="false").lower() == "true"
         base_url = get_env("GEMINI_BASE_URL", "GOOGLE_GENAI_BASE_URL", default="https://generativelanguage.googleapis.com")
+        response_cache = get_env("GEMINI_RESPONSE_CACHE", "GOOGLE_GENAI_RESPONSE_CACHE", default="false").lower() == "true"
 
         return cls(
             api_key=api_key,
@@ -80,6 +107,7 @@ class GeminiConfig(LLMConfig):
             max_tokens=max_tokens,
             thinking_enabled=thinking_enabled,
             base_url=base_url,
+            response_cache=response_cache,
         )
 
 class GoogleGenAIProvider(BaseProvider):
@@ -92,6 +120,12 @@ class GoogleGenAIProvider(BaseProvider):
     
     Also includes retry logic with exponential backoff for transient failures
     such as rate limits, server errors, and network issues.
+
+    When ``config.response_cache`` is enabled (off by default) and the
+    configured temperature is 0, successful responses are kept in a
+    small in-process LRU keyed by model and request payload, so identical
+    deterministic prompts are served without another API call. Search
+    grounded requests are never cached since their answers depend on time.
     """
 
     # Hardcoded per-model request-per-minute limits. Keys are lowercase substrings
@@ -105,6 +139,9 @@ class GoogleGenAIProvider(BaseProvider):
         "embedding": 100,      # Gemini Embedding models
     }
     
+    # Maximum number of deterministic (temperature == 0) responses kept in memory
+    _RESPONSE_CACHE_SIZE: int = 128
+
     # Models known to NOT support native JSON mode (structured output)
     # These will automatically use fallback JSON parsing
     _NO_JSON_MODE_MODELS: List[str] = [
@@ -147,6 +184,11 @@ class GoogleGenAIProvider(BaseProvider):
             extra={"model": config.model, "rpm": rpm, "rps": rps},
         )
 
+        # LRU of deterministic responses (only populated when response_cache is
+        # enabled and temperature == 0); shared across threads, so guarded by a lock
+        self._response_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+
         # Configure retry logic for common transient failures
         # Identify retryable exceptions from google-genai and google.api_core
         retryable_exceptions = []
@@ -258,17 +300,12 @@ class GoogleGenAIProvider(BaseProvider):
         we could use client.chats and turn history, but generate_content also
         accepts contents=str. We'll join messages into a single text.
         """
-        parts: List[str] = []
-        for m in messages:
-            role = m.get("role", "user")
-            content = m.get("content", "")
-            if role == "system":
-                parts.append(f"System: {content}")
-            elif role in ("assistant", "ai"):
-                parts.append(f"Assistant: {content}")
-            else:
-                parts.append(f"User: {content}")
-        return "\n".join(parts)
+        key = tuple((m.get("role", "user"), m.get("content", "")) for m in messages)
+        try:
+            return _flatten_messages(key)
+        except TypeError:
+            # Unhashable content (e.g. structured parts): skip the cache
+            return _flatten_messages.__wrapped__(key)
 
     def _build_config(
         self,
@@ -396,6 +433,43 @@ class GoogleGenAIProvider(BaseProvider):
                 exc_info=e
             )
 
+    def _response_cache_key(
+        self,
+        *,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Dict[str, Any]]],
+        structured_output: Optional[Type[BaseModel]],
+        system_message: Optional[str],
+        use_search_grounding: bool,
+        thinking_enabled: Optional[bool],
+    ) -> Optional[str]:
+        """Return the response cache key, or None when the call is not cacheable.
+
+        Only deterministic requests (temperature == 0) without search grounding
+        are cached, and only when ``config.response_cache`` is enabled.
+        """
+        if not getattr(self.config, "response_cache", False):
+            return None
+        if self.config.temperature != 0 or use_search_grounding:
+            return None
+        schema = None
+        if structured_output is not None:
+            schema = f"{structured_output.__module__}.{structured_output.__qualname__}"
+        payload = {
+            "model": self.config.model,
+            "max_tokens": self.config.max_tokens,
+            "thinking": thinking_enabled if thinking_enabled is not None else self.config.thinking_enabled,
+            "messages": messages,
+            "tools": tools,
+            "schema": schema,
+            "system": system_message,
+        }
+        try:
+            raw = json.dumps(payload, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
     def chat(
         self,
         *,
@@ -406,13 +480,31 @@ class GoogleGenAIProvider(BaseProvider):
         use_search_grounding: bool = False,
         thinking_enabled: Optional[bool] = None,
     ) -> Dict[str, Any]:
-        """Main chat interface with rate limiting and retry logic."""
+        """Main chat interface with response caching, rate limiting and retry logic."""
+        cache_key = self._response_cache_key(
+            messages=messages,
+            tools=tools,
+            structured_output=structured_output,
+            system_message=system_message,
+            use_search_grounding=use_search_grounding,
+            thinking_enabled=thinking_enabled,
+        )
+        if cache_key is not None:
+            with self._response_cache_lock:
+                cached = self._response_cache.get(cache_key)
+                if cached is not None:
+                    self._response_cache.move_to_end(cache_key)
+                    cached = copy.deepcopy(cached)
+            if cached is not None:
+                logger.debug("genai.chat served from response cache", extra={"model": self.config.model})
+                return cached
+
         try:
             # Enforce model-specific RPM throttling before performing network call.
             self._acquire_rate_limit()
             
             # Call the actual API with retry logic
-            return self._chat_with_retry(
+            result = self._chat_with_retry(
                 messages=messages,
                 tools=tools,
                 structured_output=structured_output,
@@ -420,10 +512,18 @@ class GoogleGenAIProvider(BaseProvider):
                 use_search_grounding=use_search_grounding,
                 thinking_enabled=thinking_enabled,
             )
+            if cache_key is not None:
+                entry = copy.deepcopy(result)
+                with self._response_cache_lock:
+                    self._response_cache[cache_key] = entry
+                    self._response_cache.move_to_end(cache_key)
+                    if len(self._response_cache) > self._RESPONSE_CACHE_SIZE:
+                        self._response_cache.popitem(last=False)
+            return result
         except Exception as e:  # pragma: no cover - network errors
             # Log error without full traceback for retryable errors (retries already logged)
             # For non-retryable errors, include traceback for debugging
-            is_retryable = isinstance(e, self._retry_config.retry_on_exceptions)
+            is_retryable = self._retry_config.is_retryable(e)
             if is_retryable:
                 logger.error(f"genai.chat failed after all retries: {type(e).__name__}: {e}")
             else:
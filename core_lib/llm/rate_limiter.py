@@ -16,15 +16,23 @@ Example:
 """
 
 import asyncio
-import time
-from typing import List
+import threading
+from time import monotonic
+from collections import deque
+from typing import Callable, ClassVar, Deque, Dict
 from dataclasses import dataclass
 from core_lib import get_module_logger
 
 
 logger = get_module_logger()
 
-@dataclass
+# Limits at or above this value are treated as "no limit"
+_UNLIMITED = 1e9
+
+# Guards creation of entries in RateLimiter._shared
+_registry_lock = threading.Lock()
+
+@dataclass(slots=True)
 class RateLimitConfig:
     """Configuration for the RateLimiter.
 
@@ -32,8 +40,10 @@ class RateLimitConfig:
         requests_per_minute: Maximum number of requests allowed in any rolling
             60-second window. When this limit is reached, acquire() will sleep
             until the oldest recorded request falls outside the 60s window.
+            A value <= 0 (or >= 1e9) disables the check.
         requests_per_second: Maximum sustained requests per second. This is
             enforced as a minimum interval between consecutive requests.
+            A value <= 0 (or >= 1e9) disables the check.
         burst_allowance: Reserved for brief bursts above the sustained rate.
             The current implementation keeps the parameter for compatibility
             and future use; callers should treat it as advisory.
@@ -45,9 +55,11 @@ class RateLimitConfig:
 class RateLimiter:
     """Simple asyncio-compatible rate limiter for API requests.
 
-    The limiter records timestamps of recent requests (a sliding window) and
-    serializes access with an asyncio.Lock so multiple coroutines may safely
-    call acquire() concurrently. The limiter enforces:
+    The limiter records timestamps of recent requests, taken from the monotonic
+    clock so wall-clock adjustments cannot stretch or collapse the window (a
+    sliding window kept in a deque, so expired entries are dropped from the
+    front in O(1)), and serializes access with an asyncio.Lock so multiple
+    coroutines may safely call acquire() concurrently. The limiter enforces:
       - A rolling requests-per-minute limit (count of timestamps within last 60s).
       - A requests-per-second limit expressed as a minimum interval between requests.
 
@@ -64,17 +76,54 @@ class RateLimiter:
         await rate_limiter.acquire()  # will block/sleep if necessary
     """
 
-    def __init__(self, config: RateLimitConfig):
+    # Limiters shared by key, see get_shared()
+    _shared: ClassVar[Dict[str, "RateLimiter"]] = {}
+
+    def __init__(self, config: RateLimitConfig, clock: Callable[[], float] = monotonic):
         """Initialize the RateLimiter.
 
         Args:
             config: RateLimitConfig instance containing the throttling parameters.
+            clock: Zero-argument callable returning the current time in seconds.
+                Defaults to time.monotonic; tests can pass a fake clock.
         """
         self.config = config
-        self.request_times: List[float] = []
-        self.last_request_time = 0.0
+        self._now = clock
+        rpm = config.requests_per_minute
+        rps = config.requests_per_second
+        # Disabled dimensions are skipped entirely in acquire()
+        self._rpm_enabled = 0 < rpm < _UNLIMITED
+        self._rps_enabled = 0 < rps < _UNLIMITED
+        self._min_interval = 1.0 / rps if self._rps_enabled else 0.0
+        # At most requests_per_minute timestamps are ever needed: once the window
+        # is full acquire() waits for the oldest to expire, and appending then
+        # drops it, so the history is a fixed-size ring buffer. The newest entry
+        # doubles as the previous request time for the RPS check, so RPS-only
+        # limiters keep just that one.
+        if self._rpm_enabled:
+            history_size = rpm
+        else:
+            history_size = 1 if self._rps_enabled else 0
+        self.request_times: Deque[float] = deque(maxlen=history_size)
         self._lock = asyncio.Lock()
 
+    @classmethod
+    def get_shared(cls, key: str, config: RateLimitConfig) -> "RateLimiter":
+        """Return the process-wide limiter registered under ``key``.
+
+        The first call for a key creates the limiter from ``config``; later
+        calls return that same instance (and ignore ``config``), so every
+        caller using the key shares one request history and lock. As with any
+        asyncio.Lock, the shared limiter should be used from a single event loop.
+        """
+        limiter = cls._shared.get(key)
+        if limiter is None:
+            with _registry_lock:
+                limiter = cls._shared.get(key)
+                if limiter is None:
+                    limiter = cls._shared[key] = cls(config)
+        return limiter
+
     async def acquire(self) -> None:
         """Acquire permission to make a request.
 
@@ -85,43 +134,79 @@ class RateLimiter:
 
         Behavior:
           - Removes timestamps older than 60 seconds from internal history.
-          - If the requests-per-minute limit is reached, sleeps until the
-            oldest timestamp exits the 60s window.
-          - Ensures at least (1 / requests_per_second) seconds elapsed since
-            the last recorded request; if not, sleeps the remaining time.
-          - Records the timestamp of the approved request.
+          - If the requests-per-minute limit is reached, the request is
+            scheduled for when the oldest timestamp exits the 60s window.
+          - Ensures at least (1 / requests_per_second) seconds separate it
+            from the previously scheduled request.
+          - Records the scheduled timestamp, then sleeps until it arrives.
 
         Returns:
             None
 
         Concurrency:
-            Safe to call from multiple coroutines. Internal Lock serializes
-            the check-and-record operation to avoid race conditions.
+            Safe to call from multiple coroutines. The Lock only guards the
+            check-and-reserve step; the sleep happens after it is released, so
+            concurrent waiters sleep side by side instead of queueing behind
+            whichever coroutine is currently sleeping.
+        """
+        async with self._lock:
+            current_time = self._now()
+            scheduled_time = self._reserve(current_time)
+
+        delay = scheduled_time - current_time
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def acquire_many(self, n: int) -> None:
+        """Acquire permission to make ``n`` requests at once.
+
+        Equivalent to ``n`` back-to-back acquire() calls, but the slots are
+        reserved under a single lock acquisition and clock read, and the
+        caller sleeps once, until the last slot is due. Values of ``n`` below
+        1 return immediately.
+
+        Args:
+            n: Number of requests to reserve.
         """
+        if n < 1:
+            return
         async with self._lock:
-            current_time = time.time()
+            current_time = self._now()
+            for _ in range(n):
+                scheduled_time = self._reserve(current_time)
+
+        delay = scheduled_time - current_time
+        if delay > 0:
+            await asyncio.sleep(delay)
 
-            # Remove requests older than 1 minute
+    def _reserve(self, current_time: float) -> float:
+        """Record the next free request slot and return its timestamp.
+
+        Must be called with ``self._lock`` held. The slot is appended to the
+        history straight away so later callers are scheduled after it.
+        """
+        scheduled_time = current_time
+        request_times = self.request_times
+        # Read before pruning: the previous request may be outside the RPM window
+        previous_time = request_times[-1] if request_times else None
+
+        if self._rpm_enabled:
+            # Remove requests older than 1 minute (timestamps are in order, so pop from the left)
             cutoff_time = current_time - 60.0
-            self.request_times = [t for t in self.request_times if t > cutoff_time]
+            while request_times and request_times[0] <= cutoff_time:
+                request_times.popleft()
 
             # Check requests per minute limit
-            if len(self.request_times) >= self.config.requests_per_minute:
-                sleep_time = 60.0 - (current_time - self.request_times[0])
+            if len(request_times) >= self.config.requests_per_minute:
+                scheduled_time = request_times[0] + 60.0
+                sleep_time = scheduled_time - current_time
                 if sleep_time > 0:
                     logger.warning(f"Rate limit reached, sleeping for {sleep_time:.2f} seconds")
-                    await asyncio.sleep(sleep_time)
-                    current_time = time.time()
-
-            # Check requests per second limit
-            time_since_last = current_time - self.last_request_time
-            min_interval = 1.0 / self.config.requests_per_second
 
-            if time_since_last < min_interval:
-                sleep_time = min_interval - time_since_last
-                await asyncio.sleep(sleep_time)
-                current_time = time.time()
+        # Check requests per second limit
+        if self._rps_enabled and previous_time is not None:
+            scheduled_time = max(scheduled_time, previous_time + self._min_interval)
 
-            # Record this request
-            self.request_times.append(current_time)
-            self.last_request_time = current_time
\ No newline at end of file
+        # (a no-op when both limits are disabled and the history holds nothing)
+        request_times.append(scheduled_time)
+        return scheduled_time
\ No newline at end of file
@@ -26,16 +26,25 @@ Example:
 """
 
 import asyncio
-import time
+from asyncio import sleep as _async_sleep
 from enum import Enum
 from functools import wraps
-from typing import Any, Callable, Type, Coroutine, Dict, Tuple, Optional
+from random import random as _rand
+from time import sleep as _sync_sleep
+from typing import Any, Callable, Type, Coroutine, Dict, FrozenSet, Tuple, Optional, TypeVar, cast
 from dataclasses import dataclass, field
 
 from core_lib import get_module_logger
 
 logger = get_module_logger()
 
+# Decorated callable; retry_handler preserves its signature for type checkers
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+# RetryConfig fields that determine the backoff schedule
+_DELAY_FIELDS = frozenset({"max_retries", "base_delay", "max_delay", "strategy"})
+
 
 class RetryStrategy(Enum):
     """Retry strategy options for API failures."""
@@ -44,7 +53,7 @@ class RetryStrategy(Enum):
     FIXED_DELAY = "fixed_delay"
 
 
-@dataclass
+@dataclass(slots=True)
 class RetryConfig:
     """Configuration for retry logic.
 
@@ -65,14 +74,62 @@ class RetryConfig:
     strategy: RetryStrategy = RetryStrategy.EXPONENTIAL_BACKOFF
     retry_on_exceptions: Tuple[Type[Exception], ...] = (Exception,)
     jitter_factor: float = 0.5
-
-
-def retry_handler(config: RetryConfig) -> Callable:
+    _retry_set: FrozenSet[type] = field(init=False, repr=False, compare=False)
+    _delay_table: Optional[Tuple[float, ...]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # object.__setattr__ rather than super(): slots=True rebuilds the class,
+        # which breaks the zero-argument super() cell
+        object.__setattr__(self, name, value)
+        # Keep the exact-type lookup set in sync with the public tuple
+        if name == "retry_on_exceptions":
+            object.__setattr__(self, "_retry_set", frozenset(value))
+        # Any change to the backoff parameters invalidates the precomputed delays
+        elif name in _DELAY_FIELDS:
+            object.__setattr__(self, "_delay_table", None)
+
+    def base_delay_for(self, attempt: int) -> float:
+        """Return the jitter-free delay for ``attempt``, capped at ``max_delay``.
+
+        Delays for every attempt the retry loop can reach are computed once and
+        cached; attempts beyond ``max_retries`` are computed on demand.
+        """
+        table = self._delay_table
+        if table is None:
+            table = tuple(_backoff_delay(i, self) for i in range(self.max_retries + 1))
+            object.__setattr__(self, "_delay_table", table)
+        if attempt < len(table):
+            return table[attempt]
+        return _backoff_delay(attempt, self)
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        """Return True if ``exc`` matches one of ``retry_on_exceptions``.
+
+        Exact type matches are answered with a set lookup; subclasses fall
+        back to ``isinstance`` against the configured tuple.
+        """
+        return type(exc) in self._retry_set or isinstance(exc, self.retry_on_exceptions)
+
+    def add_exceptions(self, *exception_types: Type[Exception]) -> None:
+        """Extend ``retry_on_exceptions`` with additional exception types.
+
+        Types that are already configured are skipped, so repeated calls do
+        not grow the tuple the retry loop matches against.
+        """
+        existing = set(self.retry_on_exceptions)
+        new_types = tuple(t for t in dict.fromkeys(exception_types) if t not in existing)
+        if new_types:
+            self.retry_on_exceptions = self.retry_on_exceptions + new_types
+
+
+def retry_handler(config: RetryConfig) -> Callable[[F], F]:
     """A decorator that adds retry logic to a function or coroutine.
 
-    It inspects the decorated function to determine if it is synchronous or
-    asynchronous and applies the appropriate sleep implementation (`time.sleep`
-    or `asyncio.sleep`).
+    It inspects the decorated function once, at decoration time, and returns a
+    dedicated synchronous or asynchronous wrapper that uses the appropriate
+    sleep implementation (`time.sleep` or `asyncio.sleep`). The config is read
+    on every call, so when it allows no retries the wrapper makes a single
+    attempt and skips the retry loop.
 
     Args:
         config: A `RetryConfig` instance defining the retry behavior.
@@ -81,76 +138,114 @@ def retry_handler(config: RetryConfig) -> Callable:
         A wrapper function that will retry the decorated function on failure.
     """
 
-    def decorator(func: Callable) -> Callable:
-        is_async = asyncio.iscoroutinefunction(func)
-
-        @wraps(func)
-        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            last_exception: Optional[Exception] = None
-            for attempt in range(config.max_retries + 1):
-                try:
-                    return func(*args, **kwargs)
-                except config.retry_on_exceptions as e:
-                    last_exception = e
-                    if attempt >= config.max_retries:
-                        logger.error(
-                            f"Final attempt failed for {func.__name__}. No more retries.",
-                            extra={"attempt": attempt, "max_retries": config.max_retries},
-                            exc_info=e
-                        )
-                        break  # Exit loop to re-raise
-
-                    delay = _calculate_delay(attempt, config)
-                    logger.warning(
-                        f"Attempt {attempt + 1} failed for {func.__name__}. Retrying in {delay:.2f}s.",
-                        extra={"attempt": attempt, "delay": delay},
-                        exc_info=e
-                    )
-                    time.sleep(delay)
-            raise last_exception  # type: ignore
-
-        @wraps(func)
-        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            last_exception: Optional[Exception] = None
-            for attempt in range(config.max_retries + 1):
-                try:
-                    return await func(*args, **kwargs)
-                except config.retry_on_exceptions as e:
-                    last_exception = e
-                    if attempt >= config.max_retries:
-                        logger.error(
-                            f"Final attempt failed for {func.__name__}. No more retries.",
-                            extra={"attempt": attempt, "max_retries": config.max_retries},
-                            exc_info=e
-                        )
-                        break
-
-                    delay = _calculate_delay(attempt, config)
-                    logger.warning(
-                        f"Attempt {attempt + 1} failed for {func.__name__}. Retrying in {delay:.2f}s.",
-                        extra={"attempt": attempt, "delay": delay},
-                        exc_info=e
-                    )
-                    await asyncio.sleep(delay)
-            raise last_exception  # type: ignore
-
-        return async_wrapper if is_async else sync_wrapper
+    def decorator(func: F) -> F:
+        if asyncio.iscoroutinefunction(func):
+            return cast(F, _make_async_wrapper(func, config))
+        return cast(F, _make_sync_wrapper(func, config))
 
     return decorator
 
 
+def _log_final_failure(name: str, attempt: int, max_retries: int, exc: Exception) -> None:
+    """Log the last failed attempt before the exception is re-raised."""
+    logger.error(
+        f"Final attempt failed for {name}. No more retries.",
+        extra={"attempt": attempt, "max_retries": max_retries},
+        exc_info=exc
+    )
+
+
+def _make_sync_wrapper(func: Callable[..., Any], config: RetryConfig) -> Callable[..., Any]:
+    """Build the retrying wrapper for a synchronous function."""
+    name = func.__name__
+
+    @wraps(func)
+    def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+        last_exception: Optional[Exception] = None
+        # Read once per call; non-matching exceptions skip the handler entirely
+        retry_on, max_retries = config.retry_on_exceptions, config.max_retries
+        if max_retries <= 0:
+            try:
+                return func(*args, **kwargs)
+            except retry_on as e:
+                _log_final_failure(name, 0, max_retries, e)
+                raise
+        for attempt in range(max_retries + 1):
+            try:
+                return func(*args, **kwargs)
+            except retry_on as e:
+                last_exception = e
+                if attempt >= max_retries:
+                    _log_final_failure(name, attempt, max_retries, e)
+                    break  # Exit loop to re-raise
+
+                delay = _calculate_delay(attempt, config)
+                logger.warning(
+                    f"Attempt {attempt + 1} failed for {name}. Retrying in {delay:.2f}s.",
+                    extra={"attempt": attempt, "delay": delay},
+                    exc_info=e
+                )
+                _sync_sleep(delay)
+        raise last_exception  # type: ignore
+
+    return sync_wrapper
+
+
+def _make_async_wrapper(
+    func: Callable[..., Coroutine[Any, Any, Any]], config: RetryConfig
+) -> Callable[..., Coroutine[Any, Any, Any]]:
+    """Build the retrying wrapper for a coroutine function."""
+    name = func.__name__
+
+    @wraps(func)
+    async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+        last_exception: Optional[Exception] = None
+        # Read once per call; non-matching exceptions skip the handler entirely
+        retry_on, max_retries = config.retry_on_exceptions, config.max_retries
+        if max_retries <= 0:
+            try:
+                return await func(*args, **kwargs)
+            except retry_on as e:
+                _log_final_failure(name, 0, max_retries, e)
+                raise
+        for attempt in range(max_retries + 1):
+            try:
+                return await func(*args, **kwargs)
+            except retry_on as e:
+                last_exception = e
+                if attempt >= max_retries:
+                    _log_final_failure(name, attempt, max_retries, e)
+                    break
+
+                delay = _calculate_delay(attempt, config)
+                logger.warning(
+                    f"Attempt {attempt + 1} failed for {name}. Retrying in {delay:.2f}s.",
+                    extra={"attempt": attempt, "delay": delay},
+                    exc_info=e
+                )
+                await _async_sleep(delay)
+        raise last_exception  # type: ignore
+
+    return async_wrapper
+
+
+# Uncapped delay for (attempt, base_delay), per strategy
+_STRATEGY_DELAYS: Dict[RetryStrategy, Callable[[int, float], float]] = {
+    RetryStrategy.EXPONENTIAL_BACKOFF: lambda attempt, base: base * (1 << attempt),
+    RetryStrategy.LINEAR_BACKOFF: lambda attempt, base: base * (attempt + 1),
+    RetryStrategy.FIXED_DELAY: lambda attempt, base: base,
+}
+
+
+def _backoff_delay(attempt: int, config: RetryConfig) -> float:
+    """Compute the jitter-free delay for ``attempt``, capped at ``max_delay``."""
+    delay = _STRATEGY_DELAYS[config.strategy](attempt, config.base_delay)
+    return min(config.max_delay, delay)
+
+
 def _calculate_delay(attempt: int, config: RetryConfig) -> float:
     """Calculate the sleep delay for the current retry attempt."""
-    import random
-
-    delay: float
-    if config.strategy == RetryStrategy.EXPONENTIAL_BACKOFF:
-        delay = config.base_delay * (2 ** attempt)
-    elif config.strategy == RetryStrategy.LINEAR_BACKOFF:
-        delay = config.base_delay * (attempt + 1)
-    else:  # FIXED_DELAY
-        delay = config.base_delay
+    delay = config.base_delay_for(attempt)
 
     # Apply jitter: delay * (1 + random * jitter_factor)
-    jitter = delay * config.jitter_factor * random.random()
-    return min(config.max_delay, delay + jitter)
+    return min(config.max_delay, delay * (1.0 + _rand() * config.jitter_factor))
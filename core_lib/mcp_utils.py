@@ -3,17 +3,26 @@
 This module provides utilities for MCP server configuration and setup.
 """
 import sys
+from functools import lru_cache
+from typing import Optional, Tuple
+
+_TRANSPORT_FLAG = "--transport="
+_VALID_TRANSPORTS = frozenset({"stdio", "sse", "http", "streamable-http"})
 
 
 def get_transport_from_args():
     """Check command line args for --transport=... and return the value if present, else None."""
-    for arg in sys.argv[1:]:
-        if arg.startswith("--transport="):
-            value = arg.split("=", 1)[1].strip().lower()
-            if value in {"stdio", "sse", "http", "streamable-http"}:
-                return value
-            else:
-                print(f"Invalid transport: {value}. Must be one of stdio, sse, streamable-http.")
-                sys.exit(1)
-    return None
+    return _transport_from_argv(tuple(sys.argv[1:]))
+
 
+@lru_cache(maxsize=8)
+def _transport_from_argv(argv: Tuple[str, ...]) -> Optional[str]:
+    """Resolve the transport for an argv snapshot (cached, so repeated lookups are cheap)."""
+    value = next((arg.partition("=")[2] for arg in argv if arg.startswith(_TRANSPORT_FLAG)), None)
+    if value is None:
+        return None
+    value = value.strip().lower()
+    if value in _VALID_TRANSPORTS:
+        return value
+    print(f"Invalid transport: {value}. Must be one of stdio, sse, streamable-http.")
+    sys.exit(1)
@@ -14,10 +14,14 @@ from .logging_context import (
 from .observability_models import FromMetadata, FromMetadataSchema, FROM_FIELD_DESCRIPTION, INTELLIGENCE_LEVEL_DESCRIPTION
 from .service_usage import (
     ServiceType,
+    LlmUsage,
+    UsageBatch,
     log_llm_usage,
+    log_llm_usage_batch,
     log_embedding_usage,
     log_ocr_usage,
     calculate_llm_cost,
+    calculate_llm_cost_batch,
     calculate_embedding_cost,
 )
 from .service_pricing import (
@@ -27,6 +31,9 @@ from .service_pricing import (
     get_llm_pricing,
     get_embedding_pricing,
     get_ocr_pricing,
+    set_llm_pricing,
+    set_embedding_pricing,
+    clear_pricing_cache,
 )
 
 __all__ = [
@@ -50,10 +57,14 @@ __all__ = [
     "FromMetadata",
     "FromMetadataSchema",
     "ServiceType",
+    "LlmUsage",
+    "UsageBatch",
     "log_llm_usage",
+    "log_llm_usage_batch",
     "log_embedding_usage",
     "log_ocr_usage",
     "calculate_llm_cost",
+    "calculate_llm_cost_batch",
     "calculate_embedding_cost",
     "LLM_PRICING",
     "EMBEDDING_PRICING",
@@ -61,4 +72,7 @@ __all__ = [
     "get_llm_pricing",
     "get_embedding_pricing",
     "get_ocr_pricing",
+    "set_llm_pricing",
+    "set_embedding_pricing",
+    "clear_pricing_cache",
 ]
@@ -1,9 +1,24 @@
 ﻿"""Logging handlers for core-lib.
 
-Modular logging handlers that are loaded only when needed.
+Modular logging handlers that are loaded only when needed: each handler
+module is imported on first attribute access, so enabling GELF does not
+pull in the OTLP handler (and ``requests``) and vice versa.
 """
 
-from .gelf_handler import GELFTCPHandler
-from .otlp_handler import OTLPHandler
-
 __all__ = ["GELFTCPHandler", "OTLPHandler"]
+
+
+def __getattr__(name: str):
+    if name == "GELFTCPHandler":
+        from .gelf_handler import GELFTCPHandler
+
+        return GELFTCPHandler
+    if name == "OTLPHandler":
+        from .otlp_handler import OTLPHandler
+
+        return OTLPHandler
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return __all__
@@ -0,0 +1,31 @@
+"""JSON encoding shared by the remote log handlers.
+
+Uses orjson when it is installed (``pip install core-lib[speedups]``) and
+falls back to the standard library otherwise. Both paths return UTF-8 bytes,
+ready to be written to a socket or sent as an HTTP body.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """Serialize ``obj`` to JSON bytes with orjson."""
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+
+else:
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """Serialize ``obj`` to JSON bytes with the standard library."""
+        return json.dumps(obj).encode("utf-8")
+
+
+__all__ = ["dumps_bytes"]
@@ -7,13 +7,14 @@ The handler is only imported and initialized when OVH LDP is enabled,
 minimizing overhead for applications that don't use it.
 """
 
-import json
 import logging
 import socket
 import zlib
 from logging.handlers import SocketHandler
 from typing import Dict, Optional
 
+from ._json import dumps_bytes
+
 
 class GELFTCPHandler(SocketHandler):
     """GELF (Graylog Extended Log Format) handler over TCP.
@@ -134,7 +135,7 @@ class GELFTCPHandler(SocketHandler):
             gelf_dict["_exception"] = str(record.exc_info[1])
         
         # Convert to JSON bytes
-        json_bytes = json.dumps(gelf_dict).encode("utf-8")
+        json_bytes = dumps_bytes(gelf_dict)
         
         # Compress if enabled
         if self.compress:
@@ -13,7 +13,6 @@ References:
 
 import logging
 import time
-import json
 import requests
 from typing import Dict, Any, Optional
 from logging.handlers import QueueHandler, QueueListener
@@ -22,6 +21,8 @@ import sys
 import threading
 import atexit
 
+from ._json import dumps_bytes
+
 
 class OTLPHandler(logging.Handler):
     """Handler that sends logs to an OpenTelemetry collector via OTLP/HTTP.
@@ -387,7 +388,7 @@ class _OTLPWorkerHandler(logging.Handler):
             
             response = requests.post(
                 self.endpoint,
-                json=payload,
+                data=dumps_bytes(payload),
                 headers=self.headers,
                 timeout=self.timeout,
                 verify=not self.insecure,
@@ -30,6 +30,8 @@ Notes:
  - Re-calling `setup_logging` with `force=True` allows reconfiguration (e.g. promote from
      default INFO to DEBUG after parsing CLI flags).
  - Handlers are loaded lazily - only imported when their features are enabled for better performance.
+ - GELF/OTLP handlers are reused across `force=True` reconfigurations while their settings
+     are unchanged, so repeated setup does not reopen connections or restart workers.
  - This module avoids importing application settings at import time to prevent circular imports;
      pass an `app_settings` or `logger_settings` object to `setup_logging` if you already loaded configuration.
 """
@@ -37,7 +39,8 @@ Notes:
 import logging
 import sys
 import os
-from typing import Optional, Union, Any
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 try:  # Optional â€“ settings may not be available yet
     from core_lib.config.app_settings import AppSettings  # type: ignore
@@ -57,6 +60,12 @@ _app_version: Optional[str] = None
 
 _LAST_CONFIG: dict = {}  # keep track of parameters used to configure logging
 
+# Remote (GELF/OTLP) handlers kept across reconfigurations, keyed by handler kind.
+# Each entry stores the settings the handler was built from so that calling
+# setup_logging(force=True) again with unchanged settings reuses the open
+# connection / background worker instead of creating a new one.
+_REMOTE_HANDLERS: Dict[str, Tuple[tuple, logging.Handler]] = {}
+
 
 class AppMetadataFilter(logging.Filter):
     """Logging filter that adds app name and version to log records.
@@ -92,6 +101,28 @@ class AppMetadataFilter(logging.Filter):
         return True
 
 
+def _get_remote_handler(
+    kind: str, key: tuple, factory: Callable[[], logging.Handler]
+) -> Tuple[logging.Handler, bool]:
+    """Return a cached remote handler for `key`, building it with `factory` on a miss.
+
+    A previously cached handler of the same kind built from different settings
+    is closed and replaced. Returns the handler and whether it was newly created.
+    """
+    cached = _REMOTE_HANDLERS.get(kind)
+    if cached is not None:
+        cached_key, cached_handler = cached
+        if cached_key == key:
+            return cached_handler, False
+        try:
+            cached_handler.close()
+        except Exception:
+            pass
+    handler = factory()
+    _REMOTE_HANDLERS[kind] = (key, handler)
+    return handler, True
+
+
 def _resolve_logger_name(module_name: Optional[str]) -> str:
     """Return a clean logger name without app prefix.
 
@@ -308,7 +339,7 @@ def setup_logging(
                 protocol = ovh_ldp_config.get("protocol", "gelf_tcp").lower()
                 if protocol == "gelf_tcp":
                     from .handlers.gelf_handler import GELFTCPHandler
-                    ovh_handler = GELFTCPHandler(
+                    gelf_kwargs = dict(
                         host=ovh_ldp_config["endpoint"],
                         port=ovh_ldp_config["port"],
                         token=ovh_ldp_config["token"],
@@ -317,6 +348,11 @@ def setup_logging(
                         additional_fields=ovh_ldp_config["additional_fields"],
                         timeout=ovh_ldp_config["timeout"],
                     )
+                    ovh_handler, _ = _get_remote_handler(
+                        "gelf",
+                        (GELFTCPHandler, gelf_kwargs),
+                        lambda: GELFTCPHandler(**gelf_kwargs),
+                    )
                     ovh_handler.setLevel(numeric_level)
                     handlers.append(ovh_handler)
                 else:
@@ -333,7 +369,7 @@ def setup_logging(
         if otlp_enabled:
             try:
                 from .handlers.otlp_handler import OTLPHandler
-                otlp_handler = OTLPHandler(
+                otlp_kwargs = dict(
                     endpoint=otlp_config["endpoint"],
                     headers=otlp_config["headers"],
                     timeout=otlp_config["timeout"],
@@ -341,6 +377,11 @@ def setup_logging(
                     service_name=otlp_config["service_name"],
                     service_version=otlp_config["service_version"],
                 )
+                otlp_handler, otlp_created = _get_remote_handler(
+                    "otlp",
+                    (OTLPHandler, otlp_kwargs),
+                    lambda: OTLPHandler(**otlp_kwargs),
+                )
                 # Use OTLP-specific log level if provided, otherwise use global level
                 otlp_level_str = otlp_config.get("log_level") or level
                 if isinstance(otlp_level_str, str):
@@ -348,7 +389,8 @@ def setup_logging(
                 else:
                     otlp_numeric_level = numeric_level
                 otlp_handler.setLevel(otlp_numeric_level)
-                otlp_handler.start()  # Start background worker
+                if otlp_created:
+                    otlp_handler.start()  # Start background worker
                 handlers.append(otlp_handler)
             except Exception as e:  # pragma: no cover (network edge cases)
                 logging.basicConfig()
@@ -432,6 +474,12 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
     return logging.getLogger(name)
 
 
+@lru_cache(maxsize=None)
+def _cached_logger(name: str) -> logging.Logger:
+    """Memoised logging.getLogger (which takes the logging module lock on every call)."""
+    return logging.getLogger(name)
+
+
 # Convenience function for getting logger with caller's name
 def get_module_logger() -> logging.Logger:
     """Return a logger for the calling module without side-effects.
@@ -443,14 +491,11 @@ def get_module_logger() -> logging.Logger:
     Logger names are kept clean (just module paths) while app metadata
     (client.app.name, client.app.version) is injected via AppMetadataFilter.
     """
-    import inspect
-
-    frame = inspect.currentframe().f_back
-    module_name = frame.f_globals.get("__name__", "unknown")
+    module_name = sys._getframe(1).f_globals.get("__name__", "unknown")
     
     # Return logger with clean module name (no app prefix)
     # App metadata is added by AppMetadataFilter as attributes
-    return logging.getLogger(_resolve_logger_name(module_name))
+    return _cached_logger(_resolve_logger_name(module_name))
 
 
 def get_last_logging_config() -> dict:
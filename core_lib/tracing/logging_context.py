@@ -28,14 +28,74 @@ The context is stored in thread-local storage and automatically added
 to all log records emitted within the context block.
 """
 
-import json
 import logging
 import threading
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Callable, Mapping, Optional, Tuple
 from contextvars import ContextVar
 
-# Thread-safe context storage using contextvars (works with asyncio)
-_logging_context: ContextVar[Dict[str, Any]] = ContextVar('logging_context', default={})
+from pydantic import TypeAdapter, ValidationError
+
+# Map from_ fields to OpenTelemetry semantic conventions
+# See: https://opentelemetry.io/docs/specs/semconv/
+_CONTEXT_ATTRIBUTES = (
+    ('session_id', 'session.id'),
+    ('user_id', 'user.id'),
+    ('user_name', 'user.name'),
+    ('company_id', 'organization.id'),
+    ('company_name', 'organization.name'),
+    ('app_name', 'client.app.name'),
+    ('app_version', 'client.app.version'),
+    ('model_name', 'gen_ai.request.model'),
+)
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Thread-safe context storage using contextvars (works with asyncio).
+# Holds a read-only (context, log attributes) pair: the attributes are mapped
+# once when the context changes instead of on every log record.
+_logging_context: ContextVar[Tuple[Mapping[str, Any], Mapping[str, Any]]] = ContextVar(
+    'logging_context', default=(_EMPTY, _EMPTY)
+)
+
+
+def _freeze_context(context: Dict[str, Any]) -> Tuple[Mapping[str, Any], Mapping[str, Any]]:
+    """Build the read-only (context, log attributes) pair stored in the ContextVar."""
+    attrs = {}
+    for key, attr in _CONTEXT_ATTRIBUTES:
+        value = context.get(key)
+        if value:
+            attrs[attr] = value
+    if context.get('intelligence_level') is not None:
+        attrs['intelligence.level'] = context['intelligence_level']
+    return MappingProxyType(context), MappingProxyType(attrs)
+
+
+# Parses and type-checks a JSON object in one pass (pydantic-core's jiter parser)
+_JSON_OBJECT_ADAPTER = TypeAdapter(Dict[str, Any])
+
+
+def _parse_from_dict(from_: dict) -> dict:
+    return from_ or {}
+
+
+def _parse_from_str(from_: str) -> dict:
+    if not from_:
+        return {}
+    try:
+        return _JSON_OBJECT_ADAPTER.validate_json(from_)
+    except ValidationError:
+        return {}
+
+
+def _parse_from_other(from_: Any) -> dict:
+    return {}
+
+
+_FROM_PARSERS: Dict[type, Callable[[Any], dict]] = {
+    dict: _parse_from_dict,
+    str: _parse_from_str,
+}
 
 
 def parse_from(from_: str | dict | None) -> dict:
@@ -62,20 +122,11 @@ def parse_from(from_: str | dict | None) -> dict:
             logger.info("Request processing")  # Includes user.id and session.id
         ```
     """
-    from_dict = None
-    if from_:
-        try:
-            if isinstance(from_, str):
-                # If from_ is a string, try to parse it as JSON
-                from_dict = json.loads(from_)
-            elif isinstance(from_, dict):
-                # If from_ is already a dict, use it directly
-                from_dict = from_
-            else:
-                raise ValueError("from_ must be a JSON string or a dictionary.")
-        except Exception:
-            from_dict = None
-    return from_dict or {}
+    parser = _FROM_PARSERS.get(type(from_))
+    if parser is None:
+        # Dict subclasses (e.g. OrderedDict) miss the exact-type lookup
+        parser = _parse_from_dict if isinstance(from_, dict) else _parse_from_other
+    return parser(from_)
 
 
 class LoggingContextFilter(logging.Filter):
@@ -97,43 +148,13 @@ class LoggingContextFilter(logging.Filter):
         Returns:
             True (always pass the record through)
         """
-        # Get current context
-        context = _logging_context.get()
+        context, attrs = _logging_context.get()
         
         if context:
             # Add context to extra_attrs for OTLP handler
             if not hasattr(record, 'extra_attrs'):
                 record.extra_attrs = {}
-            
-            # Map from_ fields to OpenTelemetry semantic conventions
-            # See: https://opentelemetry.io/docs/specs/semconv/
-            
-            if 'session_id' in context and context['session_id']:
-                record.extra_attrs['session.id'] = context['session_id']
-            
-            if 'user_id' in context and context['user_id']:
-                record.extra_attrs['user.id'] = context['user_id']
-            
-            if 'user_name' in context and context['user_name']:
-                record.extra_attrs['user.name'] = context['user_name']
-            
-            if 'company_id' in context and context['company_id']:
-                record.extra_attrs['organization.id'] = context['company_id']
-            
-            if 'company_name' in context and context['company_name']:
-                record.extra_attrs['organization.name'] = context['company_name']
-            
-            if 'app_name' in context and context['app_name']:
-                record.extra_attrs['client.app.name'] = context['app_name']
-            
-            if 'app_version' in context and context['app_version']:
-                record.extra_attrs['client.app.version'] = context['app_version']
-            
-            if 'model_name' in context and context['model_name']:
-                record.extra_attrs['gen_ai.request.model'] = context['model_name']
-            
-            if 'intelligence_level' in context and context['intelligence_level'] is not None:
-                record.extra_attrs['intelligence.level'] = context['intelligence_level']
+            record.extra_attrs.update(attrs)
         
         return True
 
@@ -174,13 +195,13 @@ class LoggingContext:
     def __enter__(self):
         """Enter the context and set logging metadata."""
         # Get current context (may be empty or from outer context)
-        self.previous_context = _logging_context.get().copy()
+        self.previous_context = _logging_context.get()[0]
         
         # Merge new context with previous (new context takes precedence)
         merged_context = {**self.previous_context, **self.context}
         
         # Set the new context
-        self.token = _logging_context.set(merged_context)
+        self.token = _logging_context.set(_freeze_context(merged_context))
         
         return self
     
@@ -197,7 +218,7 @@ def get_current_logging_context() -> Dict[str, Any]:
     Returns:
         Dictionary of current context metadata
     """
-    return _logging_context.get().copy()
+    return dict(_logging_context.get()[0])
 
 
 def set_logging_context(**kwargs):
@@ -215,9 +236,9 @@ def set_logging_context(**kwargs):
         logger.info("User logged in")  # Includes user.id and session.id
         ```
     """
-    current = _logging_context.get().copy()
+    current = dict(_logging_context.get()[0])
     current.update(kwargs)
-    _logging_context.set(current)
+    _logging_context.set(_freeze_context(current))
 
 
 def clear_logging_context():
@@ -225,7 +246,7 @@ def clear_logging_context():
     
     Useful for cleanup or testing.
     """
-    _logging_context.set({})
+    _logging_context.set((_EMPTY, _EMPTY))
 
 
 # Convenience function to install the filter
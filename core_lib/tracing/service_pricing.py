@@ -9,6 +9,9 @@ All prices in USD.
 Last updated: October 31, 2025
 """
 
+import re
+from functools import lru_cache
+
 # LLM Pricing per 1K tokens (USD)
 # Format: {"model-name": {"input": price_per_1k, "output": price_per_1k}}
 LLM_PRICING = {
@@ -134,15 +137,11 @@ def get_llm_pricing(model: str) -> dict:
     model_key = model.lower()
     
     # Try exact match first
-    if model_key in LLM_PRICING:
-        return LLM_PRICING[model_key]
-    
-    # Try partial match for model families
-    for known_model, pricing in LLM_PRICING.items():
-        if known_model in model_key or model_key.startswith(known_model.split("-")[0]):
-            return pricing
+    pricing = LLM_PRICING.get(model_key)
+    if pricing is not None:
+        return pricing
     
-    return None
+    return _match_llm_pricing(model_key)
 
 
 def get_embedding_pricing(model: str) -> float:
@@ -157,17 +156,95 @@ def get_embedding_pricing(model: str) -> float:
     model_key = model.lower()
     
     # Try exact match first
-    if model_key in EMBEDDING_PRICING:
-        return EMBEDDING_PRICING[model_key]
-    
-    # Try partial match
-    for known_model, price in EMBEDDING_PRICING.items():
-        if known_model in model_key or model_key.startswith(known_model.split("-")[0]):
-            return price
+    price = EMBEDDING_PRICING.get(model_key)
+    if price is not None:
+        return price
     
+    return _match_embedding_pricing(model_key)
+
+
+# Partial matches are resolved with regexes compiled once from the pricing tables,
+# and results are memoized per model name. Providers report a handful of distinct
+# model names, which keeps the caches small. After editing the pricing tables at
+# runtime, call clear_pricing_cache() (or use the set_*_pricing() helpers).
+
+def _compile_partial(table: dict) -> tuple:
+    """Compile the partial-match patterns for a pricing table.
+
+    Returns ``(known_re, family_re, families)``: ``known_re`` finds any known
+    model name inside a model string, longest name first; ``family_re`` matches
+    a family prefix (e.g. "gpt") at the start of a model string, and
+    ``families`` maps each family to the first entry of the table using it.
+    """
+    families: dict = {}
+    for known_model, pricing in table.items():
+        families.setdefault(known_model.split("-")[0], pricing)
+
+    def alternation(names):
+        return "|".join(re.escape(name) for name in sorted(names, key=len, reverse=True))
+
+    return re.compile(alternation(table)), re.compile(alternation(families)), families
+
+
+_LLM_PATTERNS = _compile_partial(LLM_PRICING)
+_EMBEDDING_PATTERNS = _compile_partial(EMBEDDING_PRICING)
+
+
+@lru_cache(maxsize=256)
+def _match_llm_pricing(model_key: str) -> dict:
+    """Return the LLM pricing entry that partially matches ``model_key``."""
+    return _match_partial(LLM_PRICING, _LLM_PATTERNS, model_key)
+
+
+@lru_cache(maxsize=256)
+def _match_embedding_pricing(model_key: str) -> float:
+    """Return the embedding price that partially matches ``model_key``."""
+    return _match_partial(EMBEDDING_PRICING, _EMBEDDING_PATTERNS, model_key)
+
+
+def _match_partial(table: dict, patterns: tuple, model_key: str):
+    """Match a known model name inside ``model_key``, else its family prefix (e.g. "gpt-")."""
+    known_re, family_re, families = patterns
+    match = known_re.search(model_key)
+    if match is not None:
+        return table[match.group()]
+    match = family_re.match(model_key)
+    if match is not None:
+        return families[match.group()]
     return None
 
 
+# Callbacks run by clear_pricing_cache(), for caches derived from these tables elsewhere
+_cache_clear_hooks: list = []
+
+
+def clear_pricing_cache() -> None:
+    """Drop every cached pricing lookup after the pricing tables were edited.
+    
+    Needed when changing the price of a model that was already looked up, or
+    when a new model should also be found by partial (dated/prefixed) names.
+    """
+    global _LLM_PATTERNS, _EMBEDDING_PATTERNS
+    _LLM_PATTERNS = _compile_partial(LLM_PRICING)
+    _EMBEDDING_PATTERNS = _compile_partial(EMBEDDING_PRICING)
+    _match_llm_pricing.cache_clear()
+    _match_embedding_pricing.cache_clear()
+    for hook in _cache_clear_hooks:
+        hook()
+
+
+def set_llm_pricing(model: str, input_price: float, output_price: float) -> None:
+    """Add or update the price of an LLM model (USD per 1K tokens) at runtime."""
+    LLM_PRICING[model.lower()] = {"input": input_price, "output": output_price}
+    clear_pricing_cache()
+
+
+def set_embedding_pricing(model: str, price: float) -> None:
+    """Add or update the price of an embedding model (USD per 1K tokens) at runtime."""
+    EMBEDDING_PRICING[model.lower()] = price
+    clear_pricing_cache()
+
+
 def get_ocr_pricing(provider: str, model: str) -> dict:
     """Get pricing for an OCR service.
     
@@ -190,4 +267,7 @@ __all__ = [
     "get_llm_pricing",
     "get_embedding_pricing",
     "get_ocr_pricing",
+    "set_llm_pricing",
+    "set_embedding_pricing",
+    "clear_pricing_cache",
 ]
@@ -43,15 +43,47 @@ The logs are sent to OpenSearch with structured attributes that enable queries l
 - Performance metrics (latency, tokens per second)
 """
 
+import logging
+import math
+import os
 import time
-from typing import Any, Dict, Optional
+from dataclasses import dataclass
 from enum import Enum
+from random import random as _rand
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
 
 from .logger import get_module_logger
-from .service_pricing import get_llm_pricing, get_embedding_pricing
+from .service_pricing import _cache_clear_hooks, get_llm_pricing, get_embedding_pricing
 
 logger = get_module_logger()
 
+# Level of the usage events, checked up front by every log_*_usage call
+_INFO = logging.INFO
+
+
+def _make_sampler(raw: Optional[str]) -> Callable[[], bool]:
+    """Build the sampling decision for usage events from a rate in [0, 1].
+    
+    Invalid or missing values keep every event, so sampling is strictly opt-in.
+    """
+    try:
+        rate = float(raw) if raw else 1.0
+    except ValueError:
+        rate = 1.0
+    if rate >= 1.0:
+        return lambda: True
+    if rate <= 0.0:
+        return lambda: False
+    return lambda: _rand() < rate
+
+
+# Fraction of usage events to keep (SERVICE_USAGE_SAMPLE_RATE, default 1.0).
+# Checked before any cost lookup, so dropped events cost almost nothing.
+_sample = _make_sampler(os.getenv("SERVICE_USAGE_SAMPLE_RATE"))
+
 
 class ServiceType(str, Enum):
     """Types of AI services tracked."""
@@ -60,6 +92,35 @@ class ServiceType(str, Enum):
     OCR = "ocr"
 
 
+# OTLP-friendly string form of a boolean flag, indexed by bool
+_BOOLSTR = ("false", "true")
+
+# service.type values, resolved from the enum once
+_LLM = ServiceType.LLM.value
+_EMBEDDING = ServiceType.EMBEDDING.value
+_OCR = ServiceType.OCR.value
+
+
+@dataclass(slots=True)
+class LlmUsage:
+    """Typed usage record for one LLM call.
+    
+    Kept slotted and compact so callers can buffer many records cheaply; it is
+    turned into the OTLP ``extra_attrs`` dict only when the event is logged.
+    """
+    provider: str
+    model: str
+    input_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+    total_tokens: Optional[int] = None
+    latency_ms: Optional[float] = None
+    structured: bool = False
+    has_tools: bool = False
+    search_grounding: bool = False
+    cost_usd: float = 0.0
+    error: Optional[str] = None
+
+
 def calculate_llm_cost(
     provider: str,
     model: str,
@@ -77,16 +138,89 @@ def calculate_llm_cost(
     Returns:
         Estimated cost in USD
     """
-    pricing = get_llm_pricing(model)
+    prices = _resolve_llm_price(model)
     
-    if pricing is None:
+    if prices is None:
         # Unknown model, return 0 and log warning
         logger.debug(f"No pricing data for model: {model} (provider: {provider})")
         return 0.0
     
-    input_cost = (input_tokens / 1000.0) * pricing["input"]
-    output_cost = (output_tokens / 1000.0) * pricing["output"]
-    return input_cost + output_cost
+    input_price, output_price = prices
+    return input_tokens * input_price + output_tokens * output_price
+
+
+# Per-token prices of the models seen so far; emptied by clear_pricing_cache()
+_LLM_PRICES: Dict[str, Tuple[float, float]] = {}
+_cache_clear_hooks.append(_LLM_PRICES.clear)
+
+
+def _resolve_llm_price(model: str) -> Optional[Tuple[float, float]]:
+    """Return the (input, output) price per token for ``model``, or None.
+    
+    Pricing only depends on the model name, and a service sees few distinct
+    names, so the lookup (including partial family matches) is memoized. The
+    per-1K table prices are converted once here, leaving a multiply per call.
+    Unknown models are not memoized, so models added to LLM_PRICING later
+    are priced on their next call.
+    """
+    prices = _LLM_PRICES.get(model)
+    if prices is None:
+        pricing = get_llm_pricing(model)
+        if pricing is None:
+            return None
+        prices = _LLM_PRICES[model] = (pricing["input"] / 1000.0, pricing["output"] / 1000.0)
+    return prices
+
+
+# Per-token prices of the embedding models seen so far; emptied by clear_pricing_cache()
+_EMBEDDING_PRICES: Dict[str, float] = {}
+_cache_clear_hooks.append(_EMBEDDING_PRICES.clear)
+
+
+def _resolve_embedding_price(model: str) -> Optional[float]:
+    """Return the price per token for embedding ``model``, or None (unknown models are not memoized)."""
+    price = _EMBEDDING_PRICES.get(model)
+    if price is None:
+        price_per_1k = get_embedding_pricing(model)
+        if price_per_1k is None:
+            return None
+        price = _EMBEDDING_PRICES[model] = price_per_1k / 1000.0
+    return price
+
+
+def calculate_llm_cost_batch(
+    provider: str,
+    model: str,
+    input_tokens: Sequence[int],
+    output_tokens: Sequence[int],
+) -> "np.ndarray":
+    """Calculate LLM costs for many requests against the same model at once.
+    
+    The pricing lookup happens once and the per-request costs are computed
+    as a single vectorized expression, which is much cheaper than calling
+    calculate_llm_cost() in a loop for cost rollups.
+    
+    Args:
+        provider: Provider name (e.g., "openai", "google-gemini")
+        model: Model name
+        input_tokens: Input token counts, one per request
+        output_tokens: Output token counts, one per request
+        
+    Returns:
+        Float array of estimated costs in USD (zeros for unknown models)
+    """
+    import numpy as np  # Imported lazily: tracing is loaded by every core_lib import
+    
+    inputs = np.asarray(input_tokens, dtype=np.float64)
+    outputs = np.asarray(output_tokens, dtype=np.float64)
+    prices = _resolve_llm_price(model)
+    
+    if prices is None:
+        logger.debug(f"No pricing data for model: {model} (provider: {provider})")
+        return np.zeros(np.broadcast(inputs, outputs).shape)
+    
+    input_price, output_price = prices
+    return inputs * input_price + outputs * output_price
 
 
 def calculate_embedding_cost(
@@ -104,13 +238,13 @@ def calculate_embedding_cost(
     Returns:
         Estimated cost in USD
     """
-    price_per_1k = get_embedding_pricing(model)
+    price = _resolve_embedding_price(model)
     
-    if price_per_1k is None:
+    if price is None:
         logger.debug(f"No pricing data for embedding model: {model} (provider: {provider})")
         return 0.0
     
-    return (input_tokens / 1000.0) * price_per_1k
+    return input_tokens * price
 
 
 def log_llm_usage(
@@ -158,6 +292,11 @@ def log_llm_usage(
         )
         ```
     """
+    # Usage events are INFO records; skip building them when nobody will see
+    # them or when the sampler drops this one
+    if not logger.isEnabledFor(_INFO) or not _sample():
+        return
+    
     # Calculate total if not provided
     if total_tokens is None and input_tokens is not None and output_tokens is not None:
         total_tokens = input_tokens + output_tokens
@@ -167,60 +306,175 @@ def log_llm_usage(
     if input_tokens is not None and output_tokens is not None:
         cost = calculate_llm_cost(provider, model, input_tokens, output_tokens)
     
-    # Build structured event
+    record = LlmUsage(
+        provider, model, input_tokens, output_tokens, total_tokens, latency_ms,
+        structured, has_tools, search_grounding, cost, error,
+    )
+    
+    # Log as INFO level with extra_attrs
+    # The LoggingContextFilter will automatically add user_id, session_id, etc.
+    # The OTLPHandler will send this to OpenSearch
+    # %-style arguments: the message is only rendered when a handler formats
+    # the record (for OTLP, on its background worker thread)
+    logger.info(
+        "LLM usage: %s/%s - %s tokens, $%.6f",
+        provider, model, total_tokens or 0, cost,
+        extra={"extra_attrs": _llm_attrs(record, metadata)}
+    )
+
+
+def _llm_attrs(record: LlmUsage, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Build the structured ``extra_attrs`` event for an LLM usage record."""
+    model = record.model
+    provider = record.provider
+    
+    # Build structured event; the always-present fields go in one dict display
     event = {
-        "service.type": ServiceType.LLM.value,
+        "service.type": _LLM,
         "service.provider": provider,
         "service.model": model,
         "gen_ai.request.model": model,  # OpenTelemetry semantic convention
         "gen_ai.system": provider,
+        # Feature flags - booleans as strings for OTLP compatibility
+        "features.structured_output": _BOOLSTR[bool(record.structured)],
+        "features.tools": _BOOLSTR[bool(record.has_tools)],
+        "features.search_grounding": _BOOLSTR[bool(record.search_grounding)],
     }
     
+    input_tokens = record.input_tokens
     if input_tokens is not None:
         event["gen_ai.usage.input_tokens"] = input_tokens
         event["tokens.input"] = input_tokens
     
+    output_tokens = record.output_tokens
     if output_tokens is not None:
         event["gen_ai.usage.output_tokens"] = output_tokens
         event["tokens.output"] = output_tokens
     
+    total_tokens = record.total_tokens
     if total_tokens is not None:
         event["tokens.total"] = total_tokens
     
+    latency_ms = record.latency_ms
     if latency_ms is not None:
         event["latency_ms"] = latency_ms
         # Calculate tokens per second if we have the data
         if total_tokens and latency_ms > 0:
-            event["tokens_per_second"] = (total_tokens / latency_ms) * 1000
-    
-    if cost > 0:
-        event["cost_usd"] = round(cost, 6)
+            event["tokens_per_second"] = total_tokens * 1000.0 / latency_ms
     
-    # Feature flags - convert booleans to strings for OTLP compatibility
-    event["features.structured_output"] = str(structured).lower()
-    event["features.tools"] = str(has_tools).lower()
-    event["features.search_grounding"] = str(search_grounding).lower()
+    if record.cost_usd > 0:
+        event["cost_usd"] = round(record.cost_usd, 6)
     
     # Add custom metadata
     if metadata:
         for key, value in metadata.items():
             # Avoid overwriting standard fields
             if key not in event:
-                event[f"custom.{key}"] = value
+                event["custom." + key] = value
     
-    if error:
-        event["error"] = error
+    if record.error:
+        event["error"] = record.error
         event["status"] = "error"
     else:
         event["status"] = "success"
     
-    # Log as INFO level with extra_attrs
-    # The LoggingContextFilter will automatically add user_id, session_id, etc.
-    # The OTLPHandler will send this to OpenSearch
-    logger.info(
-        f"LLM usage: {provider}/{model} - {total_tokens or 0} tokens, ${cost:.6f}",
-        extra={"extra_attrs": event}
-    )
+    return event
+
+
+class UsageBatch:
+    """Preallocated buffer of LLM usage rows for scatter-gather calls.
+    
+    Token counts live in one contiguous ``(capacity, 3)`` int32 array
+    (input, output, total) instead of three Python ints per record, so costs
+    for the whole batch are computed with a single vectorized expression.
+    Each concurrent task writes its own row with record(); the batch is then
+    logged in one go with log_llm_usage_batch().
+    """
+    
+    __slots__ = ("providers", "models", "tokens", "latency_ms", "n")
+    
+    def __init__(self, capacity: int):
+        import numpy as np  # Imported lazily: tracing is loaded by every core_lib import
+        
+        self.providers: List[Optional[str]] = [None] * capacity
+        self.models: List[Optional[str]] = [None] * capacity
+        self.tokens = np.zeros((capacity, 3), dtype=np.int32)
+        self.latency_ms = np.full(capacity, np.nan)
+        self.n = 0
+    
+    def record(
+        self,
+        idx: int,
+        provider: str,
+        model: str,
+        input_tokens: int,
+        output_tokens: int,
+        latency_ms: Optional[float] = None,
+    ) -> None:
+        """Store the usage of one call in row ``idx``."""
+        self.providers[idx] = provider
+        self.models[idx] = model
+        self.tokens[idx] = (input_tokens, output_tokens, input_tokens + output_tokens)
+        if latency_ms is not None:
+            self.latency_ms[idx] = latency_ms
+        if idx >= self.n:
+            self.n = idx + 1
+    
+    def costs(self) -> "np.ndarray":
+        """Estimated cost in USD of every recorded row (zero for unknown models)."""
+        import numpy as np
+        
+        prices = np.array(
+            [(model and _resolve_llm_price(model)) or (0.0, 0.0) for model in self.models[:self.n]],
+            dtype=np.float64,
+        ).reshape(self.n, 2)
+        return (self.tokens[:self.n, :2] * prices).sum(axis=1)
+    
+    def clear(self) -> None:
+        """Forget all recorded rows so the buffer can be reused."""
+        n = self.n
+        self.providers[:n] = [None] * n
+        self.models[:n] = [None] * n
+        self.tokens[:n] = 0
+        self.latency_ms[:n] = float("nan")
+        self.n = 0
+
+
+def log_llm_usage_batch(batch: UsageBatch, metadata: Optional[Dict[str, Any]] = None) -> None:
+    """Log every recorded row of ``batch`` as an LLM usage event, then clear it.
+    
+    Emits the same events as calling log_llm_usage() per row, but prices the
+    whole batch at once. Rows that were never recorded are skipped.
+    
+    Args:
+        batch: Buffer filled with UsageBatch.record()
+        metadata: Additional context attached to every event
+    """
+    if not logger.isEnabledFor(_INFO) or not batch.n:
+        batch.clear()
+        return
+    
+    costs = batch.costs().tolist()
+    tokens = batch.tokens[:batch.n].tolist()
+    latencies = batch.latency_ms[:batch.n].tolist()
+    
+    for provider, model, (input_tokens, output_tokens, total_tokens), latency_ms, cost in zip(
+        batch.providers, batch.models, tokens, latencies, costs
+    ):
+        if model is None or not _sample():
+            continue
+        record = LlmUsage(
+            provider, model, input_tokens, output_tokens, total_tokens,
+            None if math.isnan(latency_ms) else latency_ms,
+            cost_usd=cost,
+        )
+        logger.info(
+            "LLM usage: %s/%s - %s tokens, $%.6f",
+            provider, model, total_tokens, cost,
+            extra={"extra_attrs": _llm_attrs(record, metadata)}
+        )
+    
+    batch.clear()
 
 
 def log_embedding_usage(
@@ -257,12 +511,15 @@ def log_embedding_usage(
         )
         ```
     """
+    if not logger.isEnabledFor(_INFO) or not _sample():
+        return
+    
     cost = 0.0
     if input_tokens is not None:
         cost = calculate_embedding_cost(provider, model, input_tokens)
     
     event = {
-        "service.type": ServiceType.EMBEDDING.value,
+        "service.type": _EMBEDDING,
         "service.provider": provider,
         "service.model": model,
         "gen_ai.request.model": model,
@@ -282,7 +539,7 @@ def log_embedding_usage(
     if latency_ms is not None:
         event["latency_ms"] = latency_ms
         if num_texts and latency_ms > 0:
-            event["texts_per_second"] = (num_texts / latency_ms) * 1000
+            event["texts_per_second"] = num_texts * 1000.0 / latency_ms
     
     if cost > 0:
         event["cost_usd"] = round(cost, 6)
@@ -290,7 +547,7 @@ def log_embedding_usage(
     if metadata:
         for key, value in metadata.items():
             if key not in event:
-                event[f"custom.{key}"] = value
+                event["custom." + key] = value
     
     if error:
         event["error"] = error
@@ -299,7 +556,8 @@ def log_embedding_usage(
         event["status"] = "success"
     
     logger.info(
-        f"Embedding usage: {provider}/{model} - {num_texts or 0} texts, {input_tokens or 0} tokens, ${cost:.6f}",
+        "Embedding usage: %s/%s - %s texts, %s tokens, $%.6f",
+        provider, model, num_texts or 0, input_tokens or 0, cost,
         extra={"extra_attrs": event}
     )
 
@@ -337,8 +595,11 @@ def log_ocr_usage(
         )
         ```
     """
+    if not logger.isEnabledFor(_INFO) or not _sample():
+        return
+    
     event = {
-        "service.type": ServiceType.OCR.value,
+        "service.type": _OCR,
         "service.provider": provider,
         "service.model": model,
     }
@@ -352,7 +613,7 @@ def log_ocr_usage(
     if latency_ms is not None:
         event["latency_ms"] = latency_ms
         if num_pages and latency_ms > 0:
-            event["pages_per_second"] = (num_pages / latency_ms) * 1000
+            event["pages_per_second"] = num_pages * 1000.0 / latency_ms
     
     if cost_override is not None:
         event["cost_usd"] = round(cost_override, 6)
@@ -360,7 +621,7 @@ def log_ocr_usage(
     if metadata:
         for key, value in metadata.items():
             if key not in event:
-                event[f"custom.{key}"] = value
+                event["custom." + key] = value
     
     if error:
         event["error"] = error
@@ -368,18 +629,29 @@ def log_ocr_usage(
     else:
         event["status"] = "success"
     
-    cost_str = f"${cost_override:.6f}" if cost_override else "unknown cost"
-    logger.info(
-        f"OCR usage: {provider}/{model} - {num_pages or 0} pages, {cost_str}",
-        extra={"extra_attrs": event}
-    )
+    if cost_override:
+        logger.info(
+            "OCR usage: %s/%s - %s pages, $%.6f",
+            provider, model, num_pages or 0, cost_override,
+            extra={"extra_attrs": event}
+        )
+    else:
+        logger.info(
+            "OCR usage: %s/%s - %s pages, unknown cost",
+            provider, model, num_pages or 0,
+            extra={"extra_attrs": event}
+        )
 
 
 __all__ = [
     "ServiceType",
+    "LlmUsage",
+    "UsageBatch",
     "log_llm_usage",
+    "log_llm_usage_batch",
     "log_embedding_usage",
     "log_ocr_usage",
     "calculate_llm_cost",
+    "calculate_llm_cost_batch",
     "calculate_embedding_cost",
 ]
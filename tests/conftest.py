@@ -4,15 +4,29 @@
 # plugin is not installed. This ensures repository tests still run in
 # minimal environments while preserving compatibility with pytest-asyncio
 # when it is available.
+#
+# When uvloop is installed (POSIX only) it is used as the event loop policy,
+# which makes the many short-lived loops created by asyncio.run() (e.g. the
+# sync rate-limiter bridge in the LLM providers) cheaper to spin up.
 
 import inspect
 import asyncio
 import logging
+import os
+import sys
 from typing import Any
 import pytest
 
 logger = logging.getLogger("core_lib.tests")
 
+if sys.platform != "win32":
+    try:
+        import uvloop  # type: ignore
+    except ImportError:  # pragma: no cover - optional speedup
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 
 def pytest_configure(config: Any) -> None:
     config.addinivalue_line(
@@ -20,6 +34,34 @@ def pytest_configure(config: Any) -> None:
     )
 
 
+@pytest.fixture
+def setenv_bulk():
+    """Set several environment variables at once; originals are restored after the test."""
+    saved = {}
+
+    def _setenv(**env: Any) -> None:
+        for key in env:
+            saved.setdefault(key, os.environ.get(key))
+        os.environ.update({key: str(value) for key, value in env.items()})
+
+    yield _setenv
+    for key, value in saved.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
+
+
+@pytest.fixture
+def empty_env():
+    """Start the test from an empty os.environ (yielded for updates); restored in one batch after."""
+    saved = os.environ.copy()
+    os.environ.clear()
+    yield os.environ
+    os.environ.clear()
+    os.environ.update(saved)
+
+
 def pytest_pyfunc_call(pyfuncitem):  # type: ignore
     """Fallback async test runner.
 
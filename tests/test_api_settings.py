@@ -20,6 +20,7 @@ from core_lib.config.api_settings import ApiSettings
 from core_lib.config.base_settings import SettingsError
 from core_lib.config.cache_settings import CacheSettings
 from core_lib.config.tracing_settings import TracingSettings
+from core_lib.config.logger_settings import LoggerSettings
 from core_lib.config.mcp_settings import MCPServerSettings
 from core_lib.config.fastapi_settings import FastAPIServerSettings
 
@@ -462,6 +463,36 @@ class TestApiSettingsValidation:
             
             assert settings.is_valid is True
             settings.validate()  # Should not raise
+    
+    def test_validation_reuses_logger_result(self):
+        """Test logger settings are not re-validated by the parent settings."""
+        logger_settings = LoggerSettings(log_level="DEBUG")
+        
+        with patch.object(LoggerSettings, "validate") as mock_validate:
+            settings = ApiSettings(logger=logger_settings, enable_logger=True)
+        
+        mock_validate.assert_not_called()
+        assert settings.is_valid is True
+    
+    def test_validation_reports_invalid_logger(self):
+        """Test an invalid logger configuration invalidates the parent settings."""
+        settings = ApiSettings(logger=LoggerSettings(log_level="LOUD"), enable_logger=True)
+        
+        assert settings.is_valid is False
+        assert "Invalid log level 'LOUD'" in settings.validation_errors[0]
+    
+    def test_validation_preserves_section_error_code(self):
+        """Test the nested section's SettingsError is raised with its code intact."""
+        error = SettingsError("Logger misconfigured", code="logger_misconfigured")
+        
+        with patch.object(LoggerSettings, "validate", side_effect=error):
+            settings = ApiSettings(logger=LoggerSettings(), enable_logger=True)
+            
+            with pytest.raises(SettingsError) as excinfo:
+                settings.validate()
+        
+        assert excinfo.value.code == "logger_misconfigured"
+        assert str(excinfo.value) == "Logger misconfigured"
 
 
 class TestApiSettingsAsDictIntegration:
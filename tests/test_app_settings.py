@@ -86,3 +86,21 @@ def test_app_settings_log_level(monkeypatch, tmp_path: Path):
     monkeypatch.setenv("LOG_LEVEL", "warning")
     s_warn = AppSettings.from_env(app_name="x", project_root=tmp_path, load_dotenv=False)
     assert s_warn.log_level == "WARNING"
+
+
+def test_app_settings_rereads_edited_pyproject(tmp_path: Path):
+    # Parsed pyproject data is cached, but an edit to the file must be picked up
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text("[project]\nname='x'\nversion='1.0.0'\n")
+    assert AppSettings.from_env(project_root=tmp_path, load_dotenv=False).version == "1.0.0"
+
+    pyproject.write_text("[project]\nname='x'\nversion='1.0.10'\n")
+    assert AppSettings.from_env(project_root=tmp_path, load_dotenv=False).version == "1.0.10"
+
+
+def test_app_settings_interns_enum_like_fields():
+    # Equal environment/log level values built at runtime share one string object
+    a = AppSettings(app_name="x", environment="".join(["prod", "uction"]), log_level="".join(["IN", "FO"]))
+    b = AppSettings(app_name="x", environment="".join(["produ", "ction"]), log_level="".join(["I", "NFO"]))
+    assert a.environment is b.environment
+    assert a.log_level is b.log_level
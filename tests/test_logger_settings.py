@@ -1,5 +1,6 @@
 """Tests for LoggerSettings and OVH LDP integration."""
 
+import logging
 import os
 import pytest
 from unittest.mock import MagicMock, patch
@@ -23,16 +24,29 @@ class TestLoggerSettings:
         assert settings.ovh_ldp_use_tls is True
         assert settings.ovh_ldp_compress is True
     
-    def test_logger_settings_from_env(self, monkeypatch):
+    def test_logger_settings_normalises_level_and_protocol(self):
+        """Test that log level and protocol are case-normalised."""
+        settings = LoggerSettings(
+            log_level="debug", ovh_ldp_protocol="GELF_UDP", otlp_log_level="warning"
+        )
+        
+        assert settings.log_level == "DEBUG"
+        assert settings.otlp_log_level == "WARNING"
+        assert settings.ovh_ldp_protocol == "gelf_udp"
+        assert settings.is_valid
+    
+    def test_logger_settings_from_env(self, setenv_bulk):
         """Test loading LoggerSettings from environment variables."""
-        monkeypatch.setenv("LOG_LEVEL", "DEBUG")
-        monkeypatch.setenv("LOG_FILE_ENABLED", "true")
-        monkeypatch.setenv("LOG_FILE_PATH", "logs/test.log")
-        monkeypatch.setenv("OVH_LDP_ENABLED", "true")
-        monkeypatch.setenv("OVH_LDP_TOKEN", "test-token")
-        monkeypatch.setenv("OVH_LDP_ENDPOINT", "gra1.logs.ovh.com")
-        monkeypatch.setenv("OVH_LDP_PORT", "12345")
-        monkeypatch.setenv("OVH_LDP_PROTOCOL", "gelf_udp")
+        setenv_bulk(
+            LOG_LEVEL="DEBUG",
+            LOG_FILE_ENABLED="true",
+            LOG_FILE_PATH="logs/test.log",
+            OVH_LDP_ENABLED="true",
+            OVH_LDP_TOKEN="test-token",
+            OVH_LDP_ENDPOINT="gra1.logs.ovh.com",
+            OVH_LDP_PORT="12345",
+            OVH_LDP_PROTOCOL="gelf_udp",
+        )
         
         settings = LoggerSettings.from_env(load_dotenv=False)
         
@@ -45,6 +59,16 @@ class TestLoggerSettings:
         assert settings.ovh_ldp_port == 12345
         assert settings.ovh_ldp_protocol == "gelf_udp"
     
+    def test_logger_settings_from_env_skips_dotenv(self, monkeypatch):
+        """Test that load_dotenv=False never touches .env files."""
+        monkeypatch.setenv("LOG_LEVEL", "WARNING")
+        
+        with patch("core_lib.config.base_settings.DotEnvLoader.load_dotenv_files") as mock_load:
+            settings = LoggerSettings.from_env(load_dotenv=False)
+        
+        mock_load.assert_not_called()
+        assert settings.log_level == "WARNING"
+    
     def test_logger_settings_additional_fields_parsing(self, monkeypatch):
         """Test parsing of additional fields from JSON."""
         monkeypatch.setenv("OVH_LDP_ADDITIONAL_FIELDS", '{"env": "prod", "version": "1.0"}')
@@ -62,6 +86,14 @@ class TestLoggerSettings:
         # Should default to empty dict on invalid JSON
         assert settings.ovh_ldp_additional_fields == {}
     
+    def test_logger_settings_non_object_json_headers(self, monkeypatch):
+        """Test that JSON values other than objects are ignored."""
+        monkeypatch.setenv("OTLP_HEADERS", '["Authorization", "Bearer token"]')
+        
+        settings = LoggerSettings.from_env(load_dotenv=False)
+        
+        assert settings.otlp_headers == {}
+    
     def test_logger_settings_validation_invalid_log_level(self):
         """Test validation rejects invalid log level."""
         with pytest.raises(SettingsError, match="Invalid log level"):
@@ -136,14 +168,16 @@ class TestLoggerSettings:
         assert settings.otlp_insecure is False
         assert settings.otlp_service_name == "core-lib"
     
-    def test_logger_settings_otlp_from_env(self, monkeypatch):
+    def test_logger_settings_otlp_from_env(self, setenv_bulk):
         """Test loading OTLP settings from environment variables."""
-        monkeypatch.setenv("OTLP_ENABLED", "true")
-        monkeypatch.setenv("OTLP_ENDPOINT", "http://otel-collector:4318/v1/logs")
-        monkeypatch.setenv("OTLP_HEADERS", '{"Authorization": "Bearer token123"}')
-        monkeypatch.setenv("OTLP_TIMEOUT", "15")
-        monkeypatch.setenv("OTLP_SERVICE_NAME", "my-service")
-        monkeypatch.setenv("OTLP_SERVICE_VERSION", "1.0.0")
+        setenv_bulk(
+            OTLP_ENABLED="true",
+            OTLP_ENDPOINT="http://otel-collector:4318/v1/logs",
+            OTLP_HEADERS='{"Authorization": "Bearer token123"}',
+            OTLP_TIMEOUT="15",
+            OTLP_SERVICE_NAME="my-service",
+            OTLP_SERVICE_VERSION="1.0.0",
+        )
         
         settings = LoggerSettings.from_env(load_dotenv=False)
         
@@ -155,10 +189,43 @@ class TestLoggerSettings:
         assert settings.otlp_service_version == "1.0.0"
 
 
+GELF_HANDLER = "core_lib.tracing.handlers.gelf_handler.GELFTCPHandler"
+OTLP_HANDLER = "core_lib.tracing.handlers.otlp_handler.OTLPHandler"
+
+
+@pytest.fixture(scope="class")
+def _patched_handlers():
+    """Patch the remote logging handler classes once for a whole test class."""
+    with pytest.MonkeyPatch.context() as mp:
+        mocks = {GELF_HANDLER: MagicMock(), OTLP_HANDLER: MagicMock()}
+        for target, mock in mocks.items():
+            mp.setattr(target, mock)
+        yield mocks
+
+
+@pytest.fixture
+def handler_mocks(_patched_handlers, monkeypatch):
+    """Reset the shared handler mocks and the setup_logging handler cache per test."""
+    monkeypatch.setattr("core_lib.tracing.logger._REMOTE_HANDLERS", {})
+    for mock in _patched_handlers.values():
+        mock.reset_mock()
+        mock.return_value.level = logging.NOTSET
+    return _patched_handlers
+
+
+@pytest.fixture
+def mock_gelf_handler(handler_mocks):
+    return handler_mocks[GELF_HANDLER]
+
+
+@pytest.fixture
+def mock_otlp_handler(handler_mocks):
+    return handler_mocks[OTLP_HANDLER]
+
+
 class TestLoggerIntegration:
     """Tests for logger integration with OVH LDP."""
     
-    @patch('core_lib.tracing.handlers.gelf_handler.GELFTCPHandler')
     def test_setup_logging_with_ovh_ldp(self, mock_gelf_handler):
         """Test setup_logging with OVH LDP enabled."""
         from core_lib.tracing.logger import setup_logging
@@ -195,6 +262,25 @@ class TestLoggerIntegration:
         
         assert logger is not None
     
+    def test_setup_logging_reuses_gelf_handler(self, mock_gelf_handler):
+        """Test that reconfiguring with unchanged settings reuses the GELF handler."""
+        from core_lib.tracing.logger import setup_logging
+        
+        logger_settings = LoggerSettings(
+            ovh_ldp_enabled=True,
+            ovh_ldp_token="test-token",
+            ovh_ldp_endpoint="gra1.logs.ovh.com",
+        )
+        
+        setup_logging(app_name="test_app", logger_settings=logger_settings, force=True)
+        setup_logging(app_name="test_app", logger_settings=logger_settings, force=True)
+        assert mock_gelf_handler.call_count == 1
+        
+        changed = logger_settings.merge(ovh_ldp_token="other-token")
+        setup_logging(app_name="test_app", logger_settings=changed, force=True)
+        assert mock_gelf_handler.call_count == 2
+        mock_gelf_handler.return_value.close.assert_called_once()
+    
     def test_setup_logging_without_ovh_ldp(self):
         """Test setup_logging works without OVH LDP."""
         from core_lib.tracing.logger import setup_logging
@@ -227,14 +313,11 @@ class TestLoggerIntegration:
         # Logger should be at DEBUG level
         assert logger.level == 10  # DEBUG = 10
     
-    @patch('core_lib.tracing.handlers.otlp_handler.OTLPHandler')
     def test_setup_logging_with_otlp(self, mock_otlp_handler):
         """Test setup_logging with OTLP enabled."""
         from core_lib.tracing.logger import setup_logging
         
-        # Create a mock handler instance
-        mock_handler_instance = MagicMock()
-        mock_otlp_handler.return_value = mock_handler_instance
+        mock_handler_instance = mock_otlp_handler.return_value
         
         logger_settings = LoggerSettings(
             log_level="INFO",
@@ -296,6 +379,18 @@ class TestStandardSettingsWithLogger:
         assert settings.logger.ovh_ldp_enabled is True
         assert settings.logger.ovh_ldp_token == "token"
     
+    def test_standard_settings_explicit_enable_logger_wins(self, monkeypatch):
+        """Test that ENABLE_LOGGER=false overrides logger auto-detection."""
+        monkeypatch.setenv("ENABLE_LOGGER", "false")
+        monkeypatch.setenv("OVH_LDP_ENABLED", "true")
+        
+        from core_lib.config import StandardSettings
+        
+        settings = StandardSettings.from_env(load_dotenv=False)
+        
+        assert settings.enable_logger is False
+        assert settings.logger is None
+    
     def test_standard_settings_logger_disabled_by_default(self):
         """Test that logger is not enabled by default."""
         from core_lib.config import StandardSettings
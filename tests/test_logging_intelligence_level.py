@@ -13,6 +13,11 @@ from core_lib.tracing import (
 )
 
 
+def _by_message(records):
+    """Index captured log records by their formatted message."""
+    return {record.getMessage(): record for record in records}
+
+
 @pytest.fixture
 def app_with_logging():
     """Create a test FastAPI app with middleware and logging configured."""
@@ -55,12 +60,7 @@ def test_logging_includes_intelligence_level(app_with_logging, caplog):
         assert len(caplog.records) > 0
         
         # Find the "Test log message" record
-        log_record = None
-        for record in caplog.records:
-            if "Test log message" in record.message:
-                log_record = record
-                break
-        
+        log_record = _by_message(caplog.records).get("Test log message")
         assert log_record is not None, "Test log message not found in captured logs"
         
         # Verify the record has extra_attrs with intelligence_level
@@ -83,12 +83,7 @@ def test_logging_includes_from_fields_and_intelligence_level(app_with_logging, c
         assert response.status_code == 200
         
         # Find the "Test log message" record
-        log_record = None
-        for record in caplog.records:
-            if "Test log message" in record.message:
-                log_record = record
-                break
-        
+        log_record = _by_message(caplog.records).get("Test log message")
         assert log_record is not None, "Test log message not found in captured logs"
         
         # Verify the record has all expected attributes
@@ -99,5 +94,18 @@ def test_logging_includes_from_fields_and_intelligence_level(app_with_logging, c
         assert log_record.extra_attrs['intelligence.level'] == 7
 
 
+
+def test_context_filter_uses_snapshot_of_context():
+    """Test that mutating the returned context does not leak into log records."""
+    from core_lib.tracing import LoggingContext
+    
+    with LoggingContext({"user_id": "user123", "intelligence_level": 0}):
+        get_current_logging_context()["user_id"] = "changed"
+        record = logging.LogRecord("test_app", logging.INFO, __file__, 1, "msg", None, None)
+        assert LoggingContextFilter().filter(record) is True
+    
+    assert record.extra_attrs == {"user.id": "user123", "intelligence.level": 0}
+    assert get_current_logging_context() == {}
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -20,6 +20,12 @@ class TestMcpUtils(unittest.TestCase):
         self.assertEqual(parse_from(None), {})
         self.assertEqual(parse_from(123), {})
         self.assertEqual(parse_from('{bad json}'), {})
+        self.assertEqual(parse_from('[1, 2]'), {})
+
+    def test_parse_from_dict_subclass(self):
+        from collections import OrderedDict
+        d = OrderedDict(foo=1)
+        self.assertIs(parse_from(d), d)
 
     def test_get_transport_from_args(self):
         orig_argv = sys.argv
@@ -31,7 +37,18 @@ class TestMcpUtils(unittest.TestCase):
         self.assertEqual(get_transport_from_args(), 'streamable-http')
         sys.argv = ['prog']
         self.assertIsNone(get_transport_from_args())
+        sys.argv = ['prog', '--transport=SSE ', '--transport=stdio']
+        self.assertEqual(get_transport_from_args(), 'sse')
         sys.argv = orig_argv
 
+    def test_get_transport_from_args_invalid(self):
+        orig_argv = sys.argv
+        sys.argv = ['prog', '--transport=carrier-pigeon']
+        try:
+            with self.assertRaises(SystemExit):
+                get_transport_from_args()
+        finally:
+            sys.argv = orig_argv
+
 if __name__ == '__main__':
     unittest.main()
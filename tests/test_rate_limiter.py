@@ -3,7 +3,7 @@
 import pytest
 import asyncio
 import time
-from unittest.mock import patch, AsyncMock, MagicMock
+from unittest.mock import patch, MagicMock
 
 from core_lib.llm.rate_limiter import RateLimitConfig, RateLimiter
 
@@ -33,33 +33,40 @@ class TestRateLimitConfig:
 class TestRateLimiter:
     """Test RateLimiter class."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_rate_limiter_initialization(self):
         """Test that RateLimiter initializes correctly."""
         config = RateLimitConfig(requests_per_minute=100, requests_per_second=2.0)
         limiter = RateLimiter(config)
         
         assert limiter.config == config
-        assert limiter.request_times == []
-        assert limiter.last_request_time == 0.0
+        assert len(limiter.request_times) == 0
         assert limiter._lock is not None
 
-    @pytest.mark.asyncio
+    def test_get_shared_returns_same_instance(self):
+        """Test that limiters registered under the same key are shared."""
+        config = RateLimitConfig(requests_per_minute=100, requests_per_second=2.0)
+        
+        shared = RateLimiter.get_shared("test-shared", config)
+        assert RateLimiter.get_shared("test-shared", config) is shared
+        assert RateLimiter.get_shared("test-shared-other", config) is not shared
+
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_single_request_no_delay(self):
         """Test that first request passes without delay."""
         config = RateLimitConfig(requests_per_minute=60, requests_per_second=1.0)
         limiter = RateLimiter(config)
         
-        start_time = time.time()
+        start_time = time.monotonic()
         await limiter.acquire()
-        end_time = time.time()
+        end_time = time.monotonic()
         
         # Should be nearly instantaneous
         assert end_time - start_time < 0.1
         assert len(limiter.request_times) == 1
-        assert limiter.last_request_time > 0
+        assert limiter.request_times[-1] >= start_time
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_requests_per_second_limit(self):
         """Test that requests per second limit is enforced."""
         config = RateLimitConfig(requests_per_minute=3600, requests_per_second=2.0)  # High RPM, low RPS
@@ -78,20 +85,16 @@ class TestRateLimiter:
             call_args = mock_sleep.call_args[0][0]
             assert 0.4 < call_args < 0.6  # Allow some tolerance
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_requests_per_minute_limit(self):
         """Test that requests per minute limit is enforced."""
         config = RateLimitConfig(requests_per_minute=2, requests_per_second=10.0)  # Low RPM, high RPS
-        limiter = RateLimiter(config)
         
-        # Mock time to control the clock
+        # Fake clock to control time
         mock_time = 1000.0
+        limiter = RateLimiter(config, clock=lambda: mock_time)
         
-        def mock_time_func():
-            return mock_time
-        
-        with patch('time.time', side_effect=mock_time_func), \
-             patch('asyncio.sleep') as mock_sleep:
+        with patch('asyncio.sleep') as mock_sleep:
             
             # First two requests should pass
             await limiter.acquire()
@@ -109,38 +112,60 @@ class TestRateLimiter:
             sleep_calls = [call.args[0] for call in mock_sleep.call_args_list]
             rpm_sleep_found = any(29 < sleep_time < 31 for sleep_time in sleep_calls)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_old_requests_cleaned_up(self):
         """Test that old request timestamps are cleaned up."""
         config = RateLimitConfig(requests_per_minute=10, requests_per_second=10.0)
-        limiter = RateLimiter(config)
         
-        # Mock time to control aging
+        # Fake clock to control aging
         mock_time = 1000.0
+        limiter = RateLimiter(config, clock=lambda: mock_time)
         
-        def mock_time_func():
-            nonlocal mock_time
-            return mock_time
+        # Make several requests
+        await limiter.acquire()
+        mock_time += 10
+        await limiter.acquire()
+        mock_time += 10
+        await limiter.acquire()
         
-        with patch('time.time', side_effect=mock_time_func):
-            # Make several requests
-            await limiter.acquire()
-            mock_time += 10
-            await limiter.acquire()
-            mock_time += 10
-            await limiter.acquire()
-            
-            assert len(limiter.request_times) == 3
-            
-            # Advance time by more than 60 seconds
-            mock_time += 65
-            await limiter.acquire()
-            
-            # Old requests should be cleaned up, only the latest should remain
-            assert len(limiter.request_times) == 1
-            assert limiter.request_times[0] == mock_time
+        assert len(limiter.request_times) == 3
+        
+        # Advance time by more than 60 seconds
+        mock_time += 65
+        await limiter.acquire()
+        
+        # Old requests should be cleaned up, only the latest should remain
+        assert len(limiter.request_times) == 1
+        assert limiter.request_times[0] == mock_time
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_history_bounded_by_rpm(self):
+        """Test that the request history never grows past requests_per_minute."""
+        config = RateLimitConfig(requests_per_minute=3, requests_per_second=100.0)
+        limiter = RateLimiter(config)
+        
+        with patch('asyncio.sleep'):
+            for _ in range(10):
+                await limiter.acquire()
+        
+        assert len(limiter.request_times) == 3
+        assert limiter.request_times.maxlen == 3
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_rps_only_skips_rpm_bookkeeping(self):
+        """Test that a disabled RPM limit keeps only the latest request time."""
+        config = RateLimitConfig(requests_per_minute=0, requests_per_second=2.0)
+        limiter = RateLimiter(config)
+        
+        with patch('asyncio.sleep') as mock_sleep:
+            for _ in range(3):
+                await limiter.acquire()
+        
+        assert len(limiter.request_times) == 1
+        # The RPS interval is still enforced
+        assert mock_sleep.call_count == 2
+
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_concurrent_requests(self):
         """Test that concurrent requests are handled correctly."""
         config = RateLimitConfig(requests_per_minute=100, requests_per_second=5.0)
@@ -159,13 +184,44 @@ class TestRateLimiter:
         # All requests should complete
         assert results == [0, 1, 2, 3, 4]
         
-        # Some requests should have been delayed (due to RPS limit)
-        assert mock_sleep.call_count >= 3  # At least some delays
+        # Waiters sleep in parallel, each until its own slot (0.2s apart),
+        # rather than each waiting one interval behind the previous sleeper
+        delays = sorted(call.args[0] for call in mock_sleep.call_args_list)
+        assert delays == pytest.approx([0.2, 0.4, 0.6, 0.8], abs=0.05)
         
         # All requests should be recorded
         assert len(limiter.request_times) == 5
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_concurrent_waiters_do_not_serialize(self):
+        """Test that concurrent waiters finish within the RPS schedule."""
+        rps = 5.0
+        config = RateLimitConfig(requests_per_minute=100, requests_per_second=rps)
+        limiter = RateLimiter(config)
+        
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(5)))
+        elapsed = time.monotonic() - start
+        
+        assert elapsed <= 4 / rps + 0.15
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_acquire_many_batches(self):
+        """Test that acquire_many reserves a batch with one clock read and one sleep."""
+        config = RateLimitConfig(requests_per_minute=100, requests_per_second=5.0)
+        clock = MagicMock(return_value=1000.0)
+        limiter = RateLimiter(config, clock=clock)
+        
+        with patch('asyncio.sleep') as mock_sleep:
+            await limiter.acquire_many(5)
+        
+        # Same schedule as five acquire() calls: the last slot is 4 intervals out
+        assert clock.call_count == 1
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args.args[0] == pytest.approx(0.8)
+        assert list(limiter.request_times) == pytest.approx([1000.0, 1000.2, 1000.4, 1000.6, 1000.8])
+
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_warning_logged_on_rpm_limit(self):
         """Test that warning is logged when RPM limit is hit."""
         config = RateLimitConfig(requests_per_minute=1, requests_per_second=10.0)
@@ -187,7 +243,7 @@ class TestRateLimiter:
             assert "Rate limit reached" in warning_call
             assert "sleeping for" in warning_call
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_zero_rps_edge_case(self):
         """Test edge case with very low RPS."""
         config = RateLimitConfig(requests_per_minute=60, requests_per_second=0.1)  # 1 request per 10 seconds
@@ -206,7 +262,7 @@ class TestRateLimiter:
 class TestRateLimiterIntegration:
     """Integration tests for rate limiter."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_real_time_behavior(self):
         """Test rate limiter with real time (short duration)."""
         # Use very permissive limits for fast test
@@ -231,19 +287,13 @@ class TestRateLimiterIntegration:
         # All requests should be recorded
         assert len(limiter.request_times) == 3
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_mixed_rpm_and_rps_limits(self):
         """Test scenario where both RPM and RPS limits come into play."""
         config = RateLimitConfig(requests_per_minute=3, requests_per_second=2.0)
-        limiter = RateLimiter(config)
-        
-        mock_time = 1000.0
-        
-        def mock_time_func():
-            return mock_time
+        limiter = RateLimiter(config, clock=lambda: 1000.0)
         
-        with patch('time.time', side_effect=mock_time_func), \
-             patch('asyncio.sleep') as mock_sleep:
+        with patch('asyncio.sleep') as mock_sleep:
             
             # First 3 requests fill up the RPM quota
             await limiter.acquire()
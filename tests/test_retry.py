@@ -1,10 +1,7 @@
 """Tests for retry functionality."""
 
 import pytest
-import time
-import asyncio
-from unittest.mock import patch, MagicMock, call
-from typing import Any
+from unittest.mock import patch, call
 
 from core_lib.llm.retry import (
     RetryConfig,
@@ -54,6 +51,29 @@ class TestRetryConfig:
         assert config.retry_on_exceptions == (ValueError, TypeError)
         assert config.jitter_factor == 0.2
 
+    def test_add_exceptions_skips_duplicates(self):
+        """Test that add_exceptions appends only new exception types."""
+        config = RetryConfig(retry_on_exceptions=(ValueError,))
+        config.add_exceptions(TypeError, ValueError, TypeError)
+        assert config.retry_on_exceptions == (ValueError, TypeError)
+
+        config.add_exceptions(ValueError)
+        assert config.retry_on_exceptions == (ValueError, TypeError)
+
+    def test_is_retryable(self):
+        """Test exact-type and subclass matching, including after reassignment."""
+        config = RetryConfig(retry_on_exceptions=(CustomRetryableError, OSError))
+        assert config.is_retryable(CustomRetryableError("x"))
+        assert config.is_retryable(ConnectionError("subclass of OSError"))
+        assert not config.is_retryable(NonRetryableError("x"))
+
+        config.retry_on_exceptions = (NonRetryableError,)
+        assert config.is_retryable(NonRetryableError("x"))
+        assert not config.is_retryable(CustomRetryableError("x"))
+
+        config.add_exceptions(CustomRetryableError)
+        assert config.is_retryable(CustomRetryableError("x"))
+
 
 class TestCalculateDelay:
     """Test delay calculation functions."""
@@ -111,6 +131,15 @@ class TestCalculateDelay:
         delay = _calculate_delay(10, config)  # Would be 1024 without capping
         assert delay == 5.0
 
+    def test_delay_table_follows_config_changes(self):
+        """Test that precomputed delays are rebuilt when the config changes."""
+        config = RetryConfig(base_delay=1.0, jitter_factor=0.0)
+        assert _calculate_delay(2, config) == 4.0
+        
+        config.base_delay = 2.0
+        config.strategy = RetryStrategy.LINEAR_BACKOFF
+        assert _calculate_delay(2, config) == 6.0
+
     def test_jitter_adds_randomness(self):
         """Test that jitter adds randomness to delays."""
         config = RetryConfig(
@@ -148,6 +177,47 @@ class TestRetryHandlerSync:
         assert result == "success"
         assert call_count == 1
 
+    def test_zero_retries_single_attempt_logs_failure(self):
+        """Test that a config without retries makes one attempt and still logs the failure."""
+        call_count = 0
+
+        @retry_handler(RetryConfig(max_retries=0, retry_on_exceptions=(ValueError,)))
+        def failing_func():
+            nonlocal call_count
+            call_count += 1
+            raise ValueError("boom")
+
+        with patch('core_lib.llm.retry._sync_sleep') as mock_sleep, \
+             patch('core_lib.llm.retry.logger') as mock_logger:
+            with pytest.raises(ValueError, match="boom"):
+                failing_func()
+
+        assert call_count == 1
+        mock_sleep.assert_not_called()
+        mock_logger.error.assert_called_once()
+        assert "Final attempt failed for failing_func" in mock_logger.error.call_args[0][0]
+
+    def test_max_retries_read_per_call(self):
+        """Test that raising max_retries after decoration takes effect."""
+        config = RetryConfig(max_retries=0, retry_on_exceptions=(ValueError,))
+        call_count = 0
+
+        @retry_handler(config)
+        def flaky_func():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 3:
+                raise ValueError("transient")
+            return "success"
+
+        with pytest.raises(ValueError):
+            flaky_func()
+
+        config.max_retries = 2
+        with patch('core_lib.llm.retry._sync_sleep'):
+            assert flaky_func() == "success"
+        assert call_count == 3
+
     def test_retry_on_configured_exception(self):
         """Test retry behavior on configured exceptions."""
         config = RetryConfig(
@@ -165,7 +235,7 @@ class TestRetryHandlerSync:
                 raise CustomRetryableError(f"Attempt {call_count}")
             return "success"
         
-        with patch('time.sleep') as mock_sleep:
+        with patch('core_lib.llm.retry._sync_sleep') as mock_sleep:
             result = flaky_func()
             
         assert result == "success"
@@ -187,12 +257,13 @@ class TestRetryHandlerSync:
             call_count += 1
             raise CustomRetryableError(f"Attempt {call_count}")
         
-        with patch('time.sleep'):
+        with patch('core_lib.llm.retry._sync_sleep') as mock_sleep:
             with pytest.raises(CustomRetryableError) as exc_info:
                 always_fail_func()
             
         assert "Attempt 3" in str(exc_info.value)  # Final attempt
         assert call_count == 3  # Initial + 2 retries
+        assert mock_sleep.call_count == 2  # No sleep after the final attempt
 
     def test_non_retryable_exception_not_retried(self):
         """Test that non-configured exceptions are not retried."""
@@ -225,7 +296,7 @@ class TestRetryHandlerSync:
         def logged_func():
             raise CustomRetryableError("Test error")
         
-        with patch('time.sleep'), \
+        with patch('core_lib.llm.retry._sync_sleep'), \
              patch('core_lib.llm.retry.logger') as mock_logger:
             
             with pytest.raises(CustomRetryableError):
@@ -246,7 +317,7 @@ class TestRetryHandlerSync:
 class TestRetryHandlerAsync:
     """Test retry_handler decorator with asynchronous functions."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_async_successful_function_no_retry(self):
         """Test that successful async functions are not retried."""
         config = RetryConfig(max_retries=3)
@@ -262,7 +333,7 @@ class TestRetryHandlerAsync:
         assert result == "async success"
         assert call_count == 1
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_async_retry_on_exception(self):
         """Test async retry behavior on configured exceptions."""
         config = RetryConfig(
@@ -280,14 +351,14 @@ class TestRetryHandlerAsync:
                 raise CustomRetryableError(f"Async attempt {call_count}")
             return "async success"
         
-        with patch('asyncio.sleep') as mock_sleep:
+        with patch('core_lib.llm.retry._async_sleep') as mock_sleep:
             result = await async_flaky_func()
             
         assert result == "async success"
         assert call_count == 3  # Initial + 2 retries
         assert mock_sleep.call_count == 2  # Sleep called for each retry
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_async_exhaust_retries_and_fail(self):
         """Test async behavior when all retries are exhausted."""
         config = RetryConfig(
@@ -303,7 +374,7 @@ class TestRetryHandlerAsync:
             call_count += 1
             raise CustomRetryableError(f"Async attempt {call_count}")
         
-        with patch('asyncio.sleep'):
+        with patch('core_lib.llm.retry._async_sleep'):
             with pytest.raises(CustomRetryableError) as exc_info:
                 await async_always_fail_func()
             
@@ -335,7 +406,7 @@ class TestRetryIntegration:
             def failing_func():
                 raise CustomRetryableError("Always fails")
             
-            with patch('time.sleep') as mock_sleep:
+            with patch('core_lib.llm.retry._sync_sleep') as mock_sleep:
                 with pytest.raises(CustomRetryableError):
                     failing_func()
                 
@@ -359,7 +430,7 @@ class TestRetryIntegration:
                 raise CustomRetryableError("First call fails")
             return f"result: {arg1}, {arg2}, {kwarg1}"
         
-        with patch('time.sleep'):
+        with patch('core_lib.llm.retry._sync_sleep'):
             result = func_with_args("test1", "test2", kwarg1="test3")
         
         assert result == "result: test1, test2, test3"
@@ -1,16 +1,75 @@
 """Tests for service usage tracking functionality."""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from dataclasses import dataclass
+from unittest.mock import patch
+
+from core_lib.tracing import service_usage
+from core_lib.tracing.service_pricing import (
+    EMBEDDING_PRICING,
+    LLM_PRICING,
+    clear_pricing_cache,
+    set_embedding_pricing,
+    set_llm_pricing,
+)
 from core_lib.tracing.service_usage import (
+    LlmUsage,
+    UsageBatch,
     log_llm_usage,
+    log_llm_usage_batch,
     log_embedding_usage,
     log_ocr_usage,
     calculate_llm_cost,
+    calculate_llm_cost_batch,
     calculate_embedding_cost,
 )
 
 
+@dataclass(slots=True)
+class LogCall:
+    """One recorded logger.info call."""
+    msg: str
+    args: tuple
+    extra_attrs: dict
+
+    @property
+    def message(self) -> str:
+        """The %-style message rendered with its arguments."""
+        return self.msg % self.args
+
+
+class FakeLogger:
+    """Minimal logger stand-in recording info calls as LogCall."""
+    __slots__ = ("calls", "enabled")
+
+    def __init__(self):
+        self.calls = []
+        self.enabled = True
+
+    def isEnabledFor(self, level):
+        return self.enabled
+
+    def info(self, msg, *args, extra):
+        self.calls.append(LogCall(msg, args, extra["extra_attrs"]))
+
+    def debug(self, *args, **kwargs):
+        pass
+
+
+@pytest.fixture
+def fake_logger(monkeypatch):
+    """Replace the module logger with a FakeLogger."""
+    fake = FakeLogger()
+    monkeypatch.setattr(service_usage, "logger", fake)
+    return fake
+
+
+@pytest.fixture
+def rec_logger(fake_logger):
+    """The LogCall records of the info calls made through the fake logger."""
+    return fake_logger.calls
+
+
 def test_calculate_llm_cost_known_model():
     """Test cost calculation for known models."""
     # GPT-4: $0.03 input, $0.06 output per 1K tokens
@@ -25,6 +84,17 @@ def test_calculate_llm_cost_unknown_model():
     assert cost == 0.0
 
 
+def test_calculate_llm_cost_batch_matches_scalar():
+    """Batch cost calculation matches the scalar function per request."""
+    inputs, outputs = [100, 2000, 0], [50, 0, 700]
+    costs = calculate_llm_cost_batch("openai", "gpt-5-mini", inputs, outputs)
+    expected = [calculate_llm_cost("openai", "gpt-5-mini", i, o) for i, o in zip(inputs, outputs)]
+    assert costs.tolist() == pytest.approx(expected, rel=1e-9)
+    
+    unknown = calculate_llm_cost_batch("custom", "unknown-model", inputs, outputs)
+    assert unknown.tolist() == [0.0, 0.0, 0.0]
+
+
 def test_calculate_embedding_cost_known_model():
     """Test cost calculation for known embedding models."""
     # text-embedding-3-small: $0.00002 per 1K tokens
@@ -39,8 +109,7 @@ def test_calculate_embedding_cost_unknown_model():
     assert cost == 0.0
 
 
-@patch('core_lib.tracing.service_usage.logger')
-def test_log_llm_usage_success(mock_logger):
+def test_log_llm_usage_success(rec_logger):
     """Test logging LLM usage with valid data."""
     log_llm_usage(
         provider="openai",
@@ -55,18 +124,17 @@ def test_log_llm_usage_success(mock_logger):
     )
     
     # Verify logger.info was called
-    assert mock_logger.info.called
-    call_args = mock_logger.info.call_args
+    assert rec_logger
+    call = rec_logger[-1]
     
     # Check message format
-    message = call_args[0][0]
+    message = call.message
     assert "openai" in message
     assert "gpt-4o-mini" in message
     assert "150" in message  # Total tokens
     
     # Check extra_attrs
-    extra = call_args[1]['extra']
-    attrs = extra['extra_attrs']
+    attrs = call.extra_attrs
     
     assert attrs['service.type'] == 'llm'
     assert attrs['service.provider'] == 'openai'
@@ -81,8 +149,7 @@ def test_log_llm_usage_success(mock_logger):
     assert 'cost_usd' in attrs
 
 
-@patch('core_lib.tracing.service_usage.logger')
-def test_log_llm_usage_with_error(mock_logger):
+def test_log_llm_usage_with_error(rec_logger):
     """Test logging LLM usage with error."""
     log_llm_usage(
         provider="openai",
@@ -90,17 +157,14 @@ def test_log_llm_usage_with_error(mock_logger):
         error="Authentication failed",
     )
     
-    assert mock_logger.info.called
-    call_args = mock_logger.info.call_args
-    extra = call_args[1]['extra']
-    attrs = extra['extra_attrs']
+    assert rec_logger
+    attrs = rec_logger[-1].extra_attrs
     
     assert attrs['status'] == 'error'
     assert attrs['error'] == 'Authentication failed'
 
 
-@patch('core_lib.tracing.service_usage.logger')
-def test_log_embedding_usage_success(mock_logger):
+def test_log_embedding_usage_success(rec_logger):
     """Test logging embedding usage with valid data."""
     log_embedding_usage(
         provider="openai",
@@ -111,16 +175,15 @@ def test_log_embedding_usage_success(mock_logger):
         latency_ms=250,
     )
     
-    assert mock_logger.info.called
-    call_args = mock_logger.info.call_args
+    assert rec_logger
+    call = rec_logger[-1]
     
-    message = call_args[0][0]
+    message = call.message
     assert "openai" in message
     assert "text-embedding-3-small" in message
     assert "10" in message  # num_texts
     
-    extra = call_args[1]['extra']
-    attrs = extra['extra_attrs']
+    attrs = call.extra_attrs
     
     assert attrs['service.type'] == 'embedding'
     assert attrs['service.provider'] == 'openai'
@@ -133,8 +196,7 @@ def test_log_embedding_usage_success(mock_logger):
     assert 'cost_usd' in attrs
 
 
-@patch('core_lib.tracing.service_usage.logger')
-def test_log_ocr_usage_success(mock_logger):
+def test_log_ocr_usage_success(rec_logger):
     """Test logging OCR usage with valid data."""
     log_ocr_usage(
         provider="azure-di",
@@ -144,15 +206,14 @@ def test_log_ocr_usage_success(mock_logger):
         cost_override=0.05,
     )
     
-    assert mock_logger.info.called
-    call_args = mock_logger.info.call_args
+    assert rec_logger
+    call = rec_logger[-1]
     
-    message = call_args[0][0]
+    message = call.message
     assert "azure-di" in message
     assert "5" in message  # num_pages
     
-    extra = call_args[1]['extra']
-    attrs = extra['extra_attrs']
+    attrs = call.extra_attrs
     
     assert attrs['service.type'] == 'ocr'
     assert attrs['service.provider'] == 'azure-di'
@@ -163,8 +224,7 @@ def test_log_ocr_usage_success(mock_logger):
     assert attrs['status'] == 'success'
 
 
-@patch('core_lib.tracing.service_usage.logger')
-def test_log_llm_usage_with_metadata(mock_logger):
+def test_log_llm_usage_with_metadata(rec_logger):
     """Test logging LLM usage with custom metadata."""
     log_llm_usage(
         provider="openai",
@@ -174,17 +234,14 @@ def test_log_llm_usage_with_metadata(mock_logger):
         metadata={"endpoint": "/api/chat", "version": "v2"},
     )
     
-    call_args = mock_logger.info.call_args
-    extra = call_args[1]['extra']
-    attrs = extra['extra_attrs']
+    attrs = rec_logger[-1].extra_attrs
     
     # Custom metadata should be prefixed
     assert attrs['custom.endpoint'] == '/api/chat'
     assert attrs['custom.version'] == 'v2'
 
 
-@patch('core_lib.tracing.service_usage.logger')
-def test_log_embedding_usage_with_error(mock_logger):
+def test_log_embedding_usage_with_error(rec_logger):
     """Test logging embedding usage with error."""
     log_embedding_usage(
         provider="infinity",
@@ -193,14 +250,47 @@ def test_log_embedding_usage_with_error(mock_logger):
         error="Connection timeout",
     )
     
-    call_args = mock_logger.info.call_args
-    extra = call_args[1]['extra']
-    attrs = extra['extra_attrs']
+    attrs = rec_logger[-1].extra_attrs
     
     assert attrs['status'] == 'error'
     assert attrs['error'] == 'Connection timeout'
 
 
+def test_usage_logging_skipped_when_info_disabled(fake_logger, rec_logger):
+    """No usage event is built or logged when INFO is disabled."""
+    fake_logger.enabled = False
+    
+    log_llm_usage(provider="openai", model="gpt-4o-mini", input_tokens=100, output_tokens=50)
+    log_embedding_usage(provider="openai", model="text-embedding-3-small", input_tokens=500)
+    log_ocr_usage(provider="azure-di", model="prebuilt-read", num_pages=5)
+    
+    assert rec_logger == []
+
+
+def test_usage_logging_respects_sampler(rec_logger, monkeypatch):
+    """Events dropped by the sampler are skipped before any cost lookup."""
+    monkeypatch.setattr(service_usage, "_sample", lambda: False)
+    monkeypatch.setattr(service_usage, "calculate_llm_cost", lambda *args: pytest.fail("cost computed"))
+    
+    log_llm_usage(provider="openai", model="gpt-4o-mini", input_tokens=100, output_tokens=50)
+    log_embedding_usage(provider="openai", model="text-embedding-3-small", input_tokens=500)
+    log_ocr_usage(provider="azure-di", model="prebuilt-read", num_pages=5)
+    
+    assert rec_logger == []
+
+
+def test_make_sampler_rates():
+    """Sampling rates are clamped and invalid values keep every event."""
+    make = service_usage._make_sampler
+    assert all(make(raw)() for raw in (None, "", "1", "2.5", "not-a-number"))
+    assert not any(make(raw)() for raw in ("0", "-1"))
+    
+    with patch.object(service_usage, "_rand", side_effect=[0.2, 0.8]):
+        half = make("0.5")
+        assert half() is True
+        assert half() is False
+
+
 def test_calculate_llm_cost_partial_match():
     """Test that partial model name matching works."""
     # Should match gpt-4o pricing for gpt-4o-2024-08-06
@@ -209,21 +299,115 @@ def test_calculate_llm_cost_partial_match():
     assert cost == pytest.approx(expected, rel=1e-6)
 
 
-def test_tokens_per_second_calculation():
+@pytest.fixture
+def restore_pricing():
+    """Restore the pricing tables (and drop cached lookups) after a test edits them."""
+    saved = [(table, dict(table)) for table in (LLM_PRICING, EMBEDDING_PRICING)]
+    yield
+    for table, content in saved:
+        table.clear()
+        table.update(content)
+    clear_pricing_cache()
+
+
+def test_llm_model_added_at_runtime_is_priced(restore_pricing):
+    """An unknown model is not cached as unpriced; adding it to the table takes effect."""
+    assert calculate_llm_cost("x", "acme-new", 1000, 1000) == 0.0
+    
+    LLM_PRICING["acme-new"] = {"input": 1.0, "output": 1.0}
+    assert calculate_llm_cost("x", "acme-new", 1000, 1000) == pytest.approx(2.0)
+
+
+def test_set_llm_pricing_updates_cached_price(restore_pricing):
+    """set_llm_pricing() replaces the price of a model that was already looked up."""
+    calculate_llm_cost("openai", "gpt-4o-2024-08-06", 1000, 1000)
+    
+    set_llm_pricing("gpt-4o", input_price=1.0, output_price=1.0)
+    assert calculate_llm_cost("openai", "gpt-4o-2024-08-06", 1000, 1000) == pytest.approx(2.0)
+
+
+def test_embedding_pricing_updates_at_runtime(restore_pricing):
+    """Embedding models added or repriced at runtime are picked up."""
+    assert calculate_embedding_cost("x", "acme-embed", 1000) == 0.0
+    
+    EMBEDDING_PRICING["acme-embed"] = 1.0
+    assert calculate_embedding_cost("x", "acme-embed", 1000) == pytest.approx(1.0)
+    
+    set_embedding_pricing("acme-embed", 3.0)
+    assert calculate_embedding_cost("x", "acme-embed", 1000) == pytest.approx(3.0)
+
+
+def test_llm_usage_record_attrs():
+    """LlmUsage records are compact and convert to the logged event."""
+    record = LlmUsage("openai", "gpt-5", input_tokens=10, output_tokens=5, total_tokens=15, has_tools=True)
+    assert not hasattr(record, "__dict__")
+    
+    attrs = service_usage._llm_attrs(record, {"tenant": "acme"})
+    assert attrs["tokens.total"] == 15
+    assert attrs["features.tools"] == "true"
+    assert attrs["custom.tenant"] == "acme"
+    assert attrs["status"] == "success"
+    assert "cost_usd" not in attrs
+
+
+def test_log_llm_usage_batch(rec_logger):
+    """A usage batch logs one event per recorded row with vectorized costs."""
+    batch = UsageBatch(4)
+    batch.record(2, "openai", "gpt-5-mini", 2000, 100)
+    batch.record(0, "openai", "gpt-5", 1000, 500, latency_ms=500)
+    
+    costs = batch.costs()
+    assert costs.tolist() == pytest.approx([
+        calculate_llm_cost("openai", "gpt-5", 1000, 500),
+        0.0,
+        calculate_llm_cost("openai", "gpt-5-mini", 2000, 100),
+    ])
+    
+    log_llm_usage_batch(batch, metadata={"job": "nightly"})
+    
+    assert [call.extra_attrs["service.model"] for call in rec_logger] == ["gpt-5", "gpt-5-mini"]
+    first = rec_logger[0].extra_attrs
+    assert first["tokens.total"] == 1500
+    assert first["tokens_per_second"] == pytest.approx(3000.0)
+    assert first["cost_usd"] == pytest.approx(costs[0])
+    assert first["custom.job"] == "nightly"
+    assert "latency_ms" not in rec_logger[1].extra_attrs
+    assert batch.n == 0
+
+
+def test_tokens_per_second_calculation(rec_logger):
     """Test that tokens_per_second is calculated correctly."""
-    with patch('core_lib.tracing.service_usage.logger') as mock_logger:
-        log_llm_usage(
-            provider="openai",
-            model="gpt-4",
-            input_tokens=100,
-            output_tokens=50,
-            total_tokens=150,
-            latency_ms=1500,  # 1.5 seconds
-        )
-        
-        call_args = mock_logger.info.call_args
-        extra = call_args[1]['extra']
-        attrs = extra['extra_attrs']
-        
-        # 150 tokens / 1.5 seconds = 100 tokens/second
-        assert attrs['tokens_per_second'] == pytest.approx(100.0, rel=1e-3)
+    log_llm_usage(
+        provider="openai",
+        model="gpt-4",
+        input_tokens=100,
+        output_tokens=50,
+        total_tokens=150,
+        latency_ms=1500,  # 1.5 seconds
+    )
+    
+    attrs = rec_logger[-1].extra_attrs
+    
+    # 150 tokens / 1.5 seconds = 100 tokens/second
+    assert attrs['tokens_per_second'] == pytest.approx(100.0, rel=1e-3)
+
+
+def test_partial_pricing_match_is_memoized():
+    """Partial model-name matches are resolved once per model name."""
+    from core_lib.tracing.service_pricing import LLM_PRICING, _match_llm_pricing, get_llm_pricing
+    
+    _match_llm_pricing.cache_clear()
+    assert get_llm_pricing("GPT-5-2025-08-07") is LLM_PRICING["gpt-5"]
+    assert get_llm_pricing("gpt-5-2025-08-07") is LLM_PRICING["gpt-5"]
+    assert _match_llm_pricing.cache_info().hits == 1
+
+
+def test_partial_pricing_match_prefers_longest_name():
+    """A dated model name resolves to the most specific known model."""
+    from core_lib.tracing.service_pricing import EMBEDDING_PRICING, LLM_PRICING, get_embedding_pricing, get_llm_pricing
+    
+    assert get_llm_pricing("gpt-5-mini-2025-08-07") is LLM_PRICING["gpt-5-mini"]
+    assert get_llm_pricing("gemini-2.5-flash-lite-001") is LLM_PRICING["gemini-2.5-flash-lite"]
+    assert get_llm_pricing("gpt-3.5-turbo") is LLM_PRICING["gpt-5"]  # family fallback
+    assert get_embedding_pricing("azure-text-embedding-3-large-v2") == EMBEDDING_PRICING["azure-text-embedding-3-large"]
+    assert get_llm_pricing("unknown-model") is None
@@ -11,10 +11,8 @@ These tests verify that:
 4. The hierarchy maintains consistency
 """
 
-import os
 import pytest
 from pathlib import Path
-from unittest.mock import patch
 
 from core_lib.config.base_settings import BaseSettings, SettingsError
 from core_lib.config.app_settings import AppSettings
@@ -36,198 +34,195 @@ class TestSettingsHierarchyInheritance:
         # StandardSettings inherits from ApiSettings
         assert issubclass(StandardSettings, ApiSettings)
     
-    def test_app_settings_is_base_settings(self):
+    def test_app_settings_is_base_settings(self, empty_env):
         """Test AppSettings implements BaseSettings interface."""
-        with patch.dict(os.environ, {}, clear=True):
-            settings = AppSettings.from_env(load_dotenv=False)
-            
-            # Should have BaseSettings interface
-            assert hasattr(settings, 'from_env')
-            assert hasattr(settings, 'validate')
-            assert hasattr(settings, 'is_valid')
-            assert hasattr(settings, 'as_dict')
-            assert hasattr(settings, 'merge')
+        settings = AppSettings.from_env(load_dotenv=False)
+        
+        # Should have BaseSettings interface
+        assert hasattr(settings, 'from_env')
+        assert hasattr(settings, 'validate')
+        assert hasattr(settings, 'is_valid')
+        assert hasattr(settings, 'as_dict')
+        assert hasattr(settings, 'merge')
     
-    def test_api_settings_has_base_interface(self):
+    def test_api_settings_has_base_interface(self, empty_env):
         """Test ApiSettings implements BaseSettings interface."""
-        with patch.dict(os.environ, {}, clear=True):
-            settings = ApiSettings.from_env(load_dotenv=False)
-            
-            # Should have BaseSettings interface
-            assert hasattr(settings, 'from_env')
-            assert hasattr(settings, 'validate')
-            assert hasattr(settings, 'is_valid')
-            assert hasattr(settings, 'as_dict')
+        settings = ApiSettings.from_env(load_dotenv=False)
+        
+        # Should have BaseSettings interface
+        assert hasattr(settings, 'from_env')
+        assert hasattr(settings, 'validate')
+        assert hasattr(settings, 'is_valid')
+        assert hasattr(settings, 'as_dict')
     
-    def test_standard_settings_has_all_interfaces(self):
+    def test_standard_settings_has_all_interfaces(self, empty_env):
         """Test StandardSettings has interfaces from all levels."""
-        with patch.dict(os.environ, {}, clear=True):
-            settings = StandardSettings.from_env(load_dotenv=False)
-            
-            # BaseSettings interface
-            assert hasattr(settings, 'from_env')
-            assert hasattr(settings, 'validate')
-            assert hasattr(settings, 'is_valid')
-            
-            # AppSettings attributes
-            assert hasattr(settings, 'app_name')
-            assert hasattr(settings, 'version')
-            assert hasattr(settings, 'environment')
-            
-            # ApiSettings attributes
-            assert hasattr(settings, 'cache')
-            assert hasattr(settings, 'tracing')
-            assert hasattr(settings, 'mcp_server')
-            assert hasattr(settings, 'fastapi_server')
-            
-            # StandardSettings-specific attributes
-            assert hasattr(settings, 'llm')
-            assert hasattr(settings, 'embeddings')
-            assert hasattr(settings, 'database')
+        settings = StandardSettings.from_env(load_dotenv=False)
+        
+        # BaseSettings interface
+        assert hasattr(settings, 'from_env')
+        assert hasattr(settings, 'validate')
+        assert hasattr(settings, 'is_valid')
+        
+        # AppSettings attributes
+        assert hasattr(settings, 'app_name')
+        assert hasattr(settings, 'version')
+        assert hasattr(settings, 'environment')
+        
+        # ApiSettings attributes
+        assert hasattr(settings, 'cache')
+        assert hasattr(settings, 'tracing')
+        assert hasattr(settings, 'mcp_server')
+        assert hasattr(settings, 'fastapi_server')
+        
+        # StandardSettings-specific attributes
+        assert hasattr(settings, 'llm')
+        assert hasattr(settings, 'embeddings')
+        assert hasattr(settings, 'database')
 
 
 class TestLevelByLevelFunctionality:
     """Test that each level adds its expected functionality."""
     
-    def test_base_settings_provides_core_utilities(self):
+    def test_base_settings_provides_core_utilities(self, empty_env):
         """Test BaseSettings provides core parsing and validation."""
         # AppSettings uses BaseSettings utilities
-        with patch.dict(os.environ, {"APP_NAME": "test-app"}, clear=True):
-            settings = AppSettings.from_env(load_dotenv=False)
-            
-            assert settings.app_name == "test-app"
-            assert settings.is_valid is True
-            assert len(settings.validation_errors) == 0
+        empty_env.update({"APP_NAME": "test-app"})
+        settings = AppSettings.from_env(load_dotenv=False)
+        
+        assert settings.app_name == "test-app"
+        assert settings.is_valid is True
+        assert len(settings.validation_errors) == 0
     
-    def test_app_settings_adds_app_configuration(self):
+    def test_app_settings_adds_app_configuration(self, empty_env):
         """Test AppSettings adds application-level configuration."""
-        with patch.dict(os.environ, {
+        empty_env.update({
             "APP_NAME": "my-app",
             "ENVIRONMENT": "production",
             "LOG_LEVEL": "INFO"
-        }, clear=True):
-            settings = AppSettings.from_env(load_dotenv=False)
-            
-            assert settings.app_name == "my-app"
-            assert settings.environment == "production"
-            assert settings.log_level == "INFO"
-            assert settings.is_production is True
+        })
+        settings = AppSettings.from_env(load_dotenv=False)
+        
+        assert settings.app_name == "my-app"
+        assert settings.environment == "production"
+        assert settings.log_level == "INFO"
+        assert settings.is_production is True
     
-    def test_api_settings_adds_api_services(self):
+    def test_api_settings_adds_api_services(self, empty_env):
         """Test ApiSettings adds API-related services."""
-        with patch.dict(os.environ, {
+        empty_env.update({
             "REDIS_HOST": "localhost",
             "MCP_SERVER_NAME": "test-server"
-        }, clear=True):
-            settings = ApiSettings.from_env(load_dotenv=False)
-            
-            # API-specific services
-            assert settings.enable_cache is True
-            assert settings.cache is not None
-            assert settings.enable_mcp_server is True
-            assert settings.mcp_server is not None
-            
-            # Can retrieve configs
-            redis_config = settings.get_redis_config()
-            assert redis_config.host == "localhost"
+        })
+        settings = ApiSettings.from_env(load_dotenv=False)
+        
+        # API-specific services
+        assert settings.enable_cache is True
+        assert settings.cache is not None
+        assert settings.enable_mcp_server is True
+        assert settings.mcp_server is not None
+        
+        # Can retrieve configs
+        redis_config = settings.get_redis_config()
+        assert redis_config.host == "localhost"
     
-    def test_standard_settings_adds_all_services(self):
+    def test_standard_settings_adds_all_services(self, empty_env):
         """Test StandardSettings adds LLM, embeddings, and database."""
-        with patch.dict(os.environ, {
+        empty_env.update({
             "APP_NAME": "full-app",
             "OPENAI_API_KEY": "sk-test",
             "EMBEDDING_PROVIDER": "openai",
             "REDIS_HOST": "localhost",
             "POSTGRES_HOST": "db.example.com"
-        }, clear=True):
-            settings = StandardSettings.from_env(load_dotenv=False)
-            
-            # App-level
-            assert settings.app_name == "full-app"
-            
-            # API-level services
-            assert settings.enable_cache is True
-            assert settings.cache is not None
-            
-            # StandardSettings services
-            assert settings.enable_llm is True
-            assert settings.llm is not None
-            assert settings.enable_embeddings is True
-            assert settings.embeddings is not None
-            assert settings.enable_database is True
-            assert settings.database is not None
+        })
+        settings = StandardSettings.from_env(load_dotenv=False)
+        
+        # App-level
+        assert settings.app_name == "full-app"
+        
+        # API-level services
+        assert settings.enable_cache is True
+        assert settings.cache is not None
+        
+        # StandardSettings services
+        assert settings.enable_llm is True
+        assert settings.llm is not None
+        assert settings.enable_embeddings is True
+        assert settings.embeddings is not None
+        assert settings.enable_database is True
+        assert settings.database is not None
 
 
 class TestCompositionAndExtension:
     """Test that settings can be composed and extended."""
     
-    def test_app_settings_can_be_standalone(self):
+    def test_app_settings_can_be_standalone(self, empty_env):
         """Test AppSettings can be used standalone."""
-        with patch.dict(os.environ, {
+        empty_env.update({
             "APP_NAME": "simple-app",
             "ENVIRONMENT": "dev"
-        }, clear=True):
-            settings = AppSettings.from_env(load_dotenv=False)
-            
-            assert settings.app_name == "simple-app"
-            assert settings.environment == "dev"
-            assert settings.is_valid is True
+        })
+        settings = AppSettings.from_env(load_dotenv=False)
+        
+        assert settings.app_name == "simple-app"
+        assert settings.environment == "dev"
+        assert settings.is_valid is True
     
-    def test_api_settings_can_be_standalone(self):
+    def test_api_settings_can_be_standalone(self, empty_env):
         """Test ApiSettings can be used without StandardSettings."""
-        with patch.dict(os.environ, {
+        empty_env.update({
             "REDIS_HOST": "localhost",
             "LANGFUSE_PUBLIC_KEY": "pk_test",
             "LANGFUSE_SECRET_KEY": "sk_test"
-        }, clear=True):
-            settings = ApiSettings.from_env(load_dotenv=False)
-            
-            assert settings.enable_cache is True
-            assert settings.enable_tracing is True
-            # No LLM, embeddings, or database (those are StandardSettings)
-            assert not hasattr(settings, 'llm')
+        })
+        settings = ApiSettings.from_env(load_dotenv=False)
+        
+        assert settings.enable_cache is True
+        assert settings.enable_tracing is True
+        # No LLM, embeddings, or database (those are StandardSettings)
+        assert not hasattr(settings, 'llm')
     
-    def test_standard_settings_combines_all_levels(self):
+    def test_standard_settings_combines_all_levels(self, empty_env):
         """Test StandardSettings properly combines all levels."""
-        with patch.dict(os.environ, {
+        empty_env.update({
             "APP_NAME": "complete-app",
             "OPENAI_API_KEY": "sk-test",
             "REDIS_HOST": "localhost",
             "LANGFUSE_PUBLIC_KEY": "pk_test",
             "LANGFUSE_SECRET_KEY": "sk_test"
-        }, clear=True):
-            settings = StandardSettings.from_env(load_dotenv=False)
-            
-            # All levels present
-            assert settings.app_name == "complete-app"  # App level
-            assert settings.enable_cache is True  # API level
-            assert settings.enable_tracing is True  # API level
-            assert settings.enable_llm is True  # Standard level
+        })
+        settings = StandardSettings.from_env(load_dotenv=False)
+        
+        # All levels present
+        assert settings.app_name == "complete-app"  # App level
+        assert settings.enable_cache is True  # API level
+        assert settings.enable_tracing is True  # API level
+        assert settings.enable_llm is True  # Standard level
     
-    def test_standard_settings_extend_from_env(self):
+    def test_standard_settings_extend_from_env(self, empty_env):
         """Test StandardSettings can be extended with custom fields."""
-        with patch.dict(os.environ, {
+        empty_env.update({
             "APP_NAME": "extended-app",
             "CUSTOM_FIELD": "custom_value"
-        }, clear=True):
-            custom_config = {
-                "custom_field": {
-                    "env_vars": ["CUSTOM_FIELD"],
-                    "default": "default"
-                }
+        })
+        custom_config = {
+            "custom_field": {
+                "env_vars": ["CUSTOM_FIELD"],
+                "default": "default"
             }
-            
-            extended = StandardSettings.extend_from_env(
-                custom_config=custom_config,
-                load_dotenv=False
-            )
-            
-            # Has all StandardSettings functionality
-            assert extended.app_name == "extended-app"
-            
-            # Plus custom field
-            assert hasattr(extended, 'custom_field')
-            assert extended.custom_field == "custom_value"
+        }
+        
+        extended = StandardSettings.extend_from_env(
+            custom_config=custom_config,
+            load_dotenv=False
+        )
+        
+        # Has all StandardSettings functionality
+        assert extended.app_name == "extended-app"
+        
+        # Plus custom field
+        assert hasattr(extended, 'custom_field')
+        assert extended.custom_field == "custom_value"
 
 
 class TestValidationAcrossLevels:
@@ -255,181 +250,191 @@ class TestValidationAcrossLevels:
                 enable_cache=True
             )
     
-    def test_standard_settings_validation_all_services(self):
+    def test_standard_settings_validation_all_services(self, empty_env):
         """Test StandardSettings validates all service configurations."""
-        with patch.dict(os.environ, {
+        empty_env.update({
             "OPENAI_API_KEY": "sk-test",
             "REDIS_HOST": "localhost"
-        }, clear=True):
-            settings = StandardSettings.from_env(load_dotenv=False)
-            
-            # Should validate successfully
-            assert settings.is_valid is True
-            settings.validate()  # Should not raise
+        })
+        settings = StandardSettings.from_env(load_dotenv=False)
+        
+        # Should validate successfully
+        assert settings.is_valid is True
+        settings.validate()  # Should not raise
 
 
 class TestConfigurationRetrieval:
     """Test configuration retrieval across the hierarchy."""
     
-    def test_api_settings_config_retrieval(self):
+    def test_api_settings_config_retrieval(self, empty_env):
         """Test ApiSettings config retrieval methods."""
-        with patch.dict(os.environ, {
+        empty_env.update({
             "REDIS_HOST": "redis.example.com",
             "MCP_SERVER_NAME": "test-server"
-        }, clear=True):
-            settings = ApiSettings.from_env(load_dotenv=False)
-            
-            # Should be able to get configs
-            redis_config = settings.get_redis_config()
-            assert redis_config.host == "redis.example.com"
-            
-            mcp_config = settings.get_mcp_server_config()
-            assert mcp_config.server_name == "test-server"
+        })
+        settings = ApiSettings.from_env(load_dotenv=False)
+        
+        # Should be able to get configs
+        redis_config = settings.get_redis_config()
+        assert redis_config.host == "redis.example.com"
+        
+        mcp_config = settings.get_mcp_server_config()
+        assert mcp_config.server_name == "test-server"
     
-    def test_standard_settings_config_retrieval(self):
+    def test_standard_settings_config_retrieval(self, empty_env):
         """Test StandardSettings retrieves configs from all levels."""
-        with patch.dict(os.environ, {
+        empty_env.update({
             "OPENAI_API_KEY": "sk-test",
             "REDIS_HOST": "localhost",
             "POSTGRES_HOST": "db.example.com"
-        }, clear=True):
-            settings = StandardSettings.from_env(load_dotenv=False)
-            
-            # ApiSettings configs
-            redis_config = settings.get_redis_config()
-            assert redis_config.host == "localhost"
-            
-            # StandardSettings configs
-            llm_config = settings.get_llm_config()
-            assert llm_config.provider == "openai"
-            
-            db_config = settings.get_database_config()
-            assert db_config.host == "db.example.com"
+        })
+        settings = StandardSettings.from_env(load_dotenv=False)
+        
+        # ApiSettings configs
+        redis_config = settings.get_redis_config()
+        assert redis_config.host == "localhost"
+        
+        # StandardSettings configs
+        llm_config = settings.get_llm_config()
+        assert llm_config.provider == "openai"
+        
+        db_config = settings.get_database_config()
+        assert db_config.host == "db.example.com"
     
-    def test_config_retrieval_not_configured_raises(self):
+    def test_config_retrieval_not_configured_raises(self, empty_env):
         """Test config retrieval raises when service not configured."""
-        with patch.dict(os.environ, {}, clear=True):
-            settings = StandardSettings.from_env(load_dotenv=False)
-            
-            with pytest.raises(SettingsError, match="Cache not configured"):
-                settings.get_redis_config()
-            
-            with pytest.raises(SettingsError, match="LLM not configured"):
-                settings.get_llm_config()
-            
-            with pytest.raises(SettingsError, match="Database not configured"):
-                settings.get_database_config()
+        settings = StandardSettings.from_env(load_dotenv=False)
+        
+        with pytest.raises(SettingsError, match="Cache not configured"):
+            settings.get_redis_config()
+        
+        with pytest.raises(SettingsError, match="LLM not configured"):
+            settings.get_llm_config()
+        
+        with pytest.raises(SettingsError, match="Database not configured"):
+            settings.get_database_config()
+    
+    def test_configured_flags(self, empty_env):
+        """Test the *_configured flags mirror which services are available."""
+        empty_env.update({
+            "OPENAI_API_KEY": "sk-test",
+            "REDIS_HOST": "localhost"
+        })
+        settings = StandardSettings.from_env(load_dotenv=False)
+        
+        assert settings.cache_configured is True
+        assert settings.llm_configured is True
+        assert settings.embeddings_configured is False
+        assert settings.database_configured is False
 
 
 class TestAsDictAcrossLevels:
     """Test as_dict serialization across all levels."""
     
-    def test_app_settings_as_dict(self):
+    def test_app_settings_as_dict(self, empty_env):
         """Test AppSettings as_dict."""
-        with patch.dict(os.environ, {
+        empty_env.update({
             "APP_NAME": "test-app",
             "ENVIRONMENT": "production"
-        }, clear=True):
-            settings = AppSettings.from_env(load_dotenv=False)
-            result = settings.as_dict()
-            
-            assert "app_name" in result
-            assert result["app_name"] == "test-app"
-            assert "environment" in result
-            assert result["environment"] == "production"
+        })
+        settings = AppSettings.from_env(load_dotenv=False)
+        result = settings.as_dict()
+        
+        assert "app_name" in result
+        assert result["app_name"] == "test-app"
+        assert "environment" in result
+        assert result["environment"] == "production"
     
-    def test_api_settings_as_dict(self):
+    def test_api_settings_as_dict(self, empty_env):
         """Test ApiSettings as_dict."""
-        with patch.dict(os.environ, {
+        empty_env.update({
             "REDIS_HOST": "localhost"
-        }, clear=True):
-            settings = ApiSettings.from_env(load_dotenv=False)
-            result = settings.as_dict()
-            
-            assert "cache" in result
-            assert result["cache"] is not None
-            assert "enable_cache" in result
-            assert result["enable_cache"] is True
+        })
+        settings = ApiSettings.from_env(load_dotenv=False)
+        result = settings.as_dict()
+        
+        assert "cache" in result
+        assert result["cache"] is not None
+        assert "enable_cache" in result
+        assert result["enable_cache"] is True
     
-    def test_standard_settings_as_dict_complete(self):
+    def test_standard_settings_as_dict_complete(self, empty_env):
         """Test StandardSettings as_dict includes all levels."""
-        with patch.dict(os.environ, {
+        empty_env.update({
             "APP_NAME": "complete-app",
             "OPENAI_API_KEY": "sk-test",
             "REDIS_HOST": "localhost"
-        }, clear=True):
-            settings = StandardSettings.from_env(load_dotenv=False)
-            result = settings.as_dict()
-            
-            # App level
-            assert "app_name" in result
-            assert result["app_name"] == "complete-app"
-            
-            # API level
-            assert "cache" in result
-            assert result["cache"] is not None
-            
-            # Standard level
-            assert "llm" in result
-            assert result["llm"] is not None
+        })
+        settings = StandardSettings.from_env(load_dotenv=False)
+        result = settings.as_dict()
+        
+        # App level
+        assert "app_name" in result
+        assert result["app_name"] == "complete-app"
+        
+        # API level
+        assert "cache" in result
+        assert result["cache"] is not None
+        
+        # Standard level
+        assert "llm" in result
+        assert result["llm"] is not None
 
 
 class TestNullSafeAccessorsHierarchy:
     """Test null-safe accessors work across the hierarchy."""
     
-    def test_api_settings_null_safe_accessors(self):
+    def test_api_settings_null_safe_accessors(self, empty_env):
         """Test ApiSettings null-safe accessors."""
-        with patch.dict(os.environ, {}, clear=True):
-            settings = ApiSettings.from_env(load_dotenv=False)
-            
-            # Should return NullConfig, not raise
-            assert settings.cache_safe.host is None
-            assert bool(settings.cache_safe) is False
-            
-            assert settings.tracing_safe.enabled is None
-            assert bool(settings.tracing_safe) is False
+        settings = ApiSettings.from_env(load_dotenv=False)
+        
+        # Should return NullConfig, not raise
+        assert settings.cache_safe.host is None
+        assert bool(settings.cache_safe) is False
+        
+        assert settings.tracing_safe.enabled is None
+        assert bool(settings.tracing_safe) is False
     
-    def test_standard_settings_null_safe_accessors(self):
+    def test_standard_settings_null_safe_accessors(self, empty_env):
         """Test StandardSettings null-safe accessors for all services."""
-        with patch.dict(os.environ, {}, clear=True):
-            settings = StandardSettings.from_env(load_dotenv=False)
-            
-            # API-level null-safe accessors
-            assert settings.cache_safe.host is None
-            assert bool(settings.cache_safe) is False
-            
-            # Standard-level null-safe accessors
-            assert settings.llm_safe.provider is None
-            assert bool(settings.llm_safe) is False
-            
-            assert settings.embeddings_safe.provider is None
-            assert bool(settings.embeddings_safe) is False
-            
-            assert settings.database_safe.host is None
-            assert bool(settings.database_safe) is False
+        settings = StandardSettings.from_env(load_dotenv=False)
+        
+        # API-level null-safe accessors
+        assert settings.cache_safe.host is None
+        assert bool(settings.cache_safe) is False
+        
+        # Standard-level null-safe accessors
+        assert settings.llm_safe.provider is None
+        assert bool(settings.llm_safe) is False
+        
+        assert settings.embeddings_safe.provider is None
+        assert bool(settings.embeddings_safe) is False
+        
+        assert settings.database_safe.host is None
+        assert bool(settings.database_safe) is False
 
 
 class TestRealWorldScenarios:
     """Test real-world usage scenarios of the settings hierarchy."""
     
-    def test_minimal_api_server_config(self):
+    def test_minimal_api_server_config(self, empty_env):
         """Test minimal config for an API server (just cache)."""
-        with patch.dict(os.environ, {
+        empty_env.update({
             "REDIS_HOST": "localhost"
-        }, clear=True):
-            settings = ApiSettings.from_env(load_dotenv=False)
-            
-            assert settings.enable_cache is True
-            assert settings.enable_tracing is False
-            assert settings.enable_mcp_server is False
-            assert settings.enable_fastapi_server is False
-            
-            # Can use null-safe accessors for optional services
-            assert bool(settings.tracing_safe) is False
+        })
+        settings = ApiSettings.from_env(load_dotenv=False)
+        
+        assert settings.enable_cache is True
+        assert settings.enable_tracing is False
+        assert settings.enable_mcp_server is False
+        assert settings.enable_fastapi_server is False
+        
+        # Can use null-safe accessors for optional services
+        assert bool(settings.tracing_safe) is False
     
-    def test_full_llm_application_config(self):
+    def test_full_llm_application_config(self, empty_env):
         """Test full config for an LLM application."""
-        with patch.dict(os.environ, {
+        empty_env.update({
             "APP_NAME": "llm-app",
             "ENVIRONMENT": "production",
             "OPENAI_API_KEY": "sk-test",
@@ -438,46 +443,46 @@ class TestRealWorldScenarios:
             "LANGFUSE_PUBLIC_KEY": "pk_test",
             "LANGFUSE_SECRET_KEY": "sk_test",
             "POSTGRES_HOST": "db.example.com"
-        }, clear=True):
-            settings = StandardSettings.from_env(load_dotenv=False)
-            
-            # All services enabled
-            assert settings.enable_llm is True
-            assert settings.enable_embeddings is True
-            assert settings.enable_cache is True
-            assert settings.enable_tracing is True
-            assert settings.enable_database is True
-            
-            # Can retrieve all configs
-            llm_config = settings.get_llm_config()
-            assert llm_config.provider == "openai"
-            
-            embeddings_config = settings.get_embeddings_config()
-            assert embeddings_config.provider == "openai"
-            
-            redis_config = settings.get_redis_config()
-            assert redis_config.host == "localhost"
-            
-            db_config = settings.get_database_config()
-            assert db_config.host == "db.example.com"
+        })
+        settings = StandardSettings.from_env(load_dotenv=False)
+        
+        # All services enabled
+        assert settings.enable_llm is True
+        assert settings.enable_embeddings is True
+        assert settings.enable_cache is True
+        assert settings.enable_tracing is True
+        assert settings.enable_database is True
+        
+        # Can retrieve all configs
+        llm_config = settings.get_llm_config()
+        assert llm_config.provider == "openai"
+        
+        embeddings_config = settings.get_embeddings_config()
+        assert embeddings_config.provider == "openai"
+        
+        redis_config = settings.get_redis_config()
+        assert redis_config.host == "localhost"
+        
+        db_config = settings.get_database_config()
+        assert db_config.host == "db.example.com"
     
-    def test_selective_service_enablement(self):
+    def test_selective_service_enablement(self, empty_env):
         """Test selectively enabling/disabling services."""
-        with patch.dict(os.environ, {
+        empty_env.update({
             "OPENAI_API_KEY": "sk-test",
             "REDIS_HOST": "localhost",
             "POSTGRES_HOST": "db.example.com"
-        }, clear=True):
-            # Enable only specific services
-            settings = StandardSettings.from_env(
-                load_dotenv=False,
-                enable_llm=True,
-                enable_cache=True,
-                enable_database=False,  # Explicit disable
-                enable_embeddings=False
-            )
-            
-            assert settings.enable_llm is True
-            assert settings.enable_cache is True
-            assert settings.enable_database is False
-            assert settings.enable_embeddings is False
+        })
+        # Enable only specific services
+        settings = StandardSettings.from_env(
+            load_dotenv=False,
+            enable_llm=True,
+            enable_cache=True,
+            enable_database=False,  # Explicit disable
+            enable_embeddings=False
+        )
+        
+        assert settings.enable_llm is True
+        assert settings.enable_cache is True
+        assert settings.enable_database is False
+        assert settings.enable_embeddings is False
@@ -119,3 +119,21 @@ def test_force_reinitialize_reconfigures_logging():
     
     # Both should be valid but may be different instances due to force
     assert settings2 is not None
+
+
+def test_force_reinitialize_with_unchanged_settings_keeps_handlers(monkeypatch):
+    """A forced re-initialization only reconfigures logging when its settings changed."""
+    import core_lib.tracing as tracing
+    
+    calls = []
+    monkeypatch.setattr(tracing, "setup_logging", lambda **kwargs: calls.append(kwargs))
+    monkeypatch.setenv("LOG_LEVEL", "INFO")
+    
+    initialize_settings(force=True, setup_logging=True)
+    initialize_settings(force=True, setup_logging=True)
+    assert len(calls) == 1
+    
+    monkeypatch.setenv("LOG_LEVEL", "WARNING")
+    initialize_settings(force=True, setup_logging=True)
+    assert len(calls) == 2
+    assert calls[-1]["level"] == "WARNING"
@@ -7,6 +7,7 @@ StandardSettings instances across an application lifecycle.
 
 import pytest
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
 
@@ -30,17 +31,30 @@ class CustomSettings(StandardSettings):
     another_field: int = 42
 
 
+@dataclass(frozen=True)
+class ClientAppSettings(StandardSettings):
+    """Application-specific settings, as a client project would define them."""
+    api_key: str = "default-key"
+    max_retries: int = 3
+
+
+@pytest.fixture(scope="module")
+def base_custom():
+    """One CustomSettings built from the environment; tests derive variants with merge()."""
+    return CustomSettings.from_env()
+
+
+@pytest.fixture(autouse=True)
+def _reset_singleton():
+    """Start and end every test with no settings singleton."""
+    reset_settings()
+    yield
+    reset_settings()
+
+
 class TestSettingsSingletonManager:
     """Test the SettingsSingletonManager class."""
     
-    def setup_method(self):
-        """Reset singleton before each test."""
-        reset_settings()
-    
-    def teardown_method(self):
-        """Clean up after each test."""
-        reset_settings()
-    
     def test_initialize_settings_default(self):
         """Test initializing with default StandardSettings."""
         settings = SettingsSingletonManager.initialize_settings()
@@ -115,9 +129,9 @@ class TestSettingsSingletonManager:
         assert first is not second
         assert second.app_name == "second"
     
-    def test_set_settings(self):
+    def test_set_settings(self, base_custom):
         """Test directly setting a settings instance."""
-        custom = CustomSettings.from_env(app_name="custom-app")
+        custom = base_custom.merge(app={"app_name": "custom-app"})
         SettingsSingletonManager.set_settings(custom)
         
         retrieved = SettingsSingletonManager.get_settings()
@@ -140,6 +154,15 @@ class TestSettingsSingletonManager:
         with pytest.raises(SettingsError):
             SettingsSingletonManager.get_settings()
     
+    def test_reset_settings_clears_from_env_cache(self):
+        """Reset drops memoized from_env results so settings are rebuilt."""
+        first = StandardSettings.from_env(load_dotenv=False)
+        assert StandardSettings.from_env(load_dotenv=False) is first
+        
+        SettingsSingletonManager.reset_settings()
+        
+        assert StandardSettings.from_env(load_dotenv=False) is not first
+    
     def test_has_settings(self):
         """Test has_settings check."""
         assert not SettingsSingletonManager.has_settings()
@@ -169,50 +192,27 @@ class TestSettingsSingletonManager:
     
     def test_thread_safety(self):
         """Test that singleton is thread-safe."""
-        results = []
-        errors = []
+        # The barrier releases all workers at once, so they race into initialize_settings
+        barrier = threading.Barrier(10)
         
         def init_settings(thread_id: int):
-            try:
-                settings = SettingsSingletonManager.initialize_settings(
-                    app_name=f"thread-{thread_id}"
-                )
-                results.append((thread_id, settings))
-            except Exception as e:
-                errors.append((thread_id, e))
-        
-        # Create multiple threads that try to initialize simultaneously
-        threads = [
-            threading.Thread(target=init_settings, args=(i,))
-            for i in range(10)
-        ]
+            barrier.wait()
+            return SettingsSingletonManager.initialize_settings(
+                app_name=f"thread-{thread_id}"
+            )
         
-        for thread in threads:
-            thread.start()
-        for thread in threads:
-            thread.join()
+        # map() re-raises any worker exception
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            results = list(executor.map(init_settings, range(10)))
         
         # All threads should get the same instance
-        assert len(results) == 10
-        first_settings = results[0][1]
-        for thread_id, settings in results:
-            assert settings is first_settings
-        
-        # No errors should occur
-        assert len(errors) == 0
+        first_settings = results[0]
+        assert all(settings is first_settings for settings in results)
 
 
 class TestFactoryFunctions:
     """Test the factory functions for convenience."""
     
-    def setup_method(self):
-        """Reset singleton before each test."""
-        reset_settings()
-    
-    def teardown_method(self):
-        """Clean up after each test."""
-        reset_settings()
-    
     def test_initialize_settings_function(self):
         """Test initialize_settings factory function."""
         settings = initialize_settings(app_name="factory-test")
@@ -227,9 +227,9 @@ class TestFactoryFunctions:
         
         assert settings.app_name == "get-test"
     
-    def test_set_settings_function(self):
+    def test_set_settings_function(self, base_custom):
         """Test set_settings factory function."""
-        custom = CustomSettings.from_env(app_name="set-test")
+        custom = base_custom.merge(app={"app_name": "set-test"})
         set_settings(custom)
         
         settings = get_settings()
@@ -262,14 +262,6 @@ class TestFactoryFunctions:
 class TestRealWorldUsage:
     """Test real-world usage patterns."""
     
-    def setup_method(self):
-        """Reset singleton before each test."""
-        reset_settings()
-    
-    def teardown_method(self):
-        """Clean up after each test."""
-        reset_settings()
-    
     def test_lazy_initialization_pattern(self):
         """Test lazy initialization pattern."""
         def get_app_config():
@@ -319,21 +311,16 @@ class TestRealWorldUsage:
     
     def test_custom_settings_class_pattern(self):
         """Test using custom settings class."""
-        @dataclass(frozen=True)
-        class AppSettings(StandardSettings):
-            api_key: str = "default-key"
-            max_retries: int = 3
-        
         # Initialize with custom class
         settings = initialize_settings(
-            settings_class=AppSettings,
+            settings_class=ClientAppSettings,
             api_key="real-key",
             max_retries=5
         )
         
         # Access throughout the app
         config = get_settings()
-        assert isinstance(config, AppSettings)
+        assert isinstance(config, ClientAppSettings)
         assert config.api_key == "real-key"
         assert config.max_retries == 5
     